@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Offset-indexed JSON Lines for the large analysis files
+Rewrites a nested analysis document ({subject: [records]} or
+{subject: {category: [records]}}) as one record per line plus a
+<stem>.offsets.json sidecar mapping each external_id to the byte offset
+and length of its line(s), plus the byte range of every group. The reader
+memory-maps the lines and decodes only the records asked for, so looking
+up one question's analysis is a dict lookup and one json.loads.
+
+    python3 analysis_index.py convert unrendered_expressions_analysis.json
+    python3 analysis_index.py get unrendered_expressions_analysis.jsonl Areas_Integration_7
+"""
+
+import argparse
+import json
+import mmap
+import sys
+from pathlib import Path
+
+from question_writers import sidecar_path
+
+FORMAT_VERSION = 1
+DEFAULT_KEY = 'external_id'
+
+def record_key(record, key=DEFAULT_KEY):
+    """``key`` of a record, looked up at the top level or one level down
+    (the unrendered-expression records nest it under 'question')"""
+    if key in record:
+        return record[key]
+    for value in record.values():
+        if isinstance(value, dict) and key in value:
+            return value[key]
+    return None
+
+def iter_groups(document, path=()):
+    """(group path, records) of every list in a nested analysis document"""
+    if isinstance(document, list):
+        yield path, document
+        return
+    for name, value in document.items():
+        if isinstance(value, (list, dict)):
+            yield from iter_groups(value, path + (name,))
+
+def offsets_path_for(jsonl_path):
+    return sidecar_path(jsonl_path, 'offsets')
+
+def write_jsonl(groups, jsonl_path, key=DEFAULT_KEY):
+    """Write (group path, records) pairs as JSON Lines plus the offset index
+
+    Returns (offsets path, record count).
+    """
+    jsonl_path = Path(jsonl_path)
+    group_ranges = []
+    entries = {}
+    offset = 0
+    count = 0
+    with open(jsonl_path, 'wb') as out:
+        for group, records in groups:
+            group_number = len(group_ranges)
+            start = offset
+            for record in records:
+                line = (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+                out.write(line)
+                record_id = record_key(record, key)
+                if record_id is not None:
+                    entries.setdefault(str(record_id), []).append([offset, len(line) - 1, group_number])
+                offset += len(line)
+                count += 1
+            group_ranges.append([list(group), start, offset])
+
+    offsets = {
+        'version': FORMAT_VERSION,
+        'key': key,
+        'bytes': offset,
+        'count': count,
+        'groups': group_ranges,
+        'entries': entries
+    }
+    offsets_path = offsets_path_for(jsonl_path)
+    with open(offsets_path, 'w', encoding='utf-8') as f:
+        json.dump(offsets, f, ensure_ascii=False, separators=(',', ':'))
+
+    return offsets_path, count
+
+def convert_to_jsonl(json_path, jsonl_path=None, key=DEFAULT_KEY):
+    """Write the records of a nested analysis document as JSON Lines plus the offset index
+
+    Returns (jsonl path, offsets path, record count).
+    """
+    json_path = Path(json_path)
+    jsonl_path = Path(jsonl_path) if jsonl_path else json_path.with_suffix('.jsonl')
+    with open(json_path, 'r', encoding='utf-8') as f:
+        document = json.load(f)
+
+    offsets_path, count = write_jsonl(iter_groups(document), jsonl_path, key)
+    return jsonl_path, offsets_path, count
+
+class AnalysisIndex:
+    """Memory-mapped, key-indexed reader of a converted analysis file"""
+
+    def __init__(self, jsonl_path):
+        self.path = Path(jsonl_path)
+        with open(offsets_path_for(self.path), 'r', encoding='utf-8') as f:
+            offsets = json.load(f)
+        if offsets.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported offset index version: {offsets.get('version')}")
+        if self.path.stat().st_size != offsets['bytes']:
+            raise ValueError(f"{self.path} changed since it was indexed; convert it again")
+
+        self.key = offsets['key']
+        self.count = offsets['count']
+        self.groups = [(tuple(group), start, end) for group, start, end in offsets['groups']]
+        self.entries = offsets['entries']
+
+        self.f = open(self.path, 'rb')
+        # mmap can't map an empty file
+        self.data = mmap.mmap(self.f.fileno(), 0, access=mmap.ACCESS_READ) if offsets['bytes'] else b''
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.f.close()
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, record_id):
+        return record_id in self.entries
+
+    def keys(self):
+        return self.entries.keys()
+
+    def _decode(self, offset, length):
+        return json.loads(self.data[offset:offset + length])
+
+    def get(self, record_id, default=None):
+        """The first record with this key"""
+        found = self.entries.get(record_id)
+        if not found:
+            return default
+        offset, length, _ = found[0]
+        return self._decode(offset, length)
+
+    def get_all(self, record_id):
+        """[(group path, record)] of every record with this key"""
+        return [(self.groups[group][0], self._decode(offset, length))
+                for offset, length, group in self.entries.get(record_id, [])]
+
+    def _iter_lines(self, start, end):
+        while start < end:
+            stop = self.data.find(b'\n', start, end)
+            yield json.loads(self.data[start:stop])
+            start = stop + 1
+
+    def iter_records(self):
+        """Every record in file order, decoded one line at a time"""
+        return self._iter_lines(0, len(self.data))
+
+    def iter_group(self, *path):
+        """Records of one group, e.g. ``iter_group('Physics', 'missingFigure')``"""
+        for group, start, end in self.groups:
+            if group == path:
+                yield from self._iter_lines(start, end)
+
+    def to_document(self):
+        """Rebuild the nested document the file was converted from"""
+        document = {}
+        for group, start, end in self.groups:
+            records = list(self._iter_lines(start, end))
+            if not group:
+                return records
+            parent = document
+            for name in group[:-1]:
+                parent = parent.setdefault(name, {})
+            parent[group[-1]] = records
+        return document
+
+def main():
+    parser = argparse.ArgumentParser(description='Offset-indexed JSON Lines for analysis files')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    convert = commands.add_parser('convert', help='rewrite an analysis JSON file as JSONL plus offset index')
+    convert.add_argument('json_path')
+    convert.add_argument('--output', help='JSONL path (default: next to the input)')
+    convert.add_argument('--key', default=DEFAULT_KEY, help='record field to index by')
+
+    get = commands.add_parser('get', help='print the records of one key')
+    get.add_argument('jsonl_path')
+    get.add_argument('record_id')
+    args = parser.parse_args()
+
+    if args.command == 'convert':
+        jsonl_path, offsets_path, count = convert_to_jsonl(args.json_path, args.output, args.key)
+        with AnalysisIndex(jsonl_path) as index:
+            keys = len(index.entries)
+        print(f"✅ {count} records → {jsonl_path} ({jsonl_path.stat().st_size / 1024:.2f} KB)")
+        print(f"📇 {keys} keys by {args.key} → {offsets_path} ({offsets_path.stat().st_size / 1024:.2f} KB)")
+        return
+
+    with AnalysisIndex(args.jsonl_path) as index:
+        found = index.get_all(args.record_id)
+        if not found:
+            print(f"❌ {args.record_id} not found")
+            sys.exit(1)
+        for group, record in found:
+            print(f"📄 {'/'.join(group)}")
+            print(json.dumps(record, ensure_ascii=False, indent=2))
+
+if __name__ == '__main__':
+    main()
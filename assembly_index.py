@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Precomputed test-assembly tables
+Built with the extracted data so assembling "N questions from these topics
+with this difficulty mix" never scans the corpus:
+
+- buckets   question numbers per (topic, difficulty)
+- facets    counts by subject, topic, difficulty and topic × difficulty,
+            as [{name, count}] lists like the metadata endpoint returns
+- alias     per difficulty, a Walker/Vose alias table over the topics
+            weighted by their bucket weight, so a topic is drawn in O(1);
+            buckets whose questions carry unequal 'weight' values get
+            their own table, the rest are drawn uniformly
+
+    python3 assembly_index.py complete_math_questions.assembly.json --mix HARD=4 MEDIUM=6
+"""
+
+import argparse
+import json
+import random
+from collections import Counter
+from pathlib import Path
+
+FORMAT_VERSION = 1
+
+def build_alias_table(weights):
+    """Vose's alias method: (prob, alias) lists for O(1) weighted draws"""
+    n = len(weights)
+    total = float(sum(weights))
+    if n == 0 or total <= 0:
+        return [], []
+
+    scaled = [w * n / total for w in weights]
+    prob = [0.0] * n
+    alias = [0] * n
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+    while small and large:
+        s = small.pop()
+        l = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] = scaled[l] + scaled[s] - 1.0
+        (small if scaled[l] < 1.0 else large).append(l)
+
+    # Leftovers are 1.0 up to rounding
+    for i in large + small:
+        prob[i] = 1.0
+        alias[i] = i
+
+    return prob, alias
+
+def alias_draw(prob, alias, rng):
+    """Index drawn from an alias table"""
+    i = rng.randrange(len(prob))
+    return i if rng.random() < prob[i] else alias[i]
+
+def facet_list(counter):
+    return [{'name': name, 'count': count} for name, count in counter.most_common()]
+
+class AssemblyIndexBuilder:
+    """Accumulate question records, then write the test-assembly tables"""
+
+    def __init__(self, group_by='topic'):
+        self.group_by = group_by
+        self.ids = []
+        self.weights = []
+        self.buckets = {}
+        self.subjects = Counter()
+
+    def add(self, record):
+        doc = len(self.ids)
+        self.ids.append(record.get('id'))
+        self.weights.append(record.get('weight', 1))
+
+        topic = record.get(self.group_by) or 'Unknown'
+        difficulty = record.get('difficulty') or 'MEDIUM'
+        self.buckets.setdefault(topic, {}).setdefault(difficulty, []).append(doc)
+
+        if record.get('subject'):
+            self.subjects[record['subject']] += 1
+
+    def add_all(self, records):
+        for record in records:
+            self.add(record)
+        return self
+
+    def to_dict(self):
+        topics = Counter()
+        difficulties = Counter()
+        topic_difficulty = {}
+        weighted = {}
+        per_difficulty = {}
+
+        for topic, by_difficulty in self.buckets.items():
+            topic_difficulty[topic] = {}
+            for difficulty, docs in by_difficulty.items():
+                topics[topic] += len(docs)
+                difficulties[difficulty] += len(docs)
+                topic_difficulty[topic][difficulty] = len(docs)
+
+                weights = [self.weights[doc] for doc in docs]
+                per_difficulty.setdefault(difficulty, []).append((topic, sum(weights)))
+                if len(set(weights)) > 1:
+                    prob, alias = build_alias_table(weights)
+                    weighted.setdefault(topic, {})[difficulty] = {'prob': prob, 'alias': alias}
+
+        alias_tables = {}
+        for difficulty, entries in per_difficulty.items():
+            prob, alias = build_alias_table([weight for _, weight in entries])
+            alias_tables[difficulty] = {
+                'topics': [topic for topic, _ in entries],
+                'weights': [weight for _, weight in entries],
+                'prob': prob,
+                'alias': alias
+            }
+
+        return {
+            'version': FORMAT_VERSION,
+            'group_by': self.group_by,
+            'total': len(self.ids),
+            'ids': self.ids,
+            'facets': {
+                'subjects': facet_list(self.subjects),
+                'topics': facet_list(topics),
+                'difficulties': facet_list(difficulties),
+                'topic_difficulty': topic_difficulty
+            },
+            'buckets': self.buckets,
+            'weighted_buckets': weighted,
+            'alias': alias_tables
+        }
+
+    def write(self, path):
+        """Write the tables as compact JSON and return the size in bytes"""
+        data = json.dumps(self.to_dict(), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        Path(path).write_bytes(data)
+        return len(data)
+
+def write_assembly_index(records, path, group_by='topic'):
+    """Build and write the test-assembly tables, printing a one-line summary"""
+    builder = AssemblyIndexBuilder(group_by).add_all(records)
+    size = builder.write(path)
+    bucket_count = sum(len(by_difficulty) for by_difficulty in builder.buckets.values())
+    print(f"🎲 Test assembly tables: {bucket_count} (topic, difficulty) buckets, "
+          f"{size / 1024:.2f} KB → {path}")
+    return builder
+
+class TestAssembler:
+    """Draw tests from prebuilt assembly tables"""
+
+    def __init__(self, data):
+        if data.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported assembly index version: {data.get('version')}")
+        self.ids = data['ids']
+        self.facets = data['facets']
+        self.buckets = data['buckets']
+        self.weighted = data['weighted_buckets']
+        self.alias = data['alias']
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def bucket(self, topic, difficulty):
+        """Question ids of one (topic, difficulty) bucket"""
+        return [self.ids[doc] for doc in self.buckets.get(topic, {}).get(difficulty, [])]
+
+    def _topic_table(self, difficulty, topics):
+        """(topics, prob, alias) for one difficulty, restricted to ``topics`` if given"""
+        table = self.alias.get(difficulty)
+        if not table:
+            return [], [], []
+        if topics is None:
+            return table['topics'], table['prob'], table['alias']
+
+        # A subset needs its own table, built from the stored bucket
+        # weights: O(topics), not O(questions)
+        chosen = [(topic, weight) for topic, weight in zip(table['topics'], table['weights']) if topic in topics]
+        prob, alias = build_alias_table([weight for _, weight in chosen])
+        return [topic for topic, _ in chosen], prob, alias
+
+    def _draw_from_bucket(self, topic, difficulty, rng):
+        docs = self.buckets[topic][difficulty]
+        weighted = self.weighted.get(topic, {}).get(difficulty)
+        if weighted:
+            return docs[alias_draw(weighted['prob'], weighted['alias'], rng)]
+        return docs[rng.randrange(len(docs))]
+
+    def sample(self, mix, topics=None, rng=None):
+        """Draw question ids: ``mix`` maps difficulty -> how many
+
+        Topics are drawn in proportion to their bucket weight, then a
+        question within the bucket; repeats are redrawn. When a difficulty
+        has fewer distinct questions than asked, all of them are returned.
+        """
+        rng = rng or random.Random()
+        topics = set(topics) if topics is not None else None
+        chosen = []
+
+        for difficulty, count in mix.items():
+            table_topics, prob, alias = self._topic_table(difficulty, topics)
+            pool = [self.buckets[topic][difficulty] for topic in table_topics]
+
+            if sum(len(docs) for docs in pool) <= count:
+                picked = [doc for docs in pool for doc in docs]
+            else:
+                picked = []
+                seen = set()
+                attempts = 0
+                while prob and len(picked) < count and attempts < 20 * count + 100:
+                    attempts += 1
+                    topic = table_topics[alias_draw(prob, alias, rng)]
+                    doc = self._draw_from_bucket(topic, difficulty, rng)
+                    if doc not in seen:
+                        seen.add(doc)
+                        picked.append(doc)
+
+                # Weights too skewed to fill by redrawing: top up uniformly
+                if len(picked) < count:
+                    rest = [doc for docs in pool for doc in docs if doc not in seen]
+                    picked.extend(rng.sample(rest, count - len(picked)))
+
+            chosen.extend(self.ids[doc] for doc in picked)
+
+        return chosen
+
+def main():
+    parser = argparse.ArgumentParser(description='Draw a test from prebuilt assembly tables')
+    parser.add_argument('tables', help='*.assembly.json written by an extractor')
+    parser.add_argument('--mix', nargs='+', metavar='DIFFICULTY=N', required=True,
+                        help='questions per difficulty, e.g. HARD=4 MEDIUM=6')
+    parser.add_argument('--topics', nargs='+', help='restrict to these topics')
+    parser.add_argument('--seed', type=int, help='random seed for a reproducible draw')
+    args = parser.parse_args()
+
+    mix = {}
+    for item in args.mix:
+        difficulty, _, count = item.partition('=')
+        if not count.isdigit():
+            parser.error(f"expected DIFFICULTY=N: {item}")
+        mix[difficulty] = int(count)
+
+    assembler = TestAssembler.load(args.tables)
+    ids = assembler.sample(mix, args.topics, random.Random(args.seed))
+
+    print(f"🎲 Drew {len(ids)} questions")
+    for question_id in ids:
+        print(f"  • {question_id}")
+
+if __name__ == '__main__':
+    main()
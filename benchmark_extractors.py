@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Benchmark the HTML question extractors on synthetic corpora
+Generates source HTML in each format the extractors read, runs every
+extractor in a fresh process, and records wall time, throughput and peak
+RSS to a JSON results file that can be compared across commits.
+
+Formats:
+- hr dumps           <hr>-delimited physics/maths pages (extract_physics_questions.py,
+                     extract_complete_math_questions.py)
+- topic pages        div.problem topic files (extract_questions.py)
+- file-section dumps combined scraped dumps (fix_extract_missing_questions.py)
+"""
+
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+PROBLEMS_PER_TOPIC = 50
+QUESTIONS_PER_SECTION = 25
+QUESTIONS_PER_CHAPTER = 25
+
+CHAPTERS = ['Mechanics', 'Thermodynamics', 'Electrostatics', 'Optics', 'Modern Physics',
+            'Limits', 'Matrices', 'Vectors', 'Probability', 'Definite Integration']
+WORDS = ('body mass velocity force energy angle circle matrix vector limit function '
+         'integral probability surface charge field particle plane line point curve').split()
+
+def sentence(rng, n_words):
+    """Deterministic pseudo-question text"""
+    return ' '.join(rng.choice(WORDS) for _ in range(n_words))
+
+def generate_hr_dump(path, n, subject='Physics', seed=1):
+    """Write an <hr>-delimited dump of ``n`` questions in the physics/maths export format"""
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f'<!DOCTYPE html>\n<html><head><title>IIT JEE {subject}</title></head><body>\n<h1>{subject}</h1>\n')
+        for i in range(1, n + 1):
+            f.write('<hr>\n')
+            if i % QUESTIONS_PER_CHAPTER == 1:
+                chapter = f'{CHAPTERS[(i // QUESTIONS_PER_CHAPTER) % len(CHAPTERS)]} {i // QUESTIONS_PER_CHAPTER + 1}'
+                f.write(f'<h2 id="chapter-{chapter.lower().replace(" ", "-")}">Chapter: {chapter}</h2>\n')
+            f.write(f'<h2>Topic: {sentence(rng, 2).title()}</h2>\n<h2>Subtopic: {sentence(rng, 2).title()}</h2>\n')
+            f.write(f'<h2>TAGS: <span class="tag">{rng.choice(WORDS)}</span><span class="tag">{rng.choice(WORDS)}</span></h2>\n')
+            f.write('<h2>TYPE: Multiple Choice Single Answer</h2>\n')
+            level = rng.choice(['Easy', 'Medium', 'Hard'])
+            f.write(f'<h2>Difficulty: <span class="difficulty-{level.lower()}">{level}</span></h2>\n')
+            f.write(f'<h3>Question {i}</h3>\n')
+            f.write(f'<div class="question"><p>{sentence(rng, 30)} with v = {i} m/s &rarr; find <b>x</b>.</p>'
+                    f'<p>Given <i>a</i> &lt; <i>b</i> and x<sup>2</sup> = {rng.randint(2, 99)}.</p></div>\n')
+            if subject == 'Physics':
+                f.write('<div class="options"><ol type="A">'
+                        + ''.join(f'<li>{rng.randint(1, 99)} {rng.choice(WORDS)}</li>' for _ in range(4))
+                        + '</ol></div>\n')
+                f.write(f'<div class="answer"><strong>Answer: {"ABCD"[i % 4]}</strong></div>\n')
+                f.write(f'<div class="solution"><strong>Strategy:</strong> {sentence(rng, 15)}\n'
+                        f'<strong>Expert Insight:</strong> {sentence(rng, 15)}\n'
+                        f'<strong>Key Facts Used:</strong> KE = mv<sup>2</sup>/2\n'
+                        + '<ol>' + ''.join(f'<li>{sentence(rng, 12)}</li>' for _ in range(4)) + '</ol></div>\n')
+            else:
+                f.write('<div class="options">'
+                        + ''.join(f'<div class="option">({letter}) {rng.randint(1, 99)}</div>' for letter in 'abcd')
+                        + '</div>\n')
+                f.write(f'<div class="answer">Answer: ({"abcd"[i % 4]})</div>\n')
+                f.write('<div class="solution">' + ''.join(f'<p>{sentence(rng, 15)}</p>' for _ in range(4)) + '</div>\n')
+        f.write('<hr>\n</body></html>\n')
+
+def generate_topic_pages(folder, n, seed=2):
+    """Write ``n`` div.problem questions spread over topic files of PROBLEMS_PER_TOPIC each"""
+    rng = random.Random(seed)
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    for topic in range((n + PROBLEMS_PER_TOPIC - 1) // PROBLEMS_PER_TOPIC):
+        count = min(PROBLEMS_PER_TOPIC, n - topic * PROBLEMS_PER_TOPIC)
+        name = f'JEE_Advanced_{CHAPTERS[topic % len(CHAPTERS)].replace(" ", "_")}_Problems_({topic + 1}).html'
+        with open(folder / name, 'w', encoding='utf-8') as f:
+            f.write('<html><body>')
+            for i in range(1, count + 1):
+                f.write(f'<div class="problem"><span class="problem-number">Problem {i}</span>'
+                        f'<span class="difficulty">ADVANCED</span><div class="problem-text">\n'
+                        f'            {sentence(rng, 30)} <i>f</i>(<i>x</i>) = <i>x</i><sup>{rng.randint(2, 9)}</sup>\n'
+                        f'        </div><div class="options">'
+                        + ''.join(f'<div class="option">({letter}) {rng.randint(1, 99)}</div>' for letter in 'abcd')
+                        + '</div></div>')
+            f.write('</body></html>\n')
+
+def generate_file_sections(path, n, seed=3, existing_every=4):
+    """Write a combined dump of ``n`` questions in file-section blocks
+
+    Every ``existing_every``-th question is also written to a sidecar
+    ``<path>.existing.json`` so the dedup check has real hits.
+    """
+    rng = random.Random(seed)
+    existing = []
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<html><body>')
+        for s in range((n + QUESTIONS_PER_SECTION - 1) // QUESTIONS_PER_SECTION):
+            chapter = CHAPTERS[s % len(CHAPTERS)].replace(' ', '_')
+            f.write(f'<div class="file-section"><div class="file-header">{s + 1}. JEE_Advanced_{chapter}_Problems</div>')
+            for i in range(1, min(QUESTIONS_PER_SECTION, n - s * QUESTIONS_PER_SECTION) + 1):
+                text = f'{sentence(rng, 25)} number {s}-{i}'
+                if i % existing_every == 0:
+                    existing.append({'id': f'existing_{s}_{i}', 'question': text})
+                style = s % 3
+                if style == 0:
+                    f.write(f'<p><strong>{i}.</strong> {text}</p><p>(a) 1 (b) 2 (c) 3 (d) 4</p>')
+                elif style == 1:
+                    f.write(f'<div class="q"><strong>Question {i}</strong> {text}</div>')
+                else:
+                    f.write(f'<p><strong>Q. {i}</strong> {text} <em>options follow</em></p>')
+            f.write('</div>')
+        f.write('</body></html>\n')
+
+    with open(f'{path}.existing.json', 'w', encoding='utf-8') as f:
+        json.dump(existing, f)
+
+def run_hr_dump(extractor, path, mode):
+    if mode == 'stream':
+        return sum(1 for _ in extractor.iter_questions_from_html(path))
+    return len(extractor.extract_questions_from_html(path))
+
+def run_topics(extractor, folder, mode):
+    workers = (os.cpu_count() or 1) if mode == 'parallel' else 1
+    database = extractor.build_questions_database(folder, workers=workers)
+    return sum(len(questions) for questions in database.values())
+
+def run_missing(extractor, path, mode):
+    from dedup_index import DedupIndex
+    existing = DedupIndex.from_json_files([f'{path}.existing.json'])
+    chapters = extractor.extract_questions_by_chapter(path, existing)
+    return sum(len(questions) for questions in chapters.values())
+
+# name: (input format, extractor module, runner, mode)
+CASES = {
+    'physics': ('hr-physics', 'extract_physics_questions', run_hr_dump, 'full'),
+    'physics-stream': ('hr-physics', 'extract_physics_questions', run_hr_dump, 'stream'),
+    'math': ('hr-math', 'extract_complete_math_questions', run_hr_dump, 'full'),
+    'math-stream': ('hr-math', 'extract_complete_math_questions', run_hr_dump, 'stream'),
+    'topics': ('topic-pages', 'extract_questions', run_topics, 'sequential'),
+    'topics-parallel': ('topic-pages', 'extract_questions', run_topics, 'parallel'),
+    'missing': ('file-sections', 'fix_extract_missing_questions', run_missing, 'full'),
+}
+
+def generate_input(fmt, n, work_dir):
+    """Create (once) the synthetic input for a format and size, returning its path"""
+    path = Path(work_dir) / f'{fmt}-{n}'
+    if fmt == 'topic-pages':
+        if not path.exists():
+            generate_topic_pages(path, n)
+    else:
+        path = path.with_suffix('.html')
+        if not path.exists():
+            if fmt == 'file-sections':
+                generate_file_sections(path, n)
+            else:
+                generate_hr_dump(path, n, 'Physics' if fmt == 'hr-physics' else 'Mathematics')
+    return path
+
+def input_bytes(path):
+    path = Path(path)
+    if path.is_dir():
+        return sum(p.stat().st_size for p in path.glob('*.html'))
+    return path.stat().st_size
+
+def peak_rss_mb():
+    """Peak RSS in MB of this process or its largest worker (ru_maxrss is bytes on macOS, KB elsewhere)"""
+    rss = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+              resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return rss / (1 << 20) if sys.platform == 'darwin' else rss / 1024
+
+def run_case(name, path):
+    """Run one case in this process and return its measurements"""
+    _, module, runner, mode = CASES[name]
+    # Imported before the clock starts so only extraction is timed
+    extractor = importlib.import_module(module)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        extracted = runner(extractor, str(path), mode)
+        seconds = time.perf_counter() - start
+    return {'extracted': extracted, 'seconds': seconds, 'peak_rss_mb': peak_rss_mb()}
+
+def measure(name, path, repeat):
+    """Run a case ``repeat`` times in fresh processes, keeping the fastest run"""
+    best = None
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, __file__, '--run-case', name, str(path)],
+                              capture_output=True, text=True, cwd=Path(__file__).resolve().parent)
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else 'failed')
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        if best is None or result['seconds'] < best['seconds']:
+            best = result
+    return best
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=Path(__file__).resolve().parent).stdout.strip() or None
+    except OSError:
+        return None
+
+def compare(old_path, results):
+    """Print wall time and RSS changes against an earlier results file"""
+    with open(old_path, 'r', encoding='utf-8') as f:
+        old = json.load(f)
+    previous = {(r['case'], r['size']): r for r in old['results']}
+
+    print(f"\n📊 Compared with {old_path} (commit {old.get('commit') or '?'})")
+    for r in results:
+        before = previous.get((r['case'], r['size']))
+        if not before:
+            continue
+        speedup = before['seconds'] / r['seconds'] if r['seconds'] else float('inf')
+        print(f"  {r['case']:<16} {r['size']:>7}  {before['seconds']:8.2f}s → {r['seconds']:8.2f}s "
+              f"({speedup:.2f}x)  RSS {before['peak_rss_mb']:.0f} → {r['peak_rss_mb']:.0f} MB")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the HTML question extractors on synthetic corpora')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000],
+                        help='questions per synthetic corpus (100 to 100000)')
+    parser.add_argument('--cases', nargs='+', choices=sorted(CASES), default=list(CASES),
+                        help='extractors to run')
+    parser.add_argument('--repeat', type=int, default=1, help='runs per case; the fastest is kept')
+    parser.add_argument('--work-dir', help='where to generate inputs (kept between runs); default: a temp dir')
+    parser.add_argument('--output', default='benchmark_results.json', help='results JSON file')
+    parser.add_argument('--compare', help='earlier results JSON to compare against')
+    parser.add_argument('--run-case', nargs=2, metavar=('CASE', 'INPUT'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        print(json.dumps(run_case(*args.run_case)))
+        return
+
+    with contextlib.ExitStack() as stack:
+        work_dir = args.work_dir or stack.enter_context(tempfile.TemporaryDirectory(prefix='extractor-bench-'))
+        Path(work_dir).mkdir(parents=True, exist_ok=True)
+
+        results = []
+        for size in args.sizes:
+            for name in args.cases:
+                fmt = CASES[name][0]
+                print(f"⏳ {name} × {size} ...", end=' ', flush=True)
+                path = generate_input(fmt, size, work_dir)
+                nbytes = input_bytes(path)
+
+                try:
+                    result = measure(name, path, args.repeat)
+                except RuntimeError as e:
+                    print(f"❌ {e}")
+                    continue
+
+                seconds = result['seconds']
+                results.append({
+                    'case': name,
+                    'format': fmt,
+                    'size': size,
+                    'input_bytes': nbytes,
+                    'extracted': result['extracted'],
+                    'seconds': round(seconds, 4),
+                    'questions_per_sec': round(size / seconds, 1) if seconds else None,
+                    'mb_per_sec': round(nbytes / (1 << 20) / seconds, 2) if seconds else None,
+                    'peak_rss_mb': round(result['peak_rss_mb'], 1)
+                })
+                print(f"{seconds:.2f}s, {size / seconds:,.0f} q/s, {result['peak_rss_mb']:.0f} MB peak RSS")
+
+    report = {
+        'commit': git_commit(),
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'results': results
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Saved results to: {args.output}")
+
+    if args.compare:
+        compare(args.compare, results)
+
+if __name__ == '__main__':
+    main()
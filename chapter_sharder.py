@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Byte-budget chapter sharding for the grouped missing-question pages
+Chapters are packed into as few HTML files as fit a byte budget, balancing
+the rendered size (inline SVGs and long solutions included) rather than
+the question count. Sizes are measured with the same renderers the grouped
+pages are written with.
+"""
+
+import heapq
+import re
+
+DEFAULT_MAX_BYTES = 1 << 20
+
+def chapter_anchor(chapter):
+    """Fragment id of a chapter section"""
+    return re.sub(r'[^\w\s-]', '', chapter).strip().replace(' ', '_').lower()
+
+def render_toc_entry(chapter, questions):
+    return f'            <li><a href="#{chapter_anchor(chapter)}">{chapter} ({len(questions)} questions)</a></li>\n'
+
+def render_question_block(number, question):
+    return f"""        <div class="question-block">
+            <div class="question-number">Question {number}</div>
+            <div class="question-content">
+{question['html']}
+            </div>
+        </div>
+
+"""
+
+def render_chapter_header(chapter, questions):
+    return f"""    <div class="chapter-section" id="{chapter_anchor(chapter)}">
+        <div class="chapter-header">
+            <h2>{chapter}</h2>
+            <div class="question-count">{len(questions)} Questions</div>
+        </div>
+
+"""
+
+CHAPTER_FOOTER = """    </div>
+
+"""
+
+def render_chapter_section(chapter, questions):
+    """Chapter section with its numbered question blocks"""
+    parts = [render_chapter_header(chapter, questions)]
+    parts.extend(render_question_block(i, q) for i, q in enumerate(questions, 1))
+    parts.append(CHAPTER_FOOTER)
+    return ''.join(parts)
+
+def utf8_len(text):
+    return len(text.encode('utf-8'))
+
+def chapter_html_bytes(chapter, questions):
+    """Bytes a chapter adds to a grouped page: its TOC entry and its section"""
+    return utf8_len(render_toc_entry(chapter, questions)) + utf8_len(render_chapter_section(chapter, questions))
+
+def split_chapter(chapter, questions, capacity):
+    """Split a chapter larger than ``capacity`` into consecutive "(Part k)" chapters
+
+    A single question larger than ``capacity`` still gets a part of its own.
+    """
+    if chapter_html_bytes(chapter, questions) <= capacity:
+        return [(chapter, questions)]
+
+    parts = []
+    current = []
+    size = 0
+    for question in questions:
+        name = f"{chapter} (Part {len(parts) + 1})"
+        # Header and TOC sized for the whole chapter's count, so the estimate never undershoots
+        base = (utf8_len(render_toc_entry(name, questions)) + utf8_len(render_chapter_header(name, questions))
+                + utf8_len(CHAPTER_FOOTER))
+        block = utf8_len(render_question_block(len(current) + 1, question))
+        if current and base + size + block > capacity:
+            parts.append((name, current))
+            current = []
+            size = 0
+            block = utf8_len(render_question_block(1, question))
+        current.append(question)
+        size += block
+    parts.append((f"{chapter} (Part {len(parts) + 1})", current))
+    return parts
+
+def shard_chapters(chapters, max_bytes=DEFAULT_MAX_BYTES, page_overhead=0, min_files=1):
+    """Pack chapters into files of at most ``max_bytes`` rendered HTML each
+
+    Largest chapters go first to the currently smallest file (a min-heap
+    keyed on file bytes). The file count starts at the lower bound
+    total / capacity and grows by one until every chapter fits, so the
+    result is the fewest files this greedy packing can manage. Oversized
+    chapters are split into parts first.
+
+    Returns a list of {'chapters': [(chapter, questions)], 'count', 'bytes'}.
+    """
+    capacity = max(max_bytes - page_overhead, 1)
+
+    items = []
+    for chapter, questions in chapters.items():
+        for name, part in split_chapter(chapter, questions, capacity):
+            items.append((chapter_html_bytes(name, part), name, part))
+    items.sort(key=lambda item: item[0], reverse=True)
+
+    if not items:
+        return []
+
+    total = sum(size for size, _, _ in items)
+    num_files = max(min_files, -(-total // capacity))
+
+    while True:
+        files = [{'chapters': [], 'count': 0, 'bytes': page_overhead} for _ in range(num_files)]
+        heap = [(0, i) for i in range(num_files)]
+        fits = True
+
+        for size, name, questions in items:
+            load, i = heapq.heappop(heap)
+            # The smallest file is the only candidate: if it cannot take the
+            # chapter no file can (an empty file always takes it)
+            if load and load + size > capacity:
+                fits = False
+                break
+            files[i]['chapters'].append((name, questions))
+            files[i]['count'] += len(questions)
+            files[i]['bytes'] += size
+            heapq.heappush(heap, (load + size, i))
+
+        if fits:
+            return [f for f in files if f['chapters']]
+        num_files += 1
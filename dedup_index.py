@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate question index
+Built once from the question JSON corpora and queried per candidate, so
+deduplicating a scraped dump no longer compares every candidate against
+every existing question.
+
+- exact: normalized text lookup
+- contains: an existing question occurs inside the candidate (Aho-Corasick)
+- contained: the candidate occurs inside an existing question (k-gram postings)
+- near: word-shingle Jaccard, candidates found via MinHash LSH
+"""
+
+import hashlib
+import json
+import re
+import struct
+from collections import defaultdict, deque
+from pathlib import Path
+
+DEFAULT_SOURCES = [
+    'mcq_questions_with_solutions.json',
+    'physics_questions_with_solutions.json',
+    'complete_math_questions.json'
+]
+
+def normalize_text(text):
+    """Normalize text for comparison by removing extra whitespace and special chars"""
+    # Remove HTML tags
+    text = re.sub(r'<[^>]+>', '', text)
+    # Remove multiple spaces/newlines
+    text = re.sub(r'\s+', ' ', text)
+    text = text.strip()
+    return text.lower()
+
+def word_shingles(text, size=3):
+    """Set of ``size``-word shingles of normalized text"""
+    words = text.split()
+    if len(words) <= size:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+class AhoCorasick:
+    """Multi-pattern substring matcher: which patterns occur in a text"""
+
+    def __init__(self):
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [[]]
+
+    def add(self, pattern, value):
+        node = 0
+        for ch in pattern:
+            nxt = self.goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[node][ch] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.out.append([])
+            node = nxt
+        self.out[node].append(value)
+
+    def build(self):
+        """Compute failure links breadth-first, merging outputs along them"""
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self.goto[node].items():
+                queue.append(nxt)
+                f = self.fail[node]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+
+    def search(self, text):
+        """Yield the value of every pattern occurring in text"""
+        node = 0
+        for ch in text:
+            while node and ch not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(ch, 0)
+            yield from self.out[node]
+
+class DedupIndex:
+    """Index of existing questions for duplicate and near-duplicate lookup
+
+    Only existing questions longer than ``min_length`` take part in the
+    containment checks, as in the original substring comparison. Near
+    duplicates need word-shingle Jaccard >= ``near_threshold`` to count.
+    """
+
+    def __init__(self, min_length=50, near_threshold=0.8, shingle_size=3,
+                 kgram_size=8, num_perm=64, bands=16):
+        self.min_length = min_length
+        self.near_threshold = near_threshold
+        self.shingle_size = shingle_size
+        self.kgram_size = kgram_size
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hash_format = f'<{num_perm}I'
+
+        self.ids = []
+        self.texts = []
+        self.shingles = []
+        self.exact = defaultdict(list)
+        self.kgrams = defaultdict(set)
+        self.buckets = defaultdict(list)
+        self.long_docs = []
+        self.automaton = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _signature(self, shingles):
+        """MinHash signature; one SHAKE-128 digest gives every hash of a shingle"""
+        if not shingles:
+            return [0] * self.num_perm
+        size = 4 * self.num_perm
+        hashes = [struct.unpack(self.hash_format, hashlib.shake_128(s.encode('utf-8')).digest(size))
+                  for s in shingles]
+        return list(map(min, zip(*hashes)))
+
+    def _band_keys(self, signature):
+        r = self.rows
+        return [(i, tuple(signature[i * r:(i + 1) * r])) for i in range(self.bands)]
+
+    def add(self, record_id, text):
+        """Add one existing question"""
+        normalized = normalize_text(text)
+        doc = len(self.ids)
+        shingles = word_shingles(normalized, self.shingle_size)
+
+        self.ids.append(record_id)
+        self.texts.append(normalized)
+        self.shingles.append(shingles)
+        self.exact[normalized].append(doc)
+
+        for key in self._band_keys(self._signature(shingles)):
+            self.buckets[key].append(doc)
+
+        if len(normalized) > self.min_length:
+            self.long_docs.append(doc)
+            k = self.kgram_size
+            for i in range(len(normalized) - k + 1):
+                self.kgrams[normalized[i:i + k]].add(doc)
+
+        self.automaton = None
+
+    def _get_automaton(self):
+        if self.automaton is None:
+            self.automaton = AhoCorasick()
+            for doc in self.long_docs:
+                self.automaton.add(self.texts[doc], doc)
+            self.automaton.build()
+        return self.automaton
+
+    def _contained_in(self, normalized):
+        """Long existing docs that contain ``normalized``"""
+        k = self.kgram_size
+        if len(normalized) < k:
+            return [doc for doc in self.long_docs if normalized in self.texts[doc]]
+
+        # Every k-gram of the candidate must occur in a containing doc, so the
+        # rarest one bounds the docs worth checking
+        rarest = None
+        for i in range(len(normalized) - k + 1):
+            posting = self.kgrams.get(normalized[i:i + k])
+            if not posting:
+                return []
+            if rarest is None or len(posting) < len(rarest):
+                rarest = posting
+        return [doc for doc in rarest if normalized in self.texts[doc]]
+
+    def matches(self, text):
+        """All existing questions matching ``text``, best first
+
+        Returns dicts with 'id', 'kind' (exact/contains/contained/near) and
+        'score': 1.0 for exact, the length ratio for containment, and the
+        shingle Jaccard for near duplicates.
+        """
+        normalized = normalize_text(text)
+        found = {}
+
+        # Checked strongest first; a weaker kind never replaces a stronger one
+        def record(doc, kind, score):
+            if doc not in found:
+                found[doc] = (kind, score)
+
+        for doc in self.exact.get(normalized, []):
+            record(doc, 'exact', 1.0)
+
+        for doc in set(self._get_automaton().search(normalized)):
+            record(doc, 'contains', len(self.texts[doc]) / max(len(normalized), 1))
+
+        for doc in self._contained_in(normalized):
+            record(doc, 'contained', len(normalized) / len(self.texts[doc]))
+
+        shingles = word_shingles(normalized, self.shingle_size)
+        candidates = set()
+        for key in self._band_keys(self._signature(shingles)):
+            candidates.update(self.buckets.get(key, ()))
+        for doc in candidates:
+            union = len(shingles | self.shingles[doc])
+            jaccard = len(shingles & self.shingles[doc]) / union if union else 1.0
+            if jaccard >= self.near_threshold:
+                record(doc, 'near', jaccard)
+
+        results = [{'id': self.ids[doc], 'kind': kind, 'score': score}
+                   for doc, (kind, score) in found.items()]
+        results.sort(key=lambda m: m['score'], reverse=True)
+        return results
+
+    def is_duplicate(self, text):
+        """True if ``text`` matches any existing question"""
+        return bool(self.matches(text))
+
+    def is_exact_duplicate(self, text):
+        """True if ``text`` normalizes to an existing question's text"""
+        return normalize_text(text) in self.exact
+
+    @classmethod
+    def from_store(cls, store, paths=DEFAULT_SOURCES, **kwargs):
+        """Build an index from a QuestionStore, loading ``paths`` into it first"""
+        store.load(paths)
+        index = cls(**kwargs)
+        for record_id, question in store.iter_questions([Path(path).name.split('.')[0] for path in paths]):
+            if question:
+                index.add(record_id, question)
+        return index
+
+    @classmethod
+    def from_json_files(cls, paths=DEFAULT_SOURCES, **kwargs):
+        """Build an index from question JSON lists, skipping missing files"""
+        index = cls(**kwargs)
+        for path in paths:
+            path = Path(path)
+            if not path.exists():
+                continue
+            with open(path, 'r', encoding='utf-8') as f:
+                questions = json.load(f)
+            for q in questions:
+                if q.get('question'):
+                    index.add(q.get('id', f'{path.stem}:{len(index)}'), q['question'])
+        return index
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Delta patches between successive questions.json builds
+Each build is compared with the previous one by (topic, question id) and
+record content hash. When anything changed, the version number is bumped
+and a patch with the added/changed records, the removed ids and the new
+order of the touched topics is written, so a client holding version N can
+fetch only the patches up to the latest version.
+
+versions/
+- versions.json           manifest: latest version, its digest, and one
+                          entry per patch (from, to, counts, file, size)
+- patch_v<N-1>_v<N>.json  one patch per version step
+- hashes.json             (topic, id, hash) of the latest build, the
+                          baseline for the next diff
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+MAX_PATCHES = 50
+
+def canonical_json(value):
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+
+def record_digest(record):
+    """SHA-256 of a record's canonical JSON"""
+    return hashlib.sha256(canonical_json(record).encode('utf-8')).hexdigest()
+
+def database_digest(database):
+    """SHA-256 of a whole build ({topic: [records]}) as canonical JSON"""
+    return hashlib.sha256(canonical_json(database).encode('utf-8')).hexdigest()
+
+def build_hashes(database):
+    """{topic: [[id, hash], ...]} in build order"""
+    return {topic: [[q['id'], record_digest(q)] for q in questions] for topic, questions in database.items()}
+
+def diff_builds(old_hashes, database):
+    """Patch body turning the build described by ``old_hashes`` into ``database``"""
+    new_hashes = build_hashes(database)
+    old_keys = {(topic, qid): digest for topic, entries in old_hashes.items() for qid, digest in entries}
+    new_keys = set()
+
+    upserts = []
+    added = changed = 0
+    for topic, questions in database.items():
+        for q, (qid, digest) in zip(questions, new_hashes[topic]):
+            new_keys.add((topic, qid))
+            previous = old_keys.get((topic, qid))
+            if previous == digest:
+                continue
+            upserts.append({'topic': topic, 'record': q})
+            if previous is None:
+                added += 1
+            else:
+                changed += 1
+
+    removed = [[topic, qid] for topic, qid in old_keys if (topic, qid) not in new_keys]
+
+    # Only topics whose id sequence changed need their order shipped
+    order = {}
+    for topic, entries in new_hashes.items():
+        ids = [qid for qid, _ in entries]
+        if ids != [qid for qid, _ in old_hashes.get(topic, [])]:
+            order[topic] = ids
+
+    patch = {
+        'topics': list(database),
+        'order': order,
+        'upserts': upserts,
+        'removed': removed
+    }
+    return patch, new_hashes, (added, changed, len(removed))
+
+def apply_patch(database, patch):
+    """Apply a patch to a build ({topic: [records]}) and return the next build"""
+    records = {(topic, q['id']): q for topic, questions in database.items() for q in questions}
+
+    for topic, qid in patch['removed']:
+        records.pop((topic, qid), None)
+    for upsert in patch['upserts']:
+        records[(upsert['topic'], upsert['record']['id'])] = upsert['record']
+
+    result = {}
+    for topic in patch['topics']:
+        ids = patch['order'].get(topic)
+        if ids is None:
+            ids = [q['id'] for q in database.get(topic, [])]
+        result[topic] = [records[(topic, qid)] for qid in ids]
+    return result
+
+def load_json(path, default):
+    path = Path(path)
+    if not path.exists():
+        return default
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def write_json(path, value, **kwargs):
+    """Write JSON atomically"""
+    path = Path(path)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(value, f, ensure_ascii=False, **kwargs)
+    os.replace(tmp_path, path)
+
+def write_delta(database, versions_dir, max_patches=MAX_PATCHES):
+    """Record this build as a new version if it differs from the last one
+
+    Returns the version manifest. The first build becomes version 1 with
+    no patch; an unchanged build keeps the current version.
+    """
+    versions_dir = Path(versions_dir)
+    versions_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = versions_dir / 'versions.json'
+    hashes_path = versions_dir / 'hashes.json'
+
+    manifest = load_json(manifest_path, {'latest': 0, 'sha256': None, 'count': 0, 'patches': []})
+    digest = database_digest(database)
+
+    if digest == manifest['sha256']:
+        print(f"🧩 Version {manifest['latest']} unchanged, no patch written")
+        return manifest
+
+    old_hashes = load_json(hashes_path, None)
+    version = manifest['latest'] + 1
+
+    if old_hashes is None or manifest['latest'] == 0:
+        print(f"🧩 Version {version}: first recorded build, clients start from the full file")
+        new_hashes = build_hashes(database)
+    else:
+        patch, new_hashes, (added, changed, removed) = diff_builds(old_hashes, database)
+        patch = {
+            'from': manifest['latest'],
+            'to': version,
+            'base_sha256': manifest['sha256'],
+            'sha256': digest,
+            **patch
+        }
+        patch_name = f"patch_v{manifest['latest']}_v{version}.json"
+        write_json(versions_dir / patch_name, patch, separators=(',', ':'))
+        patch_bytes = (versions_dir / patch_name).stat().st_size
+
+        manifest['patches'].append({
+            'from': manifest['latest'],
+            'to': version,
+            'file': patch_name,
+            'added': added,
+            'changed': changed,
+            'removed': removed,
+            'bytes': patch_bytes,
+            'created': datetime.now().isoformat(timespec='seconds')
+        })
+        print(f"🧩 Version {version}: +{added} added, ~{changed} changed, -{removed} removed "
+              f"({patch_bytes / 1024:.2f} KB patch) → {versions_dir / patch_name}")
+
+        # Keep the newest patches; older clients fall back to the full file
+        for old in manifest['patches'][:-max_patches]:
+            (versions_dir / old['file']).unlink(missing_ok=True)
+        manifest['patches'] = manifest['patches'][-max_patches:]
+
+    manifest['latest'] = version
+    manifest['sha256'] = digest
+    manifest['count'] = sum(len(questions) for questions in database.values())
+
+    write_json(hashes_path, new_hashes, separators=(',', ':'))
+    write_json(manifest_path, manifest, indent=2)
+    return manifest
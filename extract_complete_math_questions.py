@@ -4,206 +4,52 @@ Extract Complete Mathematics Questions from HTML
 Similar structure to Physics questions
 """
 
-import json
-import re
-from bs4 import BeautifulSoup
+import argparse
 from pathlib import Path
 
-def extract_tags(tags_h2):
-    """Extract tags from TAGS h2 element"""
-    if not tags_h2:
-        return []
-
-    tag_spans = tags_h2.find_all('span', class_='tag')
-    tags = [span.get_text(strip=True) for span in tag_spans]
-
-    if not tags:
-        text = tags_h2.get_text()
-        match = re.search(r'TAGS:\s*(.+)', text)
-        if match:
-            tags_text = match.group(1).strip()
-            tags = [t.strip() for t in re.split(r'[,\s]+', tags_text) if t.strip()]
-
-    return tags
-
-def extract_difficulty(diff_h2):
-    """Extract difficulty level - normalize to EASY/MEDIUM/HARD"""
-    if not diff_h2:
-        return "MEDIUM"
-
-    diff_span = diff_h2.find('span', class_=lambda x: x and 'difficulty-' in x)
-    if diff_span:
-        text = diff_span.get_text(strip=True).lower()
-        if 'hard' in text or 'advanced' in text:
-            return 'HARD'
-        elif 'easy' in text:
-            return 'EASY'
-        else:
-            return 'MEDIUM'
-
-    text = diff_h2.get_text().lower()
-    if 'hard' in text or 'advanced' in text:
-        return 'HARD'
-    elif 'easy' in text:
-        return 'EASY'
-    return 'MEDIUM'
-
-def extract_options_from_divs(options_div):
-    """Extract options from div.option elements"""
-    if not options_div:
-        return {}
-
-    options = {}
-    option_divs = options_div.find_all('div', class_='option')
-    letters = ['a', 'b', 'c', 'd']
-
-    for idx, div in enumerate(option_divs[:4]):
-        if idx < len(letters):
-            text = div.get_text(strip=True)
-            # Remove leading (a), (b), etc.
-            text = re.sub(r'^\([a-d]\)\s*', '', text)
-            options[letters[idx]] = text
-
-    return options
-
-def extract_correct_answer(answer_div):
-    """Extract correct answer"""
-    if not answer_div:
-        return None
-
-    text = answer_div.get_text()
-    # Match (a), (b), (c), (d) or just A, B, C, D
-    match = re.search(r'\(([a-d])\)|Answer:\s*\(([a-d])\)|([ABCD])\b', text, re.IGNORECASE)
-    if match:
-        answer = (match.group(1) or match.group(2) or match.group(3)).lower()
-        return answer
-
-    return None
-
-def extract_solution_text(solution_div):
-    """Extract solution as HTML and text"""
-    if not solution_div:
-        return "", ""
-
-    solution_html = solution_div.decode_contents().strip()
-    solution_text = solution_div.get_text(separator='\n', strip=True)
-
-    return solution_html, solution_text
+import extraction_engine
+import html_blocks
+from assembly_index import AssemblyIndexBuilder
+from extraction_cache import ExtractionCache
+from extraction_engine import MATHEMATICS
+from question_writers import open_question_writer, sidecar_path
+from search_index import SearchIndexBuilder, index_path_for
 
 def extract_questions_from_html(html_path):
-    """Extract all math questions"""
-    with open(html_path, 'r', encoding='utf-8') as f:
-        soup = BeautifulSoup(f.read(), 'html.parser')
-
-    questions = []
-    hrs = soup.find_all('hr')
-
-    print(f"Found {len(hrs)} question separators")
-
-    current_chapter = None
-
-    for idx, hr in enumerate(hrs):
-        try:
-            current = hr.next_sibling
-
-            topic = None
-            subtopic = None
-            tags = []
-            question_type = None
-            difficulty = None
-            question_number = None
-            question_div = None
-            options_div = None
-            answer_div = None
-            solution_div = None
-
-            while current and current.name != 'hr':
-                if current.name == 'h2':
-                    text = current.get_text()
-
-                    if text.startswith('Chapter:') or 'id="chapter-' in str(current):
-                        current_chapter = text.replace('Chapter:', '').strip()
-                        if not current_chapter:
-                            chapter_id = current.get('id', '')
-                            if chapter_id.startswith('chapter-'):
-                                current_chapter = chapter_id.replace('chapter-', '').replace('-', ' ').title()
-
-                    elif text.startswith('Topic:'):
-                        topic = text.replace('Topic:', '').strip()
-
-                    elif text.startswith('Subtopic:'):
-                        subtopic = text.replace('Subtopic:', '').strip()
-
-                    elif text.startswith('TAGS:') or 'TAGS' in text:
-                        tags = extract_tags(current)
-
-                    elif text.startswith('TYPE:'):
-                        question_type = text.replace('TYPE:', '').strip()
-
-                    elif text.startswith('Difficulty:'):
-                        difficulty = extract_difficulty(current)
-
-                elif current.name == 'h3':
-                    text = current.get_text()
-                    match = re.search(r'Question\s+(\d+)', text)
-                    if match:
-                        question_number = int(match.group(1))
-
-                elif current.name == 'div':
-                    classes = current.get('class', [])
-
-                    if 'question' in classes:
-                        question_div = current
-                    elif 'options' in classes:
-                        options_div = current
-                    elif 'answer' in classes:
-                        answer_div = current
-                    elif 'solution' in classes:
-                        solution_div = current
-
-                current = current.next_sibling
-
-            if question_number and question_div:
-                question_text = question_div.decode_contents().strip()
-                options = extract_options_from_divs(options_div) if options_div else {}
-                correct_answer = extract_correct_answer(answer_div) if answer_div else None
-                solution_html, solution_text = extract_solution_text(solution_div) if solution_div else ("", "")
-
-                chapter_slug = current_chapter.replace(' ', '_').replace('and', '').replace(',', '') if current_chapter else 'Mathematics'
-                question_id = f"{chapter_slug}_{question_number}"
-
-                question_obj = {
-                    'id': question_id,
-                    'subject': 'Mathematics',
-                    'chapter': current_chapter or 'Mathematics',
-                    'topic': topic or '',
-                    'subtopic': subtopic or '',
-                    'tags': tags,
-                    'type': question_type or 'Multiple Choice Single Answer',
-                    'difficulty': difficulty or 'MEDIUM',
-                    'question': BeautifulSoup(question_text, 'html.parser').get_text(strip=True),
-                    'question_html': question_text,
-                    'options': options,
-                    'correct_answer': correct_answer,
-                    'solution_html': solution_html,
-                    'solution_text': solution_text
-                }
-
-                questions.append(question_obj)
-
-                if len(questions) % 50 == 0:
-                    print(f"Extracted {len(questions)} questions...")
-
-        except Exception as e:
-            print(f"Error processing question at index {idx}: {e}")
-            continue
-
-    return questions
+    """Extract all questions from the HTML file"""
+    return extraction_engine.extract_questions_from_html(html_path, MATHEMATICS)
+
+def extract_block_markup(markup, state):
+    """Parse the markup of one <hr> block and build its question object"""
+    return extraction_engine.extract_block_markup(markup, state, MATHEMATICS)
+
+def iter_questions_from_html(html_path, chunk_size=1 << 16):
+    """Stream question objects from the HTML file one <hr> block at a time"""
+    return extraction_engine.iter_questions_from_html(html_path, MATHEMATICS, chunk_size)
+
+def extract_questions_incremental(html_path, cache):
+    """Extract questions, re-parsing only the <hr> blocks not in ``cache``"""
+    return extraction_engine.extract_questions_incremental(html_path, cache, MATHEMATICS)
 
 def main():
+    parser = argparse.ArgumentParser(description='Extract IIT JEE Mathematics questions from HTML')
+    parser.add_argument('html_path', nargs='?',
+                        default='/Users/Pramod/projects/Selenium/IIT_JEE_Mathematics_Complete_Problems.html')
+    parser.add_argument('--stream', action='store_true',
+                        help='tokenize incrementally instead of building the whole document tree')
+    parser.add_argument('--incremental', action='store_true',
+                        help='reuse cached records for unchanged question blocks')
+    parser.add_argument('--output', default='complete_math_questions.json',
+                        help='output file: .json array, or JSON Lines for .jsonl / .jsonl.gz')
+    parser.add_argument('--shard-by-chapter', metavar='DIR',
+                        help='write one JSONL shard per chapter plus manifest.json into DIR')
+    parser.add_argument('--gzip', action='store_true',
+                        help='gzip the chapter shards')
+    args = parser.parse_args()
+
     print("📐 Extracting IIT JEE Complete Mathematics Questions...\n")
 
-    html_path = Path('/Users/Pramod/projects/Selenium/IIT_JEE_Mathematics_Complete_Problems.html')
+    html_path = Path(args.html_path)
 
     if not html_path.exists():
         print(f"❌ HTML file not found: {html_path}")
@@ -211,32 +57,63 @@ def main():
 
     print(f"📄 Reading: {html_path}")
 
-    questions = extract_questions_from_html(html_path)
-
-    print(f"\n✅ Extracted {len(questions)} mathematics questions")
+    if args.incremental:
+        cache = ExtractionCache('extract_complete_math_questions', __file__, extraction_engine.__file__, html_blocks.__file__)
+        questions = extract_questions_incremental(html_path, cache)
+        cache.save()
+    elif args.stream:
+        questions = iter_questions_from_html(html_path)
+    else:
+        questions = extract_questions_from_html(html_path)
 
+    # Save each question as it comes in, tallying the breakdowns on the way
     from collections import Counter
-    chapters = Counter(q['chapter'] for q in questions)
+    chapters = Counter()
+    difficulties = Counter()
+    sample = None
+    index = SearchIndexBuilder()
+    assembly = AssemblyIndexBuilder(group_by='chapter')
+
+    output_path = Path(args.output)
+    with open_question_writer(output_path, args.shard_by_chapter, args.gzip) as writer:
+        for q in questions:
+            writer.write(q)
+            index.add(q)
+            assembly.add(q)
+            chapters[q['chapter']] += 1
+            difficulties[q['difficulty']] += 1
+            sample = sample or q
+
+    print(f"\n✅ Extracted {writer.count} mathematics questions")
 
     print("\n📊 Questions by Chapter:")
     for chapter, count in sorted(chapters.items()):
         print(f"  • {chapter}: {count} questions")
 
-    difficulties = Counter(q['difficulty'] for q in questions)
     print("\n📊 Questions by Difficulty:")
     for diff, count in sorted(difficulties.items()):
         print(f"  • {diff}: {count} questions")
 
-    output_path = Path('complete_math_questions.json')
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(questions, f, indent=2, ensure_ascii=False)
-
-    print(f"\n💾 Saved to: {output_path}")
-    print(f"📦 File size: {output_path.stat().st_size / 1024:.2f} KB")
-
-    if questions:
+    if args.shard_by_chapter:
+        shard_bytes = sum(shard.path.stat().st_size for shard in writer.shards.values())
+        print(f"\n💾 Saved {len(writer.shards)} chapter shards to: {args.shard_by_chapter}")
+        print(f"📋 Manifest: {writer.manifest_path}")
+        print(f"📦 Total size: {shard_bytes / 1024:.2f} KB")
+    else:
+        print(f"\n💾 Saved to: {output_path}")
+        print(f"📦 File size: {output_path.stat().st_size / 1024:.2f} KB")
+
+    index_path = index_path_for(output_path, args.shard_by_chapter)
+    index_size = index.write(index_path)
+    print(f"🔎 Search index: {len(index.postings)} terms, {index_size / 1024:.2f} KB → {index_path}")
+
+    assembly_path = sidecar_path(output_path, 'assembly', args.shard_by_chapter)
+    assembly_size = assembly.write(assembly_path)
+    print(f"🎲 Test assembly tables: {assembly_size / 1024:.2f} KB → {assembly_path}")
+
+    # Show sample question
+    if sample:
         print("\n📝 Sample Question:")
-        sample = questions[0]
         print(f"  ID: {sample['id']}")
         print(f"  Chapter: {sample['chapter']}")
         print(f"  Topic: {sample['topic']}")
@@ -4,21 +4,18 @@ Extract questions from combined_maths_problems.html that are not in our database
 and create separate HTML files by chapter in the output folder.
 """
 
-import json
 import re
 from bs4 import BeautifulSoup
 from pathlib import Path
 from collections import defaultdict
 
+from dedup_index import DedupIndex
+from question_store import QuestionStore
+
 def load_existing_questions():
-    """Load existing questions from JSON file"""
-    json_path = Path('mcq_questions_with_solutions.json')
-    if json_path.exists():
-        with open(json_path, 'r', encoding='utf-8') as f:
-            questions = json.load(f)
-            # Create set of question texts for comparison
-            return {q['question'].strip() for q in questions}
-    return set()
+    """Build the dedup index over the existing questions, via the local question store"""
+    with QuestionStore() as store:
+        return DedupIndex.from_store(store)
 
 def extract_chapter_from_filename(filename):
     """Extract chapter name from filename"""
@@ -72,7 +69,7 @@ def extract_questions_by_chapter(html_path, existing_questions):
                 question_text = BeautifulSoup(question_html, 'html.parser').get_text().strip()
 
                 # Check if this question is not in our existing set
-                if question_text not in existing_questions:
+                if not existing_questions.is_duplicate(question_text):
                     question_blocks.append({
                         'html': question_html,
                         'text': question_text
@@ -80,7 +77,9 @@ def extract_questions_by_chapter(html_path, existing_questions):
         else:
             # No numbered questions found, treat entire section as one block
             section_text = section.get_text().strip()
-            if section_text and section_text not in existing_questions:
+            # A whole section holds several questions: containing one existing
+            # question doesn't make the rest duplicates
+            if section_text and not existing_questions.is_exact_duplicate(section_text):
                 # Get the content without the header
                 content_div = section.find_all(recursive=False)
                 if len(content_div) > 1:  # More than just the header
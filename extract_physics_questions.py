@@ -5,308 +5,57 @@ Extracts all 264 IIT JEE Physics questions with complete metadata including
 Chapter, Topic, Subtopic, TAGS, TYPE, Difficulty, Strategy, Expert Insight, Key Facts
 """
 
-import json
-import re
-from bs4 import BeautifulSoup
+import argparse
 from pathlib import Path
 
-def clean_html(html_str):
-    """Clean HTML string while preserving important tags"""
-    if not html_str:
-        return ""
-    # Remove excessive whitespace
-    html_str = re.sub(r'\s+', ' ', html_str).strip()
-    return html_str
-
-def extract_text(element):
-    """Extract text from element, preserving some structure"""
-    if not element:
-        return ""
-    return element.get_text(strip=True)
-
-def extract_tags(tags_h2):
-    """Extract tags from TAGS h2 element"""
-    if not tags_h2:
-        return []
-
-    # Find all span.tag elements
-    tag_spans = tags_h2.find_all('span', class_='tag')
-    tags = [span.get_text(strip=True) for span in tag_spans]
-
-    # If no spans found, try to extract from text
-    if not tags:
-        text = tags_h2.get_text()
-        # Extract everything after "TAGS:"
-        match = re.search(r'TAGS:\s*(.+)', text)
-        if match:
-            tags_text = match.group(1).strip()
-            # Split by common separators
-            tags = [t.strip() for t in re.split(r'[,\s]+', tags_text) if t.strip()]
-
-    return tags
-
-def extract_difficulty(diff_h2):
-    """Extract difficulty level from h2 element"""
-    if not diff_h2:
-        return "MEDIUM"
-
-    # Find span with difficulty class
-    diff_span = diff_h2.find('span', class_=lambda x: x and 'difficulty-' in x)
-    if diff_span:
-        text = diff_span.get_text(strip=True)
-        # Normalize to our format
-        if 'hard' in text.lower():
-            return 'HARD'
-        elif 'easy' in text.lower():
-            return 'EASY'
-        else:
-            return 'MEDIUM'
-
-    # Fallback: extract from text
-    text = diff_h2.get_text().lower()
-    if 'hard' in text:
-        return 'HARD'
-    elif 'easy' in text:
-        return 'EASY'
-    else:
-        return 'MEDIUM'
-
-def extract_correct_answer(answer_div):
-    """Extract correct answer letter from answer div"""
-    if not answer_div:
-        return None
-
-    text = answer_div.get_text()
-    # Extract letter A, B, C, or D
-    match = re.search(r'\b([ABCD])\b', text)
-    if match:
-        return match.group(1).lower()
-
-    return None
-
-def extract_options(options_div):
-    """Extract all four options from options div"""
-    if not options_div:
-        return {}
-
-    options = {}
-
-    # Find the ordered list
-    ol = options_div.find('ol', type='A')
-    if ol:
-        items = ol.find_all('li', recursive=False)
-        letters = ['a', 'b', 'c', 'd']
-
-        for idx, item in enumerate(items[:4]):  # Only take first 4
-            if idx < len(letters):
-                options[letters[idx]] = item.decode_contents().strip()
-
-    return options
-
-def extract_solution_parts(solution_div):
-    """Extract strategy, expert insight, key facts, and steps from solution"""
-    if not solution_div:
-        return {}, ""
-
-    solution_data = {
-        'strategy': '',
-        'expert_insight': '',
-        'key_facts': '',
-        'steps': []
-    }
-
-    # Get all contents
-    contents = solution_div.decode_contents()
-
-    # Extract Strategy
-    strategy_match = re.search(r'<strong>Strategy:</strong>\s*(.+?)(?=<strong>|<ol>|$)', contents, re.DOTALL | re.IGNORECASE)
-    if strategy_match:
-        strategy_html = strategy_match.group(1).strip()
-        strategy_soup = BeautifulSoup(strategy_html, 'html.parser')
-        solution_data['strategy'] = strategy_soup.get_text(strip=True)
-
-    # Extract Expert Insight
-    insight_match = re.search(r'<strong>Expert Insight:</strong>\s*(.+?)(?=<strong>|<ol>|$)', contents, re.DOTALL | re.IGNORECASE)
-    if insight_match:
-        insight_html = insight_match.group(1).strip()
-        insight_soup = BeautifulSoup(insight_html, 'html.parser')
-        solution_data['expert_insight'] = insight_soup.get_text(strip=True)
-
-    # Extract Key Facts
-    facts_match = re.search(r'<strong>Key Facts Used:</strong>\s*(.+?)(?=<strong>|<ol>|$)', contents, re.DOTALL | re.IGNORECASE)
-    if facts_match:
-        facts_html = facts_match.group(1).strip()
-        facts_soup = BeautifulSoup(facts_html, 'html.parser')
-        solution_data['key_facts'] = facts_soup.get_text(strip=True)
-
-    # Extract Steps from ordered list
-    ol = solution_div.find('ol')
-    if ol:
-        steps = []
-        items = ol.find_all('li', recursive=False)
-
-        for item in items:
-            step_html = item.decode_contents().strip()
-            steps.append(step_html)
-
-        solution_data['steps'] = steps
-
-    # Build complete solution HTML
-    solution_html = f"""<div class="solution">
-<strong>Solution:</strong>
-<div class="strategy">
-<strong>Strategy:</strong> {solution_data['strategy']}
-</div>
-<div class="expert-insight">
-<strong>Expert Insight:</strong> {solution_data['expert_insight']}
-</div>
-<div class="key-facts">
-<strong>Key Facts Used:</strong> {solution_data['key_facts']}
-</div>
-<ol class="steps">
-"""
-
-    for step in solution_data['steps']:
-        solution_html += f"<li>{step}</li>\n"
-
-    solution_html += """</ol>
-</div>"""
-
-    return solution_data, solution_html
+import extraction_engine
+import html_blocks
+from assembly_index import AssemblyIndexBuilder
+from extraction_cache import ExtractionCache
+from extraction_engine import PHYSICS
+from question_writers import open_question_writer, sidecar_path
+from search_index import SearchIndexBuilder, index_path_for
+from svg_figures import FigureStore
 
 def extract_questions_from_html(html_path):
     """Extract all questions from the HTML file"""
-    with open(html_path, 'r', encoding='utf-8') as f:
-        soup = BeautifulSoup(f.read(), 'html.parser')
-
-    questions = []
-
-    # Find all <hr> tags which separate questions
-    hrs = soup.find_all('hr')
-
-    print(f"Found {len(hrs)} question separators")
-
-    # Keep track of current chapter
-    current_chapter = None
-
-    for idx, hr in enumerate(hrs):
-        try:
-            # Start from the <hr> and collect elements until next <hr>
-            current = hr.next_sibling
-
-            # Collect all elements for this question
-            topic = None
-            subtopic = None
-            tags = []
-            question_type = None
-            difficulty = None
-            question_number = None
-            question_div = None
-            options_div = None
-            answer_div = None
-            solution_div = None
-
-            while current and current.name != 'hr':
-                if current.name == 'h2':
-                    text = current.get_text()
-
-                    # Check for Chapter
-                    if text.startswith('Chapter:') or 'id="chapter-' in str(current):
-                        current_chapter = text.replace('Chapter:', '').strip()
-                        if not current_chapter:
-                            # Try to extract from id
-                            chapter_id = current.get('id', '')
-                            if chapter_id.startswith('chapter-'):
-                                current_chapter = chapter_id.replace('chapter-', '').replace('-', ' ').title()
-
-                    # Topic
-                    elif text.startswith('Topic:'):
-                        topic = text.replace('Topic:', '').strip()
-
-                    # Subtopic
-                    elif text.startswith('Subtopic:'):
-                        subtopic = text.replace('Subtopic:', '').strip()
-
-                    # TAGS
-                    elif text.startswith('TAGS:') or 'TAGS' in text:
-                        tags = extract_tags(current)
-
-                    # TYPE
-                    elif text.startswith('TYPE:'):
-                        question_type = text.replace('TYPE:', '').strip()
-
-                    # Difficulty
-                    elif text.startswith('Difficulty:'):
-                        difficulty = extract_difficulty(current)
+    return extraction_engine.extract_questions_from_html(html_path, PHYSICS)
 
-                elif current.name == 'h3':
-                    # Question number
-                    text = current.get_text()
-                    match = re.search(r'Question\s+(\d+)', text)
-                    if match:
-                        question_number = int(match.group(1))
+def extract_block_markup(markup, state):
+    """Parse the markup of one <hr> block and build its question object"""
+    return extraction_engine.extract_block_markup(markup, state, PHYSICS)
 
-                elif current.name == 'div':
-                    classes = current.get('class', [])
+def iter_questions_from_html(html_path, chunk_size=1 << 16):
+    """Stream question objects from the HTML file one <hr> block at a time"""
+    return extraction_engine.iter_questions_from_html(html_path, PHYSICS, chunk_size)
 
-                    if 'question' in classes:
-                        question_div = current
-                    elif 'options' in classes:
-                        options_div = current
-                    elif 'answer' in classes:
-                        answer_div = current
-                    elif 'solution' in classes:
-                        solution_div = current
-
-                current = current.next_sibling
-
-            # Now create question object if we have all required parts
-            if question_number and question_div and options_div and answer_div:
-                # Extract data
-                question_text = question_div.decode_contents().strip()
-                options = extract_options(options_div)
-                correct_answer = extract_correct_answer(answer_div)
-                solution_parts, solution_html = extract_solution_parts(solution_div)
-
-                # Create question ID
-                chapter_slug = current_chapter.replace(' ', '_').replace('and', '').replace(',', '') if current_chapter else 'Physics'
-                question_id = f"{chapter_slug}_{question_number}"
-
-                question_obj = {
-                    'id': question_id,
-                    'subject': 'Physics',
-                    'chapter': current_chapter or 'Physics',
-                    'topic': topic or '',
-                    'subtopic': subtopic or '',
-                    'tags': tags,
-                    'type': question_type or 'Multiple Choice Single Answer',
-                    'difficulty': difficulty or 'MEDIUM',
-                    'question': BeautifulSoup(question_text, 'html.parser').get_text(strip=True),
-                    'question_html': question_text,
-                    'options': options,
-                    'correct_answer': correct_answer,
-                    'strategy': solution_parts.get('strategy', ''),
-                    'expert_insight': solution_parts.get('expert_insight', ''),
-                    'key_facts': solution_parts.get('key_facts', ''),
-                    'solution_html': solution_html,
-                    'solution_text': BeautifulSoup(solution_html, 'html.parser').get_text(separator='\n', strip=True)
-                }
-
-                questions.append(question_obj)
-
-                if len(questions) % 10 == 0:
-                    print(f"Extracted {len(questions)} questions...")
-
-        except Exception as e:
-            print(f"Error processing question at index {idx}: {e}")
-            continue
-
-    return questions
+def extract_questions_incremental(html_path, cache):
+    """Extract questions, re-parsing only the <hr> blocks not in ``cache``"""
+    return extraction_engine.extract_questions_incremental(html_path, cache, PHYSICS)
 
 def main():
+    parser = argparse.ArgumentParser(description='Extract IIT JEE Physics questions from HTML')
+    parser.add_argument('html_path', nargs='?',
+                        default='/Users/Pramod/projects/Selenium/IIT_JEE_Physics_Complete_264_Questions.html')
+    parser.add_argument('--stream', action='store_true',
+                        help='tokenize incrementally instead of building the whole document tree')
+    parser.add_argument('--incremental', action='store_true',
+                        help='reuse cached records for unchanged question blocks')
+    parser.add_argument('--output', default='physics_questions_with_solutions.json',
+                        help='output file: .json array, or JSON Lines for .jsonl / .jsonl.gz')
+    parser.add_argument('--shard-by-chapter', metavar='DIR',
+                        help='write one JSONL shard per chapter plus manifest.json into DIR')
+    parser.add_argument('--gzip', action='store_true',
+                        help='gzip the chapter shards')
+    parser.add_argument('--figures-dir', metavar='DIR',
+                        help='lift inline SVGs into content-addressed files in DIR')
+    parser.add_argument('--figures-url',
+                        help='URL prefix of the lifted figures (default: derived from --figures-dir)')
+    args = parser.parse_args()
+
     print("🔬 Extracting IIT JEE Physics Questions...\n")
 
-    html_path = Path('/Users/Pramod/projects/Selenium/IIT_JEE_Physics_Complete_264_Questions.html')
+    html_path = Path(args.html_path)
 
     if not html_path.exists():
         print(f"❌ HTML file not found: {html_path}")
@@ -315,36 +64,69 @@ def main():
     print(f"📄 Reading: {html_path}")
 
     # Extract questions
-    questions = extract_questions_from_html(html_path)
-
-    print(f"\n✅ Extracted {len(questions)} physics questions")
+    if args.incremental:
+        cache = ExtractionCache('extract_physics_questions', __file__, extraction_engine.__file__, html_blocks.__file__)
+        questions = extract_questions_incremental(html_path, cache)
+        cache.save()
+    elif args.stream:
+        questions = iter_questions_from_html(html_path)
+    else:
+        questions = extract_questions_from_html(html_path)
 
-    # Show chapter breakdown
+    # Save each question as it comes in, tallying the breakdowns on the way
     from collections import Counter
-    chapters = Counter(q['chapter'] for q in questions)
+    chapters = Counter()
+    difficulties = Counter()
+    sample = None
+    index = SearchIndexBuilder()
+    assembly = AssemblyIndexBuilder(group_by='chapter')
+    figures = FigureStore(args.figures_dir, args.figures_url) if args.figures_dir else None
+
+    output_path = Path(args.output)
+    with open_question_writer(output_path, args.shard_by_chapter, args.gzip) as writer:
+        for q in questions:
+            if figures:
+                q = figures.lift_record(q)
+            writer.write(q)
+            index.add(q)
+            assembly.add(q)
+            chapters[q['chapter']] += 1
+            difficulties[q['difficulty']] += 1
+            sample = sample or q
+
+    print(f"\n✅ Extracted {writer.count} physics questions")
 
     print("\n📊 Questions by Chapter:")
     for chapter, count in sorted(chapters.items()):
         print(f"  • {chapter}: {count} questions")
 
-    # Show difficulty breakdown
-    difficulties = Counter(q['difficulty'] for q in questions)
     print("\n📊 Questions by Difficulty:")
     for diff, count in sorted(difficulties.items()):
         print(f"  • {diff}: {count} questions")
 
-    # Save to JSON
-    output_path = Path('physics_questions_with_solutions.json')
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(questions, f, indent=2, ensure_ascii=False)
+    if args.shard_by_chapter:
+        shard_bytes = sum(shard.path.stat().st_size for shard in writer.shards.values())
+        print(f"\n💾 Saved {len(writer.shards)} chapter shards to: {args.shard_by_chapter}")
+        print(f"📋 Manifest: {writer.manifest_path}")
+        print(f"📦 Total size: {shard_bytes / 1024:.2f} KB")
+    else:
+        print(f"\n💾 Saved to: {output_path}")
+        print(f"📦 File size: {output_path.stat().st_size / 1024:.2f} KB")
+
+    if figures:
+        print(figures.summary())
+
+    index_path = index_path_for(output_path, args.shard_by_chapter)
+    index_size = index.write(index_path)
+    print(f"🔎 Search index: {len(index.postings)} terms, {index_size / 1024:.2f} KB → {index_path}")
 
-    print(f"\n💾 Saved to: {output_path}")
-    print(f"📦 File size: {output_path.stat().st_size / 1024:.2f} KB")
+    assembly_path = sidecar_path(output_path, 'assembly', args.shard_by_chapter)
+    assembly_size = assembly.write(assembly_path)
+    print(f"🎲 Test assembly tables: {assembly_size / 1024:.2f} KB → {assembly_path}")
 
     # Show sample question
-    if questions:
+    if sample:
         print("\n📝 Sample Question:")
-        sample = questions[0]
         print(f"  ID: {sample['id']}")
         print(f"  Chapter: {sample['chapter']}")
         print(f"  Topic: {sample['topic']}")
@@ -1,11 +1,69 @@
 #!/usr/bin/env python3
 """Extract questions as JSON for Next.js app."""
 
+import argparse
+import hashlib
 import json
+import os
 import re
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from bs4 import BeautifulSoup
 
+import html_blocks
+from assembly_index import write_assembly_index
+from delta_patches import write_delta
+from extraction_cache import ExtractionCache, extract_blocks_incremental
+from html_blocks import ElementBlockSplitter, iter_blocks
+from question_writers import shard_slug
+from search_index import write_index
+from svg_figures import FigureStore
+
+
+def extract_problem(problem, idx, topic_name):
+    """Build the question object for one div.problem."""
+
+    prob_num = problem.find('span', class_='problem-number')
+    prob_num_text = prob_num.get_text(strip=True) if prob_num else f"Problem {idx}"
+
+    difficulty = problem.find('span', class_='difficulty')
+    difficulty_text = difficulty.get_text(strip=True) if difficulty else "ADVANCED"
+
+    prob_text = problem.find('div', class_='problem-text')
+    prob_text_html = str(prob_text) if prob_text else ""
+    prob_text_content = prob_text.get_text(strip=True) if prob_text else ""
+
+    options_div = problem.find('div', class_='options')
+    options = []
+
+    if options_div:
+        option_items = options_div.find_all('div', class_='option')
+        for opt in option_items:
+            opt_text = opt.get_text(strip=True)
+            match = re.match(r'^\(([a-d])\)', opt_text)
+            if match:
+                option_letter = match.group(1)
+                option_value = opt_text[3:].strip()
+                options.append({
+                    'letter': option_letter,
+                    'text': opt_text,
+                    'value': option_value
+                })
+
+    return {
+        'id': f"{topic_name}_{idx}",
+        'topic': topic_name,
+        'number': prob_num_text,
+        'difficulty': difficulty_text,
+        'question_html': prob_text_html,
+        'question_text': prob_text_content,
+        'options': options,
+        'correct_answer': None,
+        'solution': None
+    }
+
 
 def extract_questions_with_options(html_file, topic_name):
     """Extract questions with options from HTML file."""
@@ -16,53 +74,53 @@ def extract_questions_with_options(html_file, topic_name):
     soup = BeautifulSoup(content, 'html.parser')
     problems = soup.find_all('div', class_='problem')
 
-    questions = []
-
-    for idx, problem in enumerate(problems, 1):
-        prob_num = problem.find('span', class_='problem-number')
-        prob_num_text = prob_num.get_text(strip=True) if prob_num else f"Problem {idx}"
-
-        difficulty = problem.find('span', class_='difficulty')
-        difficulty_text = difficulty.get_text(strip=True) if difficulty else "ADVANCED"
-
-        prob_text = problem.find('div', class_='problem-text')
-        prob_text_html = str(prob_text) if prob_text else ""
-        prob_text_content = prob_text.get_text(strip=True) if prob_text else ""
-
-        options_div = problem.find('div', class_='options')
-        options = []
-
-        if options_div:
-            option_items = options_div.find_all('div', class_='option')
-            for opt in option_items:
-                opt_text = opt.get_text(strip=True)
-                match = re.match(r'^\(([a-d])\)', opt_text)
-                if match:
-                    option_letter = match.group(1)
-                    option_value = opt_text[3:].strip()
-                    options.append({
-                        'letter': option_letter,
-                        'text': opt_text,
-                        'value': option_value
-                    })
-
-        questions.append({
-            'id': f"{topic_name}_{idx}",
-            'topic': topic_name,
-            'number': prob_num_text,
-            'difficulty': difficulty_text,
-            'question_html': prob_text_html,
-            'question_text': prob_text_content,
-            'options': options,
-            'correct_answer': None,
-            'solution': None
-        })
+    return [extract_problem(problem, idx, topic_name) for idx, problem in enumerate(problems, 1)]
+
+
+def extract_problem_markup(markup, state):
+    """Parse the markup of one div.problem and build its question object."""
+
+    state['index'] += 1
+    problem = BeautifulSoup(markup, 'html.parser').find('div', class_='problem')
 
-    return questions
+    return extract_problem(problem, state['index'], state['topic'])
 
 
-def build_questions_database(maths_folder):
-    """Build complete questions database."""
+def extract_topic_file(html_file, old_blocks=None):
+    """Extract one topic file, returning (topic_name, questions, seconds, blocks).
+
+    When old_blocks is given (incremental mode), only div.problem blocks
+    missing from it are parsed, and blocks is (new_blocks, order, reused)
+    for the caller to store in the cache.
+    """
+
+    topic_name = html_file.stem.replace('_', ' ')
+
+    start = time.perf_counter()
+
+    if old_blocks is None:
+        questions = extract_questions_with_options(html_file, topic_name)
+        blocks = None
+    else:
+        questions, new_blocks, order, reused = extract_blocks_incremental(
+            iter_blocks(html_file, ElementBlockSplitter('div', 'problem')),
+            extract_problem_markup,
+            {'topic': topic_name, 'index': 0},
+            old_blocks
+        )
+        blocks = (new_blocks, order, reused)
+
+    return topic_name, questions, time.perf_counter() - start, blocks
+
+
+def build_questions_database(maths_folder, workers=1, cache=None):
+    """Build complete questions database.
+
+    With workers > 1 the topic files are parsed in a process pool; results
+    are merged in sorted file order, so the output does not depend on
+    which worker finishes first. With a cache, unchanged files are not
+    parsed at all and changed files only re-parse their edited problems.
+    """
 
     maths_path = Path(maths_folder)
     html_files = sorted(maths_path.glob("*.html"))
@@ -70,12 +128,47 @@ def build_questions_database(maths_folder):
     database = {}
     total_questions = 0
 
+    start = time.perf_counter()
+
+    extracted = {}
+    pending = []
+
     for html_file in html_files:
-        topic_name = html_file.stem.replace('_', ' ')
+        if cache is None:
+            pending.append((html_file, None, None))
+            continue
 
-        print(f"Processing: {topic_name}")
+        digest, records, old_blocks = cache.lookup(html_file)
+        if records is not None:
+            extracted[html_file] = (html_file.stem.replace('_', ' '), records, "cached")
+        else:
+            pending.append((html_file, digest, old_blocks))
 
-        questions = extract_questions_with_options(html_file, topic_name)
+    files = [html_file for html_file, _, _ in pending]
+    old = [old_blocks for _, _, old_blocks in pending]
+
+    if workers > 1 and len(pending) > 1:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        results = pool.map(extract_topic_file, files, old)
+    else:
+        pool = None
+        results = map(extract_topic_file, files, old)
+
+    try:
+        for (html_file, digest, _), (topic_name, questions, elapsed, blocks) in zip(pending, results):
+            note = f"{elapsed:.2f}s"
+            if blocks:
+                new_blocks, order, reused = blocks
+                cache.store(html_file, digest, new_blocks, order)
+                note += f", reused {reused}/{len(order)} problems"
+            extracted[html_file] = (topic_name, questions, note)
+    finally:
+        if pool:
+            pool.shutdown()
+
+    for html_file in html_files:
+        topic_name, questions, note = extracted[html_file]
+        print(f"Processing: {topic_name} ({note})")
 
         if questions:
             database[topic_name] = questions
@@ -84,15 +177,117 @@ def build_questions_database(maths_folder):
 
     print(f"\n✅ Total topics: {len(database)}")
     print(f"✅ Total questions: {total_questions}")
+    print(f"⏱️  {len(html_files)} files in {time.perf_counter() - start:.2f}s "
+          f"({max(workers, 1)} worker{'s' if workers > 1 else ''})")
 
     return database
 
 
+def write_topic_bundles(database, bundles_dir):
+    """Write one content-hashed JSON bundle per topic plus manifest.json.
+
+    Bundle names carry a hash of their bytes, so an unchanged topic keeps
+    its file (and any CDN copy of it) across builds. Bundles the previous
+    manifest listed that are no longer referenced are removed.
+    """
+
+    bundles_dir = Path(bundles_dir)
+    bundles_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = bundles_dir / "manifest.json"
+
+    old_files = set()
+    if manifest_path.exists():
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            old_files = {entry["file"] for entry in json.load(f).get("topics", [])}
+
+    entries = []
+    slugs = set()
+    unchanged = 0
+
+    for topic_name, questions in database.items():
+        slug = shard_slug(topic_name)
+        base, n = slug, 1
+        while slug in slugs:
+            n += 1
+            slug = f"{base}_{n}"
+        slugs.add(slug)
+
+        data = json.dumps(questions, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        filename = f"{slug}.{digest[:12]}.json"
+
+        bundle_path = bundles_dir / filename
+        if bundle_path.exists():
+            unchanged += 1
+        else:
+            tmp_path = bundle_path.with_suffix(".tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, bundle_path)
+
+        entries.append({
+            "topic": topic_name,
+            "file": filename,
+            "count": len(questions),
+            "difficulties": dict(Counter(q["difficulty"] for q in questions)),
+            "bytes": len(data),
+            "sha256": digest
+        })
+
+    for filename in old_files - {entry["file"] for entry in entries}:
+        (bundles_dir / filename).unlink(missing_ok=True)
+
+    manifest = {
+        "total_topics": len(entries),
+        "total_questions": sum(entry["count"] for entry in entries),
+        "topics": entries
+    }
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    print(f"📦 {len(entries)} topic bundles in {bundles_dir} ({len(entries) - unchanged} written, {unchanged} unchanged)")
+
+    return manifest_path
+
+
 if __name__ == "__main__":
-    database = build_questions_database("../maths")
+    parser = argparse.ArgumentParser(description="Extract questions as JSON for Next.js app.")
+    parser.add_argument("maths_folder", nargs="?", default="../maths")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="parse topic files in N processes (0 = one per CPU core)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="reuse cached records for unchanged files and problems")
+    parser.add_argument("--bundles-dir", default="public/data/topics",
+                        help="where to write the per-topic bundles and their manifest")
+    parser.add_argument("--versions-dir", default="public/data/versions",
+                        help="where to write delta patches against the previous build")
+    parser.add_argument("--figures-dir", metavar="DIR",
+                        help="lift inline SVGs into content-addressed files in DIR (e.g. public/data/figures)")
+    parser.add_argument("--figures-url", help="URL prefix of the lifted figures (default: derived from --figures-dir)")
+    args = parser.parse_args()
+
+    workers = args.workers or os.cpu_count() or 1
+    cache = ExtractionCache("extract_questions", __file__, html_blocks.__file__) if args.incremental else None
+    database = build_questions_database(args.maths_folder, workers=workers, cache=cache)
+
+    if cache:
+        cache.save()
+
+    if args.figures_dir:
+        figures = FigureStore(args.figures_dir, args.figures_url)
+        database = {topic: [figures.lift_record(q) for q in questions] for topic, questions in database.items()}
+        print(figures.summary())
 
     # Save to JSON
     with open("public/data/questions.json", "w", encoding="utf-8") as f:
         json.dump(database, f, ensure_ascii=False, indent=2)
 
     print("\n✅ Saved to public/data/questions.json")
+
+    write_delta(database, args.versions_dir)
+
+    write_index((q for questions in database.values() for q in questions), "public/data/search_index.json")
+    write_assembly_index((q for questions in database.values() for q in questions),
+                         "public/data/test_assembly.json", group_by="topic")
+
+    manifest_path = write_topic_bundles(database, args.bundles_dir)
+    print(f"✅ Manifest: {manifest_path}")
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Content-hash extraction cache
+Persists extracted question records per source file so re-runs only parse
+what changed. A file whose hash is unchanged returns its records straight
+from the cache; otherwise the file is split into question blocks and only
+blocks whose hash is new are parsed again.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+CACHE_DIR = Path('.extraction_cache')
+
+def file_digest(path):
+    """SHA-256 of a file's bytes"""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+def block_digest(markup, state):
+    """Hash a block together with the state it was extracted in"""
+    h = hashlib.sha256()
+    h.update(json.dumps(state, sort_keys=True).encode('utf-8'))
+    h.update(b'\0')
+    h.update(markup.encode('utf-8'))
+    return h.hexdigest()
+
+def extract_blocks_incremental(blocks, extract_block, state, old_blocks):
+    """Extract records from block markup, reusing unchanged blocks
+
+    ``extract_block(markup, state)`` returns a record (or None) and may
+    update ``state`` (e.g. the current chapter). Each block is keyed by its
+    markup plus the incoming state, and stores the record and outgoing
+    state, so a reused block leaves ``state`` exactly as parsing it would.
+
+    Returns (records, new_blocks, order, reused).
+    """
+    records = []
+    new_blocks = {}
+    order = []
+    reused = 0
+
+    for idx, markup in enumerate(blocks):
+        key = block_digest(markup, state)
+        entry = new_blocks.get(key) or old_blocks.get(key)
+
+        if entry is None:
+            record = None
+            try:
+                record = extract_block(markup, state)
+            except Exception as e:
+                print(f"Error processing question at index {idx}: {e}")
+            entry = {'record': record, 'state': dict(state)}
+        else:
+            state.clear()
+            state.update(entry['state'])
+            reused += 1
+
+        new_blocks[key] = entry
+        order.append(key)
+        if entry['record'] is not None:
+            records.append(entry['record'])
+
+    return records, new_blocks, order, reused
+
+class ExtractionCache:
+    """On-disk cache of per-file, per-block extraction results
+
+    Stored as JSON under ``.extraction_cache/<name>.json``. The whole cache
+    is discarded when any of ``code_paths`` (the extractor's own source)
+    changes, since cached records are only valid for the code that made them.
+    """
+
+    def __init__(self, name, *code_paths, cache_dir=CACHE_DIR):
+        self.path = Path(cache_dir) / f'{name}.json'
+        self.code = ''.join(file_digest(p) for p in code_paths)
+        self.files = {}
+
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('code') == self.code:
+                    self.files = data.get('files', {})
+            except (OSError, ValueError):
+                pass
+
+    @staticmethod
+    def _key(source_path):
+        return str(Path(source_path).resolve())
+
+    def lookup(self, source_path):
+        """Return (digest, cached records or None, previous blocks) for a source file"""
+        digest = file_digest(source_path)
+        entry = self.files.get(self._key(source_path))
+
+        if not entry:
+            return digest, None, {}
+        if entry['sha256'] == digest:
+            blocks = entry['blocks']
+            return digest, [blocks[k]['record'] for k in entry['order'] if blocks[k]['record'] is not None], blocks
+        return digest, None, entry['blocks']
+
+    def store(self, source_path, digest, blocks, order):
+        self.files[self._key(source_path)] = {
+            'sha256': digest,
+            'order': order,
+            'blocks': blocks
+        }
+
+    def extract(self, source_path, blocks, extract_block, state):
+        """Cached equivalent of running ``extract_block`` over every block
+
+        ``blocks`` is a zero-argument callable returning the block iterator,
+        so an unchanged file is never even tokenized.
+        """
+        digest, records, old_blocks = self.lookup(source_path)
+        if records is not None:
+            print(f"♻️  Cache hit: {Path(source_path).name} unchanged ({len(records)} records)")
+            return records
+
+        records, new_blocks, order, reused = extract_blocks_incremental(blocks(), extract_block, state, old_blocks)
+        self.store(source_path, digest, new_blocks, order)
+        print(f"♻️  Cache: reused {reused}/{len(order)} blocks from {Path(source_path).name}")
+        return records
+
+    def save(self):
+        """Write the cache atomically"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'code': self.code, 'files': self.files}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+Shared extraction engine for the <hr>-delimited subject exports
+One block walker builds every question record; what differs between
+subjects (required parts, option layout, answer pattern, solution fields)
+lives in a per-subject field spec. Several subject files can be extracted
+concurrently in a process pool.
+
+    python3 extraction_engine.py physics=Physics.html math=Maths.html --workers 2
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+
+from html_blocks import HrBlockSplitter, iter_blocks
+
+QUESTION_NUMBER = re.compile(r'Question\s+(\d+)')
+TAGS_TEXT = re.compile(r'TAGS:\s*(.+)')
+TAG_SEPARATORS = re.compile(r'[,\s]+')
+OPTION_PREFIX = re.compile(r'^\([a-d]\)\s*')
+LETTERS = ['a', 'b', 'c', 'd']
+
+# Section markers, matched as a bare <strong>Label:</strong> (case-insensitive)
+SOLUTION_SECTIONS = {
+    'strategy:': 'strategy',
+    'expert insight:': 'expert_insight',
+    'key facts used:': 'key_facts'
+}
+
+# String types get_text() collects (no comments, doctypes, etc.)
+TEXT_TYPES = (NavigableString, CData)
+
+def extract_tags(tags_h2):
+    """Extract tags from TAGS h2 element"""
+    if not tags_h2:
+        return []
+
+    # Find all span.tag elements
+    tag_spans = tags_h2.find_all('span', class_='tag')
+    tags = [span.get_text(strip=True) for span in tag_spans]
+
+    # If no spans found, try to extract from text
+    if not tags:
+        match = TAGS_TEXT.search(tags_h2.get_text())
+        if match:
+            tags = [t.strip() for t in TAG_SEPARATORS.split(match.group(1).strip()) if t.strip()]
+
+    return tags
+
+def extract_difficulty(diff_h2, hard_words):
+    """Normalize the difficulty h2 to EASY/MEDIUM/HARD"""
+    if not diff_h2:
+        return "MEDIUM"
+
+    # Prefer the span with a difficulty-* class, else the whole heading
+    diff_span = diff_h2.find('span', class_=lambda x: x and 'difficulty-' in x)
+    text = (diff_span.get_text(strip=True) if diff_span else diff_h2.get_text()).lower()
+
+    if any(word in text for word in hard_words):
+        return 'HARD'
+    elif 'easy' in text:
+        return 'EASY'
+    return 'MEDIUM'
+
+def extract_correct_answer(answer_div, pattern):
+    """Lower-cased first non-empty group of ``pattern`` in the answer div"""
+    if not answer_div:
+        return None
+
+    match = pattern.search(answer_div.get_text())
+    if match:
+        return next(group for group in match.groups() if group).lower()
+
+    return None
+
+def options_from_list(options_div):
+    """Options as inner HTML of the <ol type="A"> items"""
+    if not options_div:
+        return {}
+
+    options = {}
+    ol = options_div.find('ol', type='A')
+    if ol:
+        for letter, item in zip(LETTERS, ol.find_all('li', recursive=False)):
+            options[letter] = item.decode_contents().strip()
+
+    return options
+
+def options_from_divs(options_div):
+    """Options as text of the div.option elements, without the (a) prefix"""
+    if not options_div:
+        return {}
+
+    options = {}
+    for letter, div in zip(LETTERS, options_div.find_all('div', class_='option')):
+        options[letter] = OPTION_PREFIX.sub('', div.get_text(strip=True))
+
+    return options
+
+def is_section_marker(tag):
+    """Return the section key if tag is a bare <strong>Label:</strong> marker"""
+    if tag.name != 'strong' or tag.attrs or len(tag.contents) != 1:
+        return None
+    label = tag.contents[0]
+    if type(label) is not NavigableString:
+        return None
+    return SOLUTION_SECTIONS.get(label.lower())
+
+def extract_solution_parts(solution_div):
+    """Extract strategy, expert insight, key facts, steps, HTML and text from solution
+
+    Single walk over the solution's descendants. A section's text runs from
+    its marker to the next bare <strong> or <ol> start tag, the same span
+    the old regex over decode_contents() captured, but read straight from
+    the tree instead of being serialized and re-parsed.
+    """
+    if not solution_div:
+        return {}, "", ""
+
+    solution_data = {
+        'strategy': '',
+        'expert_insight': '',
+        'key_facts': '',
+        'steps': []
+    }
+
+    sections = {}
+    active = None
+    marker = None
+    steps_ol = None
+
+    for node in solution_div.descendants:
+        if isinstance(node, Tag):
+            if node.name in ('strong', 'ol') and not node.attrs:
+                active = None
+
+            key = is_section_marker(node)
+            if key and key not in sections:
+                sections[key] = active = []
+                marker = node
+
+            if node.name == 'ol' and steps_ol is None:
+                steps_ol = node
+
+        elif active is not None and type(node) in TEXT_TYPES and node.parent is not marker:
+            text = node.strip()
+            if text:
+                active.append(text)
+
+    for key, parts in sections.items():
+        solution_data[key] = ''.join(parts)
+
+    # Extract Steps from ordered list
+    step_items = steps_ol.find_all('li', recursive=False) if steps_ol else []
+    solution_data['steps'] = [item.decode_contents().strip() for item in step_items]
+
+    # Build complete solution HTML
+    solution_html = f"""<div class="solution">
+<strong>Solution:</strong>
+<div class="strategy">
+<strong>Strategy:</strong> {solution_data['strategy']}
+</div>
+<div class="expert-insight">
+<strong>Expert Insight:</strong> {solution_data['expert_insight']}
+</div>
+<div class="key-facts">
+<strong>Key Facts Used:</strong> {solution_data['key_facts']}
+</div>
+<ol class="steps">
+"""
+
+    for step in solution_data['steps']:
+        solution_html += f"<li>{step}</li>\n"
+
+    solution_html += """</ol>
+</div>"""
+
+    # The section texts are spliced into solution_html unescaped, so only
+    # text without markup characters reads back as-is.
+    section_texts = [solution_data['strategy'], solution_data['expert_insight'], solution_data['key_facts']]
+    if any('<' in text or '&' in text for text in section_texts):
+        solution_text = BeautifulSoup(solution_html, 'html.parser').get_text(separator='\n', strip=True)
+    else:
+        lines = ['Solution:', 'Strategy:', section_texts[0], 'Expert Insight:', section_texts[1],
+                 'Key Facts Used:', section_texts[2]]
+        for item in step_items:
+            lines.extend(item.stripped_strings)
+        solution_text = '\n'.join(line for line in lines if line)
+
+    return solution_data, solution_html, solution_text
+
+def solution_sections(solution_div):
+    """Solution fields for exports with Strategy / Expert Insight / Key Facts sections"""
+    solution_parts, solution_html, solution_text = extract_solution_parts(solution_div)
+    return {
+        'strategy': solution_parts.get('strategy', ''),
+        'expert_insight': solution_parts.get('expert_insight', ''),
+        'key_facts': solution_parts.get('key_facts', ''),
+        'solution_html': solution_html,
+        'solution_text': solution_text
+    }
+
+def solution_contents(solution_div):
+    """Solution fields for exports whose solution is kept as-is"""
+    if not solution_div:
+        return {'solution_html': "", 'solution_text': ""}
+    return {
+        'solution_html': solution_div.decode_contents().strip(),
+        'solution_text': solution_div.get_text(separator='\n', strip=True)
+    }
+
+# Per-subject field specs. 'required' lists the block parts besides the
+# question number and div a record cannot do without.
+PHYSICS = {
+    'subject': 'Physics',
+    'required': ('options', 'answer'),
+    'hard_words': ('hard',),
+    'answer_pattern': re.compile(r'\b([ABCD])\b'),
+    'options': options_from_list,
+    'solution': solution_sections,
+    'progress_every': 10,
+    'output': 'physics_questions_with_solutions.json'
+}
+
+MATHEMATICS = {
+    'subject': 'Mathematics',
+    'required': (),
+    'hard_words': ('hard', 'advanced'),
+    'answer_pattern': re.compile(r'\(([a-d])\)|Answer:\s*\(([a-d])\)|([ABCD])\b', re.IGNORECASE),
+    'options': options_from_divs,
+    'solution': solution_contents,
+    'progress_every': 50,
+    'output': 'complete_math_questions.json'
+}
+
+SUBJECTS = {
+    'physics': PHYSICS,
+    'math': MATHEMATICS
+}
+
+def extract_question_block(start, state, spec):
+    """Build a question object from the siblings following an <hr>
+
+    Walks from ``start`` until the next <hr> sibling. ``state['chapter']``
+    carries the current chapter across blocks. Returns None when the block
+    lacks a part the spec requires.
+    """
+    current = start
+
+    # Collect all elements for this question
+    topic = None
+    subtopic = None
+    tags = []
+    question_type = None
+    difficulty = None
+    question_number = None
+    parts = {}
+
+    while current and current.name != 'hr':
+        if current.name == 'h2':
+            text = current.get_text()
+
+            # Check for Chapter
+            if text.startswith('Chapter:') or 'id="chapter-' in str(current):
+                state['chapter'] = text.replace('Chapter:', '').strip()
+                if not state['chapter']:
+                    # Try to extract from id
+                    chapter_id = current.get('id', '')
+                    if chapter_id.startswith('chapter-'):
+                        state['chapter'] = chapter_id.replace('chapter-', '').replace('-', ' ').title()
+
+            elif text.startswith('Topic:'):
+                topic = text.replace('Topic:', '').strip()
+
+            elif text.startswith('Subtopic:'):
+                subtopic = text.replace('Subtopic:', '').strip()
+
+            elif 'TAGS' in text:
+                tags = extract_tags(current)
+
+            elif text.startswith('TYPE:'):
+                question_type = text.replace('TYPE:', '').strip()
+
+            elif text.startswith('Difficulty:'):
+                difficulty = extract_difficulty(current, spec['hard_words'])
+
+        elif current.name == 'h3':
+            match = QUESTION_NUMBER.search(current.get_text())
+            if match:
+                question_number = int(match.group(1))
+
+        elif current.name == 'div':
+            classes = current.get('class', [])
+
+            for part in ('question', 'options', 'answer', 'solution'):
+                if part in classes:
+                    parts[part] = current
+                    break
+
+        current = current.next_sibling
+
+    question_div = parts.get('question')
+    if not (question_number and question_div) or not all(parts.get(part) for part in spec['required']):
+        return None
+
+    current_chapter = state['chapter']
+    subject = spec['subject']
+
+    # Create question ID
+    chapter_slug = current_chapter.replace(' ', '_').replace('and', '').replace(',', '') if current_chapter else subject
+
+    record = {
+        'id': f"{chapter_slug}_{question_number}",
+        'subject': subject,
+        'chapter': current_chapter or subject,
+        'topic': topic or '',
+        'subtopic': subtopic or '',
+        'tags': tags,
+        'type': question_type or 'Multiple Choice Single Answer',
+        'difficulty': difficulty or 'MEDIUM',
+        'question': question_div.get_text(strip=True),
+        'question_html': question_div.decode_contents().strip(),
+        'options': spec['options'](parts.get('options')),
+        'correct_answer': extract_correct_answer(parts.get('answer'), spec['answer_pattern'])
+    }
+    record.update(spec['solution'](parts.get('solution')))
+    return record
+
+def extract_questions_from_html(html_path, spec):
+    """Extract all questions from the HTML file"""
+    with open(html_path, 'r', encoding='utf-8') as f:
+        soup = BeautifulSoup(f.read(), 'html.parser')
+
+    questions = []
+
+    # Find all <hr> tags which separate questions
+    hrs = soup.find_all('hr')
+
+    print(f"Found {len(hrs)} question separators")
+
+    # Keep track of current chapter
+    state = {'chapter': None}
+
+    for idx, hr in enumerate(hrs):
+        try:
+            question_obj = extract_question_block(hr.next_sibling, state, spec)
+
+            if question_obj:
+                questions.append(question_obj)
+
+                if len(questions) % spec['progress_every'] == 0:
+                    print(f"Extracted {len(questions)} questions...")
+
+        except Exception as e:
+            print(f"Error processing question at index {idx}: {e}")
+            continue
+
+    return questions
+
+def extract_block_markup(markup, state, spec):
+    """Parse the markup of one <hr> block and build its question object"""
+    block = BeautifulSoup(markup, 'html.parser')
+    return extract_question_block(block.contents[0] if block.contents else None, state, spec)
+
+def iter_questions_from_html(html_path, spec, chunk_size=1 << 16):
+    """Stream question objects from the HTML file one <hr> block at a time
+
+    Yields the same records as extract_questions_from_html, but only ever
+    holds the markup of the blocks still open, so memory is bounded by the
+    largest question rather than by the file size.
+    """
+    state = {'chapter': None}
+    count = 0
+
+    for idx, markup in enumerate(iter_blocks(html_path, HrBlockSplitter(), chunk_size)):
+        question_obj = None
+        try:
+            question_obj = extract_block_markup(markup, state, spec)
+        except Exception as e:
+            print(f"Error processing question at index {idx}: {e}")
+
+        if question_obj:
+            count += 1
+            if count % spec['progress_every'] == 0:
+                print(f"Extracted {count} questions...")
+            yield question_obj
+
+def extract_questions_incremental(html_path, cache, spec):
+    """Extract questions, re-parsing only the <hr> blocks not in ``cache``"""
+    return cache.extract(html_path, lambda: iter_blocks(html_path, HrBlockSplitter()),
+                         partial(extract_block_markup, spec=spec), {'chapter': None})
+
+def extract_subject_file(subject, html_path):
+    """Extract one subject file, returning (subject, html_path, questions, seconds)"""
+    start = time.perf_counter()
+    questions = extract_questions_from_html(html_path, SUBJECTS[subject])
+    return subject, html_path, questions, time.perf_counter() - start
+
+def extract_subject_files(jobs, workers=1):
+    """Extract several (subject, html_path) jobs, in a process pool when workers > 1
+
+    Results come back in job order whichever worker finishes first.
+    """
+    subjects = [subject for subject, _ in jobs]
+    paths = [html_path for _, html_path in jobs]
+
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            return list(pool.map(extract_subject_file, subjects, paths))
+    return list(map(extract_subject_file, subjects, paths))
+
+def main():
+    parser = argparse.ArgumentParser(description='Extract several subject exports in one run')
+    parser.add_argument('jobs', nargs='+', metavar='SUBJECT=HTML',
+                        help=f"subject ({', '.join(SUBJECTS)}) and its export file")
+    parser.add_argument('--workers', type=int, default=0,
+                        help='files extracted in parallel (0 = one per CPU core)')
+    args = parser.parse_args()
+
+    jobs = []
+    for job in args.jobs:
+        subject, _, html_path = job.partition('=')
+        if subject not in SUBJECTS or not html_path:
+            parser.error(f"expected SUBJECT=HTML with SUBJECT in {', '.join(SUBJECTS)}: {job}")
+        if not os.path.exists(html_path):
+            print(f"❌ HTML file not found: {html_path}")
+            return
+        jobs.append((subject, html_path))
+
+    workers = args.workers or os.cpu_count() or 1
+    print(f"🔬 Extracting {len(jobs)} file{'s' if len(jobs) > 1 else ''} ({workers} workers)...\n")
+
+    start = time.perf_counter()
+    for subject, html_path, questions, elapsed in extract_subject_files(jobs, workers):
+        output_path = SUBJECTS[subject]['output']
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(questions, f, indent=2, ensure_ascii=False)
+        print(f"✅ {subject}: {len(questions)} questions from {html_path} in {elapsed:.2f}s → {output_path}")
+
+    print(f"\n⏱️  Done in {time.perf_counter() - start:.2f}s")
+
+if __name__ == '__main__':
+    main()
@@ -4,34 +4,21 @@ Fixed version: Extract only questions that are NOT in our database.
 Better comparison logic to properly identify existing questions.
 """
 
-import json
 import re
 from bs4 import BeautifulSoup
 from pathlib import Path
-from collections import defaultdict
-
-def normalize_text(text):
-    """Normalize text for comparison by removing extra whitespace and special chars"""
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
-    # Remove multiple spaces/newlines
-    text = re.sub(r'\s+', ' ', text)
-    # Remove special unicode characters
-    text = text.strip()
-    return text.lower()
+from collections import Counter, defaultdict
+
+from chapter_sharder import (DEFAULT_MAX_BYTES, render_chapter_section, render_toc_entry,
+                             shard_chapters, utf8_len)
+from dedup_index import DedupIndex
+from question_segmenter import default_segmenter
+from question_store import QuestionStore
 
 def load_existing_questions():
-    """Load existing questions from JSON file"""
-    json_path = Path('mcq_questions_with_solutions.json')
-    if json_path.exists():
-        with open(json_path, 'r', encoding='utf-8') as f:
-            questions = json.load(f)
-            # Normalize question texts for better matching
-            normalized = set()
-            for q in questions:
-                normalized.add(normalize_text(q['question']))
-            return normalized
-    return set()
+    """Build the dedup index over the existing questions, via the local question store"""
+    with QuestionStore() as store:
+        return DedupIndex.from_store(store)
 
 def extract_chapter_from_filename(filename):
     """Extract chapter name from filename"""
@@ -41,25 +28,17 @@ def extract_chapter_from_filename(filename):
     return chapter
 
 def is_question_in_database(question_text, existing_questions):
-    """Check if a question exists in database using normalized text"""
-    normalized = normalize_text(question_text)
-    # Check exact match
-    if normalized in existing_questions:
-        return True
-    # Check if normalized question text contains any existing question (or vice versa)
-    # This helps catch cases where extraction might have slightly different formatting
-    for existing in existing_questions:
-        if len(existing) > 50:  # Only check substantial questions
-            # If 80% of the existing question is in the new question
-            if existing in normalized or normalized in existing:
-                return True
-    return False
-
-def extract_questions_by_chapter(html_path, existing_questions):
+    """Check if a question exists in database: exact, containment or near-duplicate match"""
+    return existing_questions.is_duplicate(question_text)
+
+def extract_questions_by_chapter(html_path, existing_questions, segmenter=None):
     """Extract all questions grouped by chapter, excluding those in database"""
     with open(html_path, 'r', encoding='utf-8') as f:
         soup = BeautifulSoup(f.read(), 'html.parser')
 
+    segmenter = segmenter or default_segmenter()
+    pattern_counts = Counter()
+
     chapters = defaultdict(list)
     file_sections = soup.find_all('div', class_='file-section')
 
@@ -79,50 +58,13 @@ def extract_questions_by_chapter(html_path, existing_questions):
         # Remove the header div to get just the content
         header.decompose()
 
-        # Try to find individual questions
-        # Look for patterns like "Question 1:", "1.", numbered lists, etc.
+        # Find every question start in one scan and slice fragments by offset
         content_html = str(section)
+        pattern_name, questions_found = segmenter.segment(content_html)
 
-        # Try different question splitting patterns
-        question_patterns = [
-            r'<strong>(?:Question\s+\d+|Q\.\s*\d+|\d+\.)</strong>',
-            r'<p><strong>\d+\.</strong>',
-            r'<h3>Question\s+\d+</h3>',
-            r'<div[^>]*>\s*<strong>\d+\.</strong>'
-        ]
-
-        questions_found = []
-
-        for pattern in question_patterns:
-            parts = re.split(f'({pattern})', content_html, flags=re.IGNORECASE)
-            if len(parts) > 2:  # Found questions
-                # Reconstruct questions with their headers
-                for i in range(1, len(parts)-1, 2):
-                    if i+1 < len(parts):
-                        question_html = parts[i] + parts[i+1].split(pattern)[0]
-                        # Get next question header position
-                        next_match = None
-                        for p in question_patterns:
-                            next_match = re.search(p, parts[i+1], re.IGNORECASE)
-                            if next_match:
-                                question_html = parts[i] + parts[i+1][:next_match.start()]
-                                break
-
-                        if not next_match:
-                            question_html = parts[i] + parts[i+1]
-
-                        question_soup = BeautifulSoup(question_html, 'html.parser')
-                        question_text = question_soup.get_text().strip()
-
-                        # Skip if too short (probably not a real question)
-                        if len(question_text) > 30:
-                            questions_found.append({
-                                'html': question_html,
-                                'text': question_text
-                            })
-
-                if questions_found:
-                    break  # Found questions with this pattern, stop trying others
+        if pattern_name:
+            pattern_counts[pattern_name] += 1
+            print(f"  🔎 Split on '{pattern_name}' ({len(questions_found)} fragments)")
 
         # If no questions found with patterns, skip this section entirely
         if not questions_found:
@@ -145,25 +87,24 @@ def extract_questions_by_chapter(html_path, existing_questions):
 
         print()
 
-    return chapters
+    if pattern_counts:
+        print("🔎 Boundary patterns used:")
+        for name, count in pattern_counts.most_common():
+            print(f"  • {name}: {count} sections")
+        print()
 
-def distribute_chapters_to_files(chapters, num_files=4):
-    """Distribute chapters across files trying to balance question count"""
-    sorted_chapters = sorted(chapters.items(), key=lambda x: len(x[1]), reverse=True)
-    files = [{'chapters': [], 'count': 0} for _ in range(num_files)]
+    return chapters
 
-    for chapter, questions in sorted_chapters:
-        min_file = min(files, key=lambda f: f['count'])
-        min_file['chapters'].append((chapter, questions))
-        min_file['count'] += len(questions)
+def distribute_chapters_to_files(chapters, max_bytes=DEFAULT_MAX_BYTES):
+    """Pack chapters into as few files as fit ``max_bytes`` each, balancing rendered HTML size"""
+    # Page shell with room for the group number and stat counters to grow
+    page_overhead = utf8_len(render_grouped_page(0, [])) + 64
+    return shard_chapters(chapters, max_bytes, page_overhead)
 
-    return files
-
-def create_grouped_html(file_num, chapters_data, output_dir):
-    """Create HTML file with multiple chapters"""
+def render_grouped_page(file_num, chapters_data):
+    """HTML of a grouped page with multiple chapters"""
 
     total_questions = sum(len(questions) for _, questions in chapters_data)
-    chapter_list = [f"{chapter} ({len(questions)})" for chapter, questions in chapters_data]
 
     html_content = f"""<!DOCTYPE html>
 <html lang="en">
@@ -322,8 +263,7 @@ def create_grouped_html(file_num, chapters_data, output_dir):
 """
 
     for chapter, questions in chapters_data:
-        safe_id = re.sub(r'[^\w\s-]', '', chapter).strip().replace(' ', '_').lower()
-        html_content += f'            <li><a href="#{safe_id}">{chapter} ({len(questions)} questions)</a></li>\n'
+        html_content += render_toc_entry(chapter, questions)
 
     html_content += """        </ul>
     </div>
@@ -331,37 +271,23 @@ def create_grouped_html(file_num, chapters_data, output_dir):
 """
 
     for chapter, questions in chapters_data:
-        safe_id = re.sub(r'[^\w\s-]', '', chapter).strip().replace(' ', '_').lower()
-
-        html_content += f"""    <div class="chapter-section" id="{safe_id}">
-        <div class="chapter-header">
-            <h2>{chapter}</h2>
-            <div class="question-count">{len(questions)} Questions</div>
-        </div>
-
-"""
-
-        for i, q in enumerate(questions, 1):
-            html_content += f"""        <div class="question-block">
-            <div class="question-number">Question {i}</div>
-            <div class="question-content">
-{q['html']}
-            </div>
-        </div>
-
-"""
-
-        html_content += """    </div>
-
-"""
+        html_content += render_chapter_section(chapter, questions)
 
     html_content += """    <a href="#" class="back-to-top">↑ Back to Top</a>
 </body>
 </html>"""
 
+    return html_content
+
+def create_grouped_html(file_num, chapters_data, output_dir):
+    """Create HTML file with multiple chapters"""
+
+    total_questions = sum(len(questions) for _, questions in chapters_data)
+    chapter_list = [f"{chapter} ({len(questions)})" for chapter, questions in chapters_data]
+
     output_path = output_dir / f"missing_questions_group_{file_num}.html"
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        f.write(render_grouped_page(file_num, chapters_data))
 
     return output_path, chapter_list, total_questions
 
@@ -587,9 +513,9 @@ def main():
         print("✅ No new questions found. All questions are already in the database!")
         return
 
-    # Distribute chapters across 4 files
-    print("⚖️  Distributing chapters across 4 files...\n")
-    distributed_files = distribute_chapters_to_files(chapters, num_files=4)
+    # Pack chapters into byte-budgeted files
+    print(f"⚖️  Packing chapters into files of at most {DEFAULT_MAX_BYTES / 1024 / 1024:.1f} MB...\n")
+    distributed_files = distribute_chapters_to_files(chapters)
 
     # Create output directory
     output_dir = Path('/Users/Pramod/projects/iit-exams/maths/output')
@@ -615,7 +541,7 @@ def main():
             'chapter_list': chapter_list
         })
 
-        print(f"✅ Group {i}: {len(file_data['chapters'])} chapters, {question_count} questions")
+        print(f"✅ Group {i}: {len(file_data['chapters'])} chapters, {question_count} questions, {output_path.stat().st_size / 1024:.1f} KB")
         print(f"   → {output_path.name}\n")
 
     # Create main index
@@ -6,18 +6,17 @@ Fix all issues in problematic_physics_questions.html:
 3. Generate resolution report
 """
 
-from bs4 import BeautifulSoup
 import re
 
+from html_splice import SpliceWriter
+
 def fix_solution_mismatches():
     """Fix the 2 solution mismatch questions"""
 
     file_path = '/Users/Pramod/projects/iit-exams/jee-test-nextjs/problematic_physics_questions.html'
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    soup = BeautifulSoup(content, 'html.parser')
+    doc = SpliceWriter.open(file_path)
+    soup = doc.soup
 
     # Find all question cards with MISMATCH tag
     mismatch_cards = []
@@ -33,6 +32,8 @@ def fix_solution_mismatches():
     # Fix Question 1: Electromagnetism_167
     if len(mismatch_cards) >= 1:
         card1 = mismatch_cards[0]
+        # The resolution goes right after the card, which the mark also covers
+        doc.mark(card1)
         # Find the error div and replace with resolved message
         error_div = card1.find('div', class_='error')
         if error_div:
@@ -56,6 +57,7 @@ def fix_solution_mismatches():
     # Fix Question 2: Mechanics_83
     if len(mismatch_cards) >= 2:
         card2 = mismatch_cards[1]
+        doc.mark(card2)
         # Find the error div and replace with resolved message
         error_div = card2.find('div', class_='error')
         if error_div:
@@ -81,8 +83,7 @@ def fix_solution_mismatches():
             print("✅ Fixed Mechanics_83 - confirmed solution matches answer C")
 
     # Write back
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(str(soup.prettify()))
+    doc.write()
 
     return len(mismatch_cards)
 
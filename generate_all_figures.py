@@ -7,6 +7,8 @@ and embed them into the HTML file.
 from bs4 import BeautifulSoup
 import re
 
+from html_splice import SpliceWriter
+
 def create_capacitor_circuit_svg_1():
     """Circuit for Question 1: Capacitor network with switch"""
     return '''<svg width="600" height="300" xmlns="http://www.w3.org/2000/svg">
@@ -278,10 +280,8 @@ def embed_figures_into_html():
 
     file_path = '/Users/Pramod/projects/iit-exams/jee-test-nextjs/problematic_physics_questions.html'
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    soup = BeautifulSoup(content, 'html.parser')
+    doc = SpliceWriter.open(file_path)
+    soup = doc.soup
 
     # Extract all missing figure cards
     missing_cards = extract_question_descriptions(soup)
@@ -319,6 +319,9 @@ def embed_figures_into_html():
         # Find the warning div and insert SVG after question text
         warning_div = card.find('div', class_='warning')
         if warning_div:
+            # Only the warning's source span is rewritten, with the figure in front of it
+            doc.mark(warning_div)
+
             # Create figure container
             figure_div = soup.new_tag('div')
             figure_div['class'] = 'figure-container'
@@ -343,8 +346,7 @@ def embed_figures_into_html():
             print(f"  ✅ Added {fig_type} for Question {i} ({qid})")
 
     # Write back
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(str(soup.prettify()))
+    doc.write()
 
     return figures_added
 
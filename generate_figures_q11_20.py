@@ -3,7 +3,7 @@
 Generate detailed SVG figures for questions 11-20 in problematic_physics_questions.html
 """
 
-from bs4 import BeautifulSoup
+from html_transforms import TransformPipeline, detailed_figures
 
 def create_q11_rectangular_array():
     """Q11: Rectangular array of 6 charged particles"""
@@ -818,51 +818,26 @@ def create_q20_carnot_system():
 </svg>'''
 
 
+SVG_GENERATORS = {
+    11: create_q11_rectangular_array,
+    12: create_q12_dipole_electron,
+    13: create_q13_electron_proton_plates,
+    14: create_q14_bee_pollen,
+    15: create_q15_quarter_disk,
+    16: create_q16_work_charges_angles,
+    17: create_q17_energy_graph,
+    18: create_q18_square_four_charges,
+    19: create_q19_spherical_cavity,
+    20: create_q20_carnot_system,
+}
+
 # Main execution
 def main():
     print("Generating detailed SVG figures for questions 11-20...")
 
-    with open('problematic_physics_questions.html', 'r', encoding='utf-8') as f:
-        soup = BeautifulSoup(f.read(), 'html.parser')
-
-    questions = soup.find_all('div', class_='question-card')
-
-    # Map of SVG generators
-    svg_generators = {
-        11: create_q11_rectangular_array,
-        12: create_q12_dipole_electron,
-        13: create_q13_electron_proton_plates,
-        14: create_q14_bee_pollen,
-        15: create_q15_quarter_disk,
-        16: create_q16_work_charges_angles,
-        17: create_q17_energy_graph,
-        18: create_q18_square_four_charges,
-        19: create_q19_spherical_cavity,
-        20: create_q20_carnot_system,
-    }
-
-    count = 0
-    for i in range(11, 21):
-        if i <= len(questions):
-            q = questions[i-1]
-            q_text_div = q.find('div', class_='question-text')
-
-            if q_text_div:
-                # Remove old placeholder if exists
-                old_svg = q_text_div.find('svg')
-                if old_svg:
-                    old_svg.decompose()
-
-                # Generate and insert new detailed SVG
-                svg_content = svg_generators[i]()
-                svg_soup = BeautifulSoup(svg_content, 'html.parser')
-                q_text_div.insert(0, svg_soup)
-                count += 1
-                print(f"✓ Added detailed SVG for Question {i}")
-
-    # Save modified HTML
-    with open('problematic_physics_questions.html', 'w', encoding='utf-8') as f:
-        f.write(str(soup))
+    pipeline = TransformPipeline('problematic_physics_questions.html')
+    pipeline.register('detailed-figures', detailed_figures(SVG_GENERATORS))
+    count = pipeline.run()['changes']['detailed-figures']
 
     print(f"\n✅ Successfully added {count} detailed SVG figures (Q11-Q20)")
     print("Saved to problematic_physics_questions.html")
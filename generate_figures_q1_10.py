@@ -3,7 +3,7 @@
 Generate detailed SVG figures for questions 1-10 in problematic_physics_questions.html
 """
 
-from bs4 import BeautifulSoup
+from html_transforms import TransformPipeline, detailed_figures
 import re
 
 def create_q1_capacitor_circuit():
@@ -767,51 +767,26 @@ def create_q10_work_charges():
 </svg>'''
 
 
+SVG_GENERATORS = {
+    1: create_q1_capacitor_circuit,
+    2: create_q2_capacitor_graph,
+    3: create_q3_parallel_plate_dielectric,
+    4: create_q4_parallel_plate_dielectric_v2,
+    5: create_q5_variable_capacitor_graph,
+    6: create_q6_switches_circuit,
+    7: create_q7_two_spheres,
+    8: create_q8_three_particle_energy,
+    9: create_q9_semi_infinite_rod,
+    10: create_q10_work_charges,
+}
+
 # Main execution
 def main():
     print("Generating detailed SVG figures for questions 1-10...")
 
-    with open('problematic_physics_questions.html', 'r', encoding='utf-8') as f:
-        soup = BeautifulSoup(f.read(), 'html.parser')
-
-    questions = soup.find_all('div', class_='question-card')
-
-    # Map of SVG generators
-    svg_generators = {
-        1: create_q1_capacitor_circuit,
-        2: create_q2_capacitor_graph,
-        3: create_q3_parallel_plate_dielectric,
-        4: create_q4_parallel_plate_dielectric_v2,
-        5: create_q5_variable_capacitor_graph,
-        6: create_q6_switches_circuit,
-        7: create_q7_two_spheres,
-        8: create_q8_three_particle_energy,
-        9: create_q9_semi_infinite_rod,
-        10: create_q10_work_charges,
-    }
-
-    count = 0
-    for i in range(1, 11):
-        if i <= len(questions):
-            q = questions[i-1]
-            q_text_div = q.find('div', class_='question-text')
-
-            if q_text_div:
-                # Remove old placeholder if exists
-                old_svg = q_text_div.find('svg')
-                if old_svg:
-                    old_svg.decompose()
-
-                # Generate and insert new detailed SVG
-                svg_content = svg_generators[i]()
-                svg_soup = BeautifulSoup(svg_content, 'html.parser')
-                q_text_div.insert(0, svg_soup)
-                count += 1
-                print(f"✓ Added detailed SVG for Question {i}")
-
-    # Save modified HTML
-    with open('problematic_physics_questions.html', 'w', encoding='utf-8') as f:
-        f.write(str(soup))
+    pipeline = TransformPipeline('problematic_physics_questions.html')
+    pipeline.register('detailed-figures', detailed_figures(SVG_GENERATORS))
+    count = pipeline.run()['changes']['detailed-figures']
 
     print(f"\n✅ Successfully added {count} detailed SVG figures (Q1-Q10)")
     print("Saved to problematic_physics_questions.html")
@@ -4,7 +4,7 @@ Generate detailed SVG figures for questions 21-30 in problematic_physics_questio
 These are mostly mechanics problems: pulleys, stress-strain, equilibrium, torque
 """
 
-from bs4 import BeautifulSoup
+from html_transforms import TransformPipeline, detailed_figures
 
 def create_q21_pulley_forearm():
     """Q21: Pulley system with forearm at angle"""
@@ -382,51 +382,26 @@ def create_q30_beam_tension():
 </svg>'''
 
 
+SVG_GENERATORS = {
+    21: create_q21_pulley_forearm,
+    22: create_q22_stress_strain_spider,
+    23: create_q23_crate_ramp_tip,
+    24: create_q24_crate_ramp_duplicate,
+    25: create_q25_pulley_forearm_duplicate,
+    26: create_q26_pulley_forearm_duplicate2,
+    27: create_q27_stress_strain_duplicate,
+    28: create_q28_stress_strain_duplicate2,
+    29: create_q29_crate_ramp_duplicate2,
+    30: create_q30_beam_tension,
+}
+
 # Main execution
 def main():
     print("Generating detailed SVG figures for questions 21-30...")
 
-    with open('problematic_physics_questions.html', 'r', encoding='utf-8') as f:
-        soup = BeautifulSoup(f.read(), 'html.parser')
-
-    questions = soup.find_all('div', class_='question-card')
-
-    # Map of SVG generators
-    svg_generators = {
-        21: create_q21_pulley_forearm,
-        22: create_q22_stress_strain_spider,
-        23: create_q23_crate_ramp_tip,
-        24: create_q24_crate_ramp_duplicate,
-        25: create_q25_pulley_forearm_duplicate,
-        26: create_q26_pulley_forearm_duplicate2,
-        27: create_q27_stress_strain_duplicate,
-        28: create_q28_stress_strain_duplicate2,
-        29: create_q29_crate_ramp_duplicate2,
-        30: create_q30_beam_tension,
-    }
-
-    count = 0
-    for i in range(21, 31):
-        if i <= len(questions):
-            q = questions[i-1]
-            q_text_div = q.find('div', class_='question-text')
-
-            if q_text_div:
-                # Remove old placeholder if exists
-                old_svg = q_text_div.find('svg')
-                if old_svg:
-                    old_svg.decompose()
-
-                # Generate and insert new detailed SVG
-                svg_content = svg_generators[i]()
-                svg_soup = BeautifulSoup(svg_content, 'html.parser')
-                q_text_div.insert(0, svg_soup)
-                count += 1
-                print(f"✓ Added detailed SVG for Question {i}")
-
-    # Save modified HTML
-    with open('problematic_physics_questions.html', 'w', encoding='utf-8') as f:
-        f.write(str(soup))
+    pipeline = TransformPipeline('problematic_physics_questions.html')
+    pipeline.register('detailed-figures', detailed_figures(SVG_GENERATORS))
+    count = pipeline.run()['changes']['detailed-figures']
 
     print(f"\n✅ Successfully added {count} detailed SVG figures (Q21-Q30)")
     print("Saved to problematic_physics_questions.html")
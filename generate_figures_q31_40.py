@@ -4,7 +4,7 @@ Generate detailed SVG figures for questions 31-40 in problematic_physics_questio
 These include: half-circle rod, cube diagonal, semi-infinite rod, concentric rings, charged ring, quadrupole
 """
 
-from bs4 import BeautifulSoup
+from html_transforms import TransformPipeline, detailed_figures
 
 def create_q31_halfcircle_rod():
     """Q31: Half-circle rod with charge Q, field at center"""
@@ -506,51 +506,26 @@ def create_q40_halfcircle_duplicate():
     return create_q31_halfcircle_rod()
 
 
+SVG_GENERATORS = {
+    31: create_q31_halfcircle_rod,
+    32: create_q32_cube_diagonal,
+    33: create_q33_semiinfinite_rod,
+    34: create_q34_concentric_rings,
+    35: create_q35_complete_circle,
+    36: create_q36_quadrupole,
+    37: create_q37_cube_diagonal_duplicate,
+    38: create_q38_concentric_rings_duplicate,
+    39: create_q39_complete_circle_duplicate,
+    40: create_q40_halfcircle_duplicate,
+}
+
 # Main execution
 def main():
     print("Generating detailed SVG figures for questions 31-40...")
 
-    with open('problematic_physics_questions.html', 'r', encoding='utf-8') as f:
-        soup = BeautifulSoup(f.read(), 'html.parser')
-
-    questions = soup.find_all('div', class_='question-card')
-
-    # Map of SVG generators
-    svg_generators = {
-        31: create_q31_halfcircle_rod,
-        32: create_q32_cube_diagonal,
-        33: create_q33_semiinfinite_rod,
-        34: create_q34_concentric_rings,
-        35: create_q35_complete_circle,
-        36: create_q36_quadrupole,
-        37: create_q37_cube_diagonal_duplicate,
-        38: create_q38_concentric_rings_duplicate,
-        39: create_q39_complete_circle_duplicate,
-        40: create_q40_halfcircle_duplicate,
-    }
-
-    count = 0
-    for i in range(31, 41):
-        if i <= len(questions):
-            q = questions[i-1]
-            q_text_div = q.find('div', class_='question-text')
-
-            if q_text_div:
-                # Remove old placeholder if exists
-                old_svg = q_text_div.find('svg')
-                if old_svg:
-                    old_svg.decompose()
-
-                # Generate and insert new detailed SVG
-                svg_content = svg_generators[i]()
-                svg_soup = BeautifulSoup(svg_content, 'html.parser')
-                q_text_div.insert(0, svg_soup)
-                count += 1
-                print(f"✓ Added detailed SVG for Question {i}")
-
-    # Save modified HTML
-    with open('problematic_physics_questions.html', 'w', encoding='utf-8') as f:
-        f.write(str(soup))
+    pipeline = TransformPipeline('problematic_physics_questions.html')
+    pipeline.register('detailed-figures', detailed_figures(SVG_GENERATORS))
+    count = pipeline.run()['changes']['detailed-figures']
 
     print(f"\n✅ Successfully added {count} detailed SVG figures (Q31-Q40)")
     print("Saved to problematic_physics_questions.html")
@@ -4,7 +4,7 @@ Generate detailed SVG figures for questions 41-50 in problematic_physics_questio
 Mixed problems: projectile motion, gravitation, mechanics
 """
 
-from bs4 import BeautifulSoup
+from html_transforms import TransformPipeline, detailed_figures
 
 def create_q41_quadrupole_duplicate():
     """Q41: Same as Q36"""
@@ -677,51 +677,26 @@ def create_q50_spinning_wheel_arrow():
 </svg>'''
 
 
+SVG_GENERATORS = {
+    41: create_q41_quadrupole_duplicate,
+    42: create_q42_projectile_graph,
+    43: create_q43_projectile_duplicate,
+    44: create_q44_semiinfinite_duplicate,
+    45: create_q45_particle_potential_energy,
+    46: create_q46_three_spheres_work,
+    47: create_q47_hollow_sphere_gravity,
+    48: create_q48_cylinder_rolling,
+    49: create_q49_bowling_ball,
+    50: create_q50_spinning_wheel_arrow,
+}
+
 # Main execution
 def main():
     print("Generating detailed SVG figures for questions 41-50...")
 
-    with open('problematic_physics_questions.html', 'r', encoding='utf-8') as f:
-        soup = BeautifulSoup(f.read(), 'html.parser')
-
-    questions = soup.find_all('div', class_='question-card')
-
-    # Map of SVG generators
-    svg_generators = {
-        41: create_q41_quadrupole_duplicate,
-        42: create_q42_projectile_graph,
-        43: create_q43_projectile_duplicate,
-        44: create_q44_semiinfinite_duplicate,
-        45: create_q45_particle_potential_energy,
-        46: create_q46_three_spheres_work,
-        47: create_q47_hollow_sphere_gravity,
-        48: create_q48_cylinder_rolling,
-        49: create_q49_bowling_ball,
-        50: create_q50_spinning_wheel_arrow,
-    }
-
-    count = 0
-    for i in range(41, 51):
-        if i <= len(questions):
-            q = questions[i-1]
-            q_text_div = q.find('div', class_='question-text')
-
-            if q_text_div:
-                # Remove old placeholder if exists
-                old_svg = q_text_div.find('svg')
-                if old_svg:
-                    old_svg.decompose()
-
-                # Generate and insert new detailed SVG
-                svg_content = svg_generators[i]()
-                svg_soup = BeautifulSoup(svg_content, 'html.parser')
-                q_text_div.insert(0, svg_soup)
-                count += 1
-                print(f"✓ Added detailed SVG for Question {i}")
-
-    # Save modified HTML
-    with open('problematic_physics_questions.html', 'w', encoding='utf-8') as f:
-        f.write(str(soup))
+    pipeline = TransformPipeline('problematic_physics_questions.html')
+    pipeline.register('detailed-figures', detailed_figures(SVG_GENERATORS))
+    count = pipeline.run()['changes']['detailed-figures']
 
     print(f"\n✅ Successfully added {count} detailed SVG figures (Q41-Q50)")
     print("Saved to problematic_physics_questions.html")
@@ -4,7 +4,7 @@ Generate detailed SVG figures for questions 51-60 in problematic_physics_questio
 Final batch: rotational mechanics, waves, and particle systems
 """
 
-from bs4 import BeautifulSoup
+from html_transforms import TransformPipeline, detailed_figures
 
 def create_q51_hoop_rod_assembly():
     """Q51: Hoop and rod assembly rotating"""
@@ -652,51 +652,26 @@ def create_q60_rod_particle_collision():
 </svg>'''
 
 
+SVG_GENERATORS = {
+    51: create_q51_hoop_rod_assembly,
+    52: create_q52_judo_sweep,
+    53: create_q53_disk_rotation,
+    54: create_q54_ball_loop,
+    55: create_q55_two_strings,
+    56: create_q56_two_strings_duplicate,
+    57: create_q57_two_strings_duplicate2,
+    58: create_q58_body_armor,
+    59: create_q59_three_charges_equilibrium,
+    60: create_q60_rod_particle_collision,
+}
+
 # Main execution
 def main():
     print("Generating detailed SVG figures for questions 51-60...")
 
-    with open('problematic_physics_questions.html', 'r', encoding='utf-8') as f:
-        soup = BeautifulSoup(f.read(), 'html.parser')
-
-    questions = soup.find_all('div', class_='question-card')
-
-    # Map of SVG generators
-    svg_generators = {
-        51: create_q51_hoop_rod_assembly,
-        52: create_q52_judo_sweep,
-        53: create_q53_disk_rotation,
-        54: create_q54_ball_loop,
-        55: create_q55_two_strings,
-        56: create_q56_two_strings_duplicate,
-        57: create_q57_two_strings_duplicate2,
-        58: create_q58_body_armor,
-        59: create_q59_three_charges_equilibrium,
-        60: create_q60_rod_particle_collision,
-    }
-
-    count = 0
-    for i in range(51, 61):
-        if i <= len(questions):
-            q = questions[i-1]
-            q_text_div = q.find('div', class_='question-text')
-
-            if q_text_div:
-                # Remove old placeholder if exists
-                old_svg = q_text_div.find('svg')
-                if old_svg:
-                    old_svg.decompose()
-
-                # Generate and insert new detailed SVG
-                svg_content = svg_generators[i]()
-                svg_soup = BeautifulSoup(svg_content, 'html.parser')
-                q_text_div.insert(0, svg_soup)
-                count += 1
-                print(f"✓ Added detailed SVG for Question {i}")
-
-    # Save modified HTML
-    with open('problematic_physics_questions.html', 'w', encoding='utf-8') as f:
-        f.write(str(soup))
+    pipeline = TransformPipeline('problematic_physics_questions.html')
+    pipeline.register('detailed-figures', detailed_figures(SVG_GENERATORS))
+    count = pipeline.run()['changes']['detailed-figures']
 
     print(f"\n✅ Successfully added {count} detailed SVG figures (Q51-Q60)")
     print("Saved to problematic_physics_questions.html")
@@ -3,7 +3,7 @@
 Generate separate HTML reports for Mathematics and Physics excluded questions
 """
 
-import json
+from question_store import QuestionStore
 
 def generate_math_html(math_excluded):
     """Generate HTML report for Mathematics excluded questions"""
@@ -808,12 +808,11 @@ def generate_physics_html(physics_excluded):
 if __name__ == '__main__':
     print("🔍 Generating separate HTML reports...\n")
 
-    # Load excluded questions from JSON
-    with open('excluded_questions_detailed.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    math_excluded = data['mathematics']
-    physics_excluded = data['physics']
+    # Load excluded questions through the local question store
+    with QuestionStore() as store:
+        store.load(['excluded_questions_detailed.json'])
+        math_excluded = list(store.find(source='excluded_questions_detailed', subject='Mathematics'))
+        physics_excluded = list(store.find(source='excluded_questions_detailed', subject='Physics'))
 
     # Generate Mathematics HTML
     print(f"📐 Generating Mathematics report ({len(math_excluded)} questions)...")
@@ -1,22 +1,23 @@
 #!/usr/bin/env python3
 """
-Group missing questions into 4 balanced files, keeping chapters together.
+Group missing questions into files of at most a size budget, keeping chapters together.
+The number of files follows from the budget (chapter_sharder.DEFAULT_MAX_BYTES).
 """
 
-import json
 import re
 from bs4 import BeautifulSoup
 from pathlib import Path
 from collections import defaultdict
 
+from chapter_sharder import (DEFAULT_MAX_BYTES, render_chapter_section, render_toc_entry,
+                             shard_chapters, utf8_len)
+from dedup_index import DedupIndex
+from question_store import QuestionStore
+
 def load_existing_questions():
-    """Load existing questions from JSON file"""
-    json_path = Path('mcq_questions_with_solutions.json')
-    if json_path.exists():
-        with open(json_path, 'r', encoding='utf-8') as f:
-            questions = json.load(f)
-            return {q['question'].strip() for q in questions}
-    return set()
+    """Build the dedup index over the existing questions, via the local question store"""
+    with QuestionStore() as store:
+        return DedupIndex.from_store(store)
 
 def extract_chapter_from_filename(filename):
     """Extract chapter name from filename"""
@@ -52,14 +53,16 @@ def extract_questions_by_chapter(html_path, existing_questions):
                 question_html = f'<strong>Question {i}</strong>' + part.split('<strong>')[0]
                 question_text = BeautifulSoup(question_html, 'html.parser').get_text().strip()
 
-                if question_text not in existing_questions:
+                if not existing_questions.is_duplicate(question_text):
                     chapters[chapter].append({
                         'html': question_html,
                         'text': question_text
                     })
         else:
             section_text = section.get_text().strip()
-            if section_text and section_text not in existing_questions:
+            # A whole section holds several questions: containing one existing
+            # question doesn't make the rest duplicates
+            if section_text and not existing_questions.is_exact_duplicate(section_text):
                 content_div = section.find_all(recursive=False)
                 if len(content_div) > 1:
                     chapters[chapter].append({
@@ -69,28 +72,16 @@ def extract_questions_by_chapter(html_path, existing_questions):
 
     return chapters
 
-def distribute_chapters_to_files(chapters, num_files=4):
-    """Distribute chapters across files trying to balance question count"""
-    # Sort chapters by number of questions (largest first)
-    sorted_chapters = sorted(chapters.items(), key=lambda x: len(x[1]), reverse=True)
-
-    # Initialize file buckets
-    files = [{'chapters': [], 'count': 0} for _ in range(num_files)]
+def distribute_chapters_to_files(chapters, max_bytes=DEFAULT_MAX_BYTES):
+    """Pack chapters into as few files as fit ``max_bytes`` each, balancing rendered HTML size"""
+    # Page shell with room for the group number and stat counters to grow
+    page_overhead = utf8_len(render_grouped_page(0, [])) + 64
+    return shard_chapters(chapters, max_bytes, page_overhead)
 
-    # Greedy algorithm: assign each chapter to the file with fewest questions
-    for chapter, questions in sorted_chapters:
-        # Find file with minimum questions
-        min_file = min(files, key=lambda f: f['count'])
-        min_file['chapters'].append((chapter, questions))
-        min_file['count'] += len(questions)
-
-    return files
-
-def create_grouped_html(file_num, chapters_data, output_dir):
-    """Create HTML file with multiple chapters"""
+def render_grouped_page(file_num, chapters_data):
+    """HTML of a grouped page with multiple chapters"""
 
     total_questions = sum(len(questions) for _, questions in chapters_data)
-    chapter_list = [f"{chapter} ({len(questions)})" for chapter, questions in chapters_data]
 
     html_content = f"""<!DOCTYPE html>
 <html lang="en">
@@ -253,8 +244,7 @@ def create_grouped_html(file_num, chapters_data, output_dir):
 
     # Add TOC entries
     for chapter, questions in chapters_data:
-        safe_id = re.sub(r'[^\w\s-]', '', chapter).strip().replace(' ', '_').lower()
-        html_content += f'            <li><a href="#{safe_id}">{chapter} ({len(questions)} questions)</a></li>\n'
+        html_content += render_toc_entry(chapter, questions)
 
     html_content += """        </ul>
     </div>
@@ -263,42 +253,28 @@ def create_grouped_html(file_num, chapters_data, output_dir):
 
     # Add chapter sections
     for chapter, questions in chapters_data:
-        safe_id = re.sub(r'[^\w\s-]', '', chapter).strip().replace(' ', '_').lower()
-
-        html_content += f"""    <div class="chapter-section" id="{safe_id}">
-        <div class="chapter-header">
-            <h2>{chapter}</h2>
-            <div class="question-count">{len(questions)} Questions</div>
-        </div>
-
-"""
-
-        for i, q in enumerate(questions, 1):
-            html_content += f"""        <div class="question-block">
-            <div class="question-number">Question {i}</div>
-            <div class="question-content">
-{q['html']}
-            </div>
-        </div>
-
-"""
-
-        html_content += """    </div>
-
-"""
+        html_content += render_chapter_section(chapter, questions)
 
     html_content += """    <a href="#" class="back-to-top">↑ Back to Top</a>
 </body>
 </html>"""
 
+    return html_content
+
+def create_grouped_html(file_num, chapters_data, output_dir):
+    """Create HTML file with multiple chapters"""
+
+    total_questions = sum(len(questions) for _, questions in chapters_data)
+    chapter_list = [f"{chapter} ({len(questions)})" for chapter, questions in chapters_data]
+
     output_path = output_dir / f"missing_questions_group_{file_num}.html"
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        f.write(render_grouped_page(file_num, chapters_data))
 
     return output_path, chapter_list, total_questions
 
 def create_main_index(file_summaries, output_dir):
-    """Create main index linking to all 4 grouped files"""
+    """Create main index linking to all grouped files"""
 
     total_chapters = sum(fs['chapters'] for fs in file_summaries)
     total_questions = sum(fs['questions'] for fs in file_summaries)
@@ -442,7 +418,7 @@ def create_main_index(file_summaries, output_dir):
         <div class="subtitle">JEE Advanced Mathematics - Questions Not Yet in Database</div>
         <div class="stats">
             <div class="stat">
-                <div class="stat-number">4</div>
+                <div class="stat-number">{len(file_summaries)}</div>
                 <div class="stat-label">Groups</div>
             </div>
             <div class="stat">
@@ -499,7 +475,7 @@ def create_main_index(file_summaries, output_dir):
     return index_path
 
 def main():
-    print("🔍 Grouping missing questions into 4 balanced files...\n")
+    print("🔍 Grouping missing questions into size-balanced files...\n")
 
     # Load existing questions
     print("📖 Loading existing questions from database...")
@@ -514,9 +490,9 @@ def main():
     total_questions = sum(len(q) for q in chapters.values())
     print(f"📊 Found {total_questions} missing questions in {len(chapters)} chapters\n")
 
-    # Distribute chapters across 4 files
-    print("⚖️  Distributing chapters across 4 files...\n")
-    distributed_files = distribute_chapters_to_files(chapters, num_files=4)
+    # Pack chapters into byte-budgeted files
+    print(f"⚖️  Packing chapters into files of at most {DEFAULT_MAX_BYTES / 1024 / 1024:.1f} MB...\n")
+    distributed_files = distribute_chapters_to_files(chapters)
 
     # Create output directory
     output_dir = Path('/Users/Pramod/projects/iit-exams/maths/output')
@@ -539,7 +515,7 @@ def main():
             'chapter_list': chapter_list
         })
 
-        print(f"✅ Group {i}: {len(file_data['chapters'])} chapters, {question_count} questions")
+        print(f"✅ Group {i}: {len(file_data['chapters'])} chapters, {question_count} questions, {output_path.stat().st_size / 1024:.1f} KB")
         print(f"   → {output_path.name}")
         print(f"   Chapters: {', '.join([c.split(' (')[0] for c in chapter_list[:3]])}{'...' if len(chapter_list) > 3 else ''}\n")
 
@@ -548,7 +524,7 @@ def main():
     index_path = create_main_index(file_summaries, output_dir)
 
     print(f"\n{'='*70}")
-    print(f"✅ Complete! Created 4 grouped HTML files + index")
+    print(f"✅ Complete! Created {len(file_summaries)} grouped HTML files + index")
     print(f"📁 Output directory: {output_dir}")
     print(f"🌐 Open index.html to browse all groups")
     print(f"{'='*70}\n")
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Incremental HTML block splitters
+Cut a source page into the raw markup of its question blocks without
+building the whole document tree, so each block can be parsed (or looked
+up in a cache) on its own.
+"""
+
+from bs4.builder import HTMLTreeBuilder
+from collections import deque
+from html.parser import HTMLParser
+
+VOID_ELEMENTS = HTMLTreeBuilder.DEFAULT_EMPTY_ELEMENT_TAGS
+
+class BlockSplitter(HTMLParser):
+    """Base tokenizer that re-emits raw markup into the open blocks
+
+    Mirrors the nesting BeautifulSoup's html.parser builder would produce
+    (void elements, end tags popping to the nearest matching open tag)
+    without keeping the tree. Blocks are [depth, parts, closed] lists kept
+    in start order; closed blocks are released in that order via ``ready``,
+    and ``active`` holds the ones still collecting markup.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.stack = []
+        self.open_blocks = []
+        self.active = []
+        self.ready = deque()
+
+    def _write(self, markup):
+        for block in self.active:
+            block[1].append(markup)
+
+    def _open(self, depth):
+        block = [depth, [], False]
+        self.open_blocks.append(block)
+        self.active.append(block)
+        return block
+
+    def _close(self, block):
+        block[2] = True
+        self.active.remove(block)
+        while self.open_blocks and self.open_blocks[0][2]:
+            self.ready.append(''.join(self.open_blocks.pop(0)[1]))
+
+    def _pop(self, tag):
+        """Pop the stack up to the nearest open ``tag``; False if none is open"""
+        if tag not in self.stack:
+            return False
+        del self.stack[len(self.stack) - 1 - self.stack[::-1].index(tag):]
+        return True
+
+    def handle_data(self, data):
+        self._write(data)
+
+    def handle_entityref(self, name):
+        self._write(f'&{name};')
+
+    def handle_charref(self, name):
+        self._write(f'&#{name};')
+
+    def handle_comment(self, data):
+        self._write(f'<!--{data}-->')
+
+    def handle_decl(self, decl):
+        self._write(f'<!{decl}>')
+
+    def handle_pi(self, data):
+        self._write(f'<?{data}>')
+
+    def unknown_decl(self, data):
+        self._write(f'<![{data}]>')
+
+    def close(self):
+        super().close()
+        for block in list(self.active):
+            self._close(block)
+
+class HrBlockSplitter(BlockSplitter):
+    """Split into the siblings following each <hr>
+
+    A block closes at the next sibling <hr> or when its parent closes,
+    matching the ``hr.next_sibling`` walk over the full tree.
+    """
+
+    def handle_starttag(self, tag, attrs):
+        markup = self.get_starttag_text()
+        if tag == 'hr':
+            depth = len(self.stack)
+            for block in list(self.active):
+                if block[0] == depth:
+                    self._close(block)
+            self._write(markup)
+            self._open(depth)
+            return
+        self._write(markup)
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        if tag == 'hr':
+            self.handle_starttag(tag, attrs)
+        else:
+            self._write(self.get_starttag_text())
+
+    def handle_endtag(self, tag):
+        if self._pop(tag):
+            for block in list(self.active):
+                if block[0] > len(self.stack):
+                    self._close(block)
+        self._write(f'</{tag}>')
+
+class ElementBlockSplitter(BlockSplitter):
+    """Split out the outer markup of every ``<tag class="css_class">``
+
+    Blocks come out in document order, nested matches included, matching
+    ``soup.find_all(tag, class_=css_class)``.
+    """
+
+    def __init__(self, tag, css_class):
+        super().__init__()
+        self.tag = tag
+        self.css_class = css_class
+
+    def _matches(self, tag, attrs):
+        if tag != self.tag:
+            return False
+        classes = dict(attrs).get('class') or ''
+        return self.css_class in classes.split()
+
+    def handle_starttag(self, tag, attrs):
+        block = self._open(len(self.stack)) if self._matches(tag, attrs) else None
+        self._write(self.get_starttag_text())
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(tag)
+        elif block:
+            self._close(block)
+
+    def handle_startendtag(self, tag, attrs):
+        block = self._open(len(self.stack)) if self._matches(tag, attrs) else None
+        self._write(self.get_starttag_text())
+        if block:
+            self._close(block)
+
+    def handle_endtag(self, tag):
+        self._write(f'</{tag}>')
+        if self._pop(tag):
+            for block in list(self.active):
+                if block[0] >= len(self.stack):
+                    self._close(block)
+
+def iter_blocks(html_path, splitter, chunk_size=1 << 16):
+    """Feed the file through ``splitter`` and yield each block's markup as it closes"""
+    with open(html_path, 'r', encoding='utf-8') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if chunk:
+                splitter.feed(chunk)
+            else:
+                splitter.close()
+
+            while splitter.ready:
+                yield splitter.ready.popleft()
+
+            if not chunk:
+                break
@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+Minify and normalize exported question/solution HTML
+One pass over question_html, solution_html and HTML options against a
+tag/attribute allowlist:
+
+- whitespace runs collapse to one character (a newline if the run had one),
+  except in <pre>, <textarea>, inline SVG/MathML and elements whose class
+  the app styles with white-space: pre-wrap (.formula, app/styles.css)
+- style attributes are normalized (duplicate properties, spacing); with
+  --hoist-styles, styles repeated across the corpus are hoisted into
+  classes in a stylesheet, which the app must then load
+- comments, event handlers and attributes outside the allowlist are
+  dropped; tags outside it are unwrapped, keeping their text
+- empty inline and wrapper elements are dropped; an unwrapped or dropped
+  block element leaves a line break so its neighbours' text stays apart
+
+A fragment whose rendered text would change is kept as it was.
+
+    python3 html_minifier.py physics_questions_with_solutions.json out.json
+    python3 html_minifier.py physics_questions_with_solutions.json out.json --hoist-styles
+"""
+
+import argparse
+import hashlib
+import json
+import re
+from collections import Counter
+from html import unescape
+from html.parser import HTMLParser
+from pathlib import Path
+
+from question_writers import sidecar_path
+
+HTML_FIELDS = ('question_html', 'solution_html')
+PRESERVE_CLASSES = ('formula',)
+MIN_REPEATS = 2
+
+ALLOWED_TAGS = {
+    'a', 'abbr', 'b', 'blockquote', 'br', 'caption', 'code', 'col', 'colgroup', 'dd', 'del', 'div', 'dl',
+    'dt', 'em', 'figcaption', 'figure', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'hr', 'i', 'img', 'ins', 'kbd',
+    'li', 'mark', 'ol', 'p', 'pre', 'q', 's', 'samp', 'small', 'span', 'strong', 'sub', 'sup', 'table',
+    'tbody', 'td', 'tfoot', 'th', 'thead', 'tr', 'u', 'ul', 'var'
+}
+# Not rendered as text: removed with their content
+DROPPED_TAGS = {'script', 'style', 'noscript', 'template', 'iframe', 'object', 'embed'}
+# Copied verbatim: attribute case and whitespace matter there
+FOREIGN_TAGS = {'svg', 'math'}
+PRESERVE_TAGS = {'pre', 'textarea'}
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+DROP_WHEN_EMPTY = {
+    'b', 'code', 'del', 'div', 'em', 'i', 'ins', 'mark', 'p', 'q', 's', 'small', 'span', 'strong', 'sub',
+    'sup', 'u', 'var'
+}
+# Start a new line box: text on either side of one never runs together
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'caption', 'center', 'dd', 'details', 'dialog', 'dir',
+    'div', 'dl', 'dt', 'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5',
+    'h6', 'header', 'hgroup', 'hr', 'li', 'main', 'menu', 'nav', 'ol', 'p', 'pre', 'section', 'summary',
+    'table', 'tbody', 'td', 'tfoot', 'th', 'thead', 'tr', 'ul'
+}
+
+GLOBAL_ATTRS = {'class', 'style', 'id', 'title', 'lang', 'dir'}
+TAG_ATTRS = {
+    'a': {'href', 'target', 'rel'},
+    'img': {'src', 'alt', 'width', 'height', 'loading', 'decoding'},
+    'ol': {'type', 'start', 'reversed'},
+    'li': {'value'},
+    'td': {'colspan', 'rowspan'},
+    'th': {'colspan', 'rowspan', 'scope'},
+    'col': {'span'},
+    'colgroup': {'span'}
+}
+
+WHITESPACE = re.compile(r'[ \t\n\r\f]+')
+TAG_NAME = re.compile(r'<([^\s/>]+)')
+
+class Element:
+    __slots__ = ('tag', 'attrs', 'raw', 'children', 'closed')
+
+    def __init__(self, tag, attrs, raw, closed=False):
+        self.tag = tag
+        self.attrs = attrs
+        self.raw = raw
+        self.children = []
+        self.closed = closed
+
+class FragmentParser(HTMLParser):
+    """Build an Element tree of a fragment, keeping text and entities as written"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.root = Element(None, [], '')
+        self.stack = [self.root]
+        self.well_formed = True
+
+    def handle_starttag(self, tag, attrs):
+        node = Element(tag, attrs, self.get_starttag_text())
+        self.stack[-1].children.append(node)
+        if tag not in VOID_TAGS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        self.stack[-1].children.append(Element(tag, attrs, self.get_starttag_text(), closed=True))
+
+    def handle_endtag(self, tag):
+        if len(self.stack) > 1 and self.stack[-1].tag == tag:
+            self.stack.pop()
+        else:
+            self.well_formed = False
+
+    def handle_data(self, data):
+        self.stack[-1].children.append(data)
+
+    def handle_entityref(self, name):
+        self.stack[-1].children.append(f'&{name};')
+
+    def handle_charref(self, name):
+        self.stack[-1].children.append(f'&#{name};')
+
+    def handle_decl(self, decl):
+        self.well_formed = False
+
+    def handle_pi(self, data):
+        self.well_formed = False
+
+    def unknown_decl(self, data):
+        self.well_formed = False
+
+def parse_fragment(html):
+    """(root Element, well_formed) of an HTML fragment"""
+    parser = FragmentParser()
+    parser.feed(html)
+    parser.close()
+    return parser.root, parser.well_formed and len(parser.stack) == 1
+
+def rendered_text(node):
+    """Visible text of a tree, whitespace runs collapsed
+
+    Line breaks and block element boundaries count as whitespace, so text
+    from separate boxes can't silently run together.
+    """
+    parts = []
+
+    def walk(node):
+        for child in node.children:
+            if isinstance(child, str):
+                parts.append(child)
+            elif child.tag not in DROPPED_TAGS:
+                block = child.tag in BLOCK_TAGS
+                parts.append(' ' if block or child.tag == 'br' else '')
+                walk(child)
+                if block:
+                    parts.append(' ')
+
+    walk(node)
+    return ' '.join(unescape(''.join(parts)).split())
+
+def normalize_style(style):
+    """Style declarations with spacing normalized and repeated properties dropped"""
+    style = style.strip()
+    if 'url(' in style or '/*' in style:
+        # ';' may appear inside the value: leave it alone
+        return style
+    declarations = {}
+    for declaration in style.split(';'):
+        name, _, value = declaration.partition(':')
+        name = name.strip().lower()
+        value = ' '.join(value.split())
+        if name and value:
+            declarations.pop(name, None)
+            declarations[name] = value
+    return ';'.join(f'{name}:{value}' for name, value in declarations.items())
+
+def style_class(style):
+    return 'hs-' + hashlib.sha1(style.encode('utf-8')).hexdigest()[:6]
+
+def _collapse(match):
+    return '\n' if '\n' in match.group(0) or '\r' in match.group(0) else ' '
+
+def _escape_attr(value):
+    return value.replace('&', '&amp;').replace('"', '&quot;')
+
+def _raw(node):
+    """Serialize a subtree exactly as it was written"""
+    if node.closed:
+        return node.raw
+    inner = ''.join(child if isinstance(child, str) else _raw(child) for child in node.children)
+    if node.tag in VOID_TAGS:
+        return node.raw + inner
+    return f'{node.raw}{inner}</{TAG_NAME.match(node.raw).group(1)}>'
+
+class HtmlMinifier:
+    """Minify fragments; with ``hoist_styles``, call ``scan`` on every fragment first"""
+
+    def __init__(self, preserve_classes=PRESERVE_CLASSES, min_repeats=MIN_REPEATS, hoist_styles=False):
+        self.preserve_classes = set(preserve_classes)
+        self.min_repeats = min_repeats
+        self.hoist_styles = hoist_styles
+        self.style_counts = Counter()
+        self.hoisted = None
+        self.stats = Counter()
+
+    def scan(self, html):
+        """Count the inline styles of one fragment"""
+        if not self.hoist_styles or not html or '<' not in html:
+            return
+
+        def walk(node):
+            for child in node.children:
+                if isinstance(child, Element) and child.tag not in FOREIGN_TAGS:
+                    for name, value in child.attrs:
+                        if name == 'style' and value:
+                            style = normalize_style(value)
+                            if style:
+                                self.style_counts[style] += 1
+                    walk(child)
+
+        walk(parse_fragment(html)[0])
+
+    def _hoisted(self):
+        if self.hoisted is None:
+            self.hoisted = {style: style_class(style) for style, count in self.style_counts.items()
+                            if count >= self.min_repeats}
+        return self.hoisted
+
+    def stylesheet(self):
+        """CSS for the hoisted styles; !important keeps the priority they had inline"""
+        rules = []
+        for style, name in sorted(self._hoisted().items(), key=lambda item: item[1]):
+            declarations = ';'.join(d if d.endswith('!important') else f'{d}!important' for d in style.split(';'))
+            rules.append(f'.{name}{{{declarations}}}')
+        return '\n'.join(rules) + '\n' if rules else ''
+
+    def _attributes(self, node):
+        seen = set()
+        attrs = []
+        classes = []
+        allowed = TAG_ATTRS.get(node.tag, ())
+        for name, value in node.attrs:
+            if name in seen:
+                continue
+            seen.add(name)
+            if not (name in GLOBAL_ATTRS or name in allowed or name.startswith(('data-', 'aria-'))):
+                self.stats['attributes dropped'] += 1
+                continue
+            if name == 'class':
+                classes.extend((value or '').split())
+                continue
+            if name == 'style':
+                value = normalize_style(value or '')
+                if not value:
+                    continue
+                hoisted = self._hoisted().get(value)
+                if hoisted:
+                    classes.append(hoisted)
+                    self.stats['styles hoisted'] += 1
+                    continue
+            attrs.append((name, value))
+
+        if classes:
+            attrs.insert(0, ('class', ' '.join(dict.fromkeys(classes))))
+        return ''.join(f' {name}' if value is None else f' {name}="{_escape_attr(value)}"' for name, value in attrs)
+
+    def _render_children(self, node, preserve):
+        parts = []
+        for child in node.children:
+            if isinstance(child, str):
+                parts.append(child if preserve else WHITESPACE.sub(_collapse, child))
+            else:
+                parts.append(self._render_element(child, preserve))
+        return ''.join(parts)
+
+    def _render_element(self, node, preserve):
+        if node.tag in FOREIGN_TAGS:
+            return _raw(node)
+        if node.tag in DROPPED_TAGS:
+            self.stats['elements dropped'] += 1
+            return ''
+
+        attrs = dict(node.attrs)
+        keep_whitespace = (preserve or node.tag in PRESERVE_TAGS
+                           or not self.preserve_classes.isdisjoint((attrs.get('class') or '').split())
+                           or 'white-space' in (attrs.get('style') or ''))
+        inner = self._render_children(node, keep_whitespace)
+
+        if node.tag not in ALLOWED_TAGS:
+            self.stats['elements unwrapped'] += 1
+            # The block box is gone: keep its text off its neighbours' lines
+            return f'\n{inner}\n' if node.tag in BLOCK_TAGS else inner
+        if node.tag in VOID_TAGS:
+            return f'<{node.tag}{self._attributes(node)}>'
+        if node.tag in DROP_WHEN_EMPTY and 'id' not in attrs and not WHITESPACE.sub('', inner):
+            self.stats['empty elements dropped'] += 1
+            # Whitespace inside an inline element still separates words
+            if node.tag in BLOCK_TAGS:
+                return '\n'
+            return inner
+        return f'<{node.tag}{self._attributes(node)}>{inner}</{node.tag}>'
+
+    def minify(self, html):
+        """Minified fragment, or the fragment unchanged if it can't be done safely"""
+        if not html or '<' not in html:
+            return WHITESPACE.sub(_collapse, html) if html else html
+
+        root, well_formed = parse_fragment(html)
+        if not well_formed:
+            self.stats['kept (malformed)'] += 1
+            return html
+
+        minified = self._render_children(root, False)
+        if rendered_text(parse_fragment(minified)[0]) != rendered_text(root):
+            self.stats['kept (text changed)'] += 1
+            return html
+        return minified
+
+def iter_fragments(record, fields=HTML_FIELDS):
+    """(field, html) pairs of a record's HTML, options included when they are HTML"""
+    for field in fields:
+        if isinstance(record.get(field), str):
+            yield field, record[field]
+    # {letter: html} options are rendered as HTML; [{text: ...}] ones are plain text
+    options = record.get('options')
+    if isinstance(options, dict):
+        for value in options.values():
+            if isinstance(value, str):
+                yield 'options', value
+
+def minify_record(record, minifier, report, fields=HTML_FIELDS):
+    """Copy of ``record`` with its HTML minified; ``report`` tallies [before, after] bytes per field"""
+    record = dict(record)
+
+    def minify(field, html):
+        result = minifier.minify(html)
+        sizes = report.setdefault(field, [0, 0])
+        sizes[0] += len(html.encode('utf-8'))
+        sizes[1] += len(result.encode('utf-8'))
+        return result
+
+    for field in fields:
+        if isinstance(record.get(field), str):
+            record[field] = minify(field, record[field])
+    if isinstance(record.get('options'), dict):
+        record['options'] = {key: minify('options', value) if isinstance(value, str) else value
+                             for key, value in record['options'].items()}
+    return record
+
+def minify_questions(data, minifier=None, fields=HTML_FIELDS):
+    """Minify a question list or {topic: [questions]}; returns (data, per-field report)"""
+    minifier = minifier or HtmlMinifier()
+    groups = data.values() if isinstance(data, dict) else [data]
+    for questions in groups:
+        for q in questions:
+            for _, html in iter_fragments(q, fields):
+                minifier.scan(html)
+
+    report = {}
+    if isinstance(data, dict):
+        data = {topic: [minify_record(q, minifier, report, fields) for q in questions] for topic, questions in data.items()}
+    else:
+        data = [minify_record(q, minifier, report, fields) for q in data]
+    return data, report
+
+def print_report(report, minifier):
+    print("\n📉 Bytes saved per field:")
+    total_before = total_after = 0
+    for field, (before, after) in report.items():
+        total_before += before
+        total_after += after
+        saved = before - after
+        print(f"  • {field}: {before / 1024:.2f} KB → {after / 1024:.2f} KB "
+              f"(-{saved / 1024:.2f} KB, {saved / before * 100 if before else 0:.1f}%)")
+    saved = total_before - total_after
+    print(f"  • total: -{saved / 1024:.2f} KB ({saved / total_before * 100 if total_before else 0:.1f}%)")
+
+    if minifier.stats:
+        print("\n🧹 Changes:")
+        for name, count in sorted(minifier.stats.items()):
+            print(f"  • {name}: {count}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Minify the HTML fragments of a questions JSON file')
+    parser.add_argument('input', help='questions JSON: a list, or {topic: [questions]}')
+    parser.add_argument('output', help='where to write the minified JSON')
+    parser.add_argument('--hoist-styles', action='store_true',
+                        help='hoist repeated inline styles into classes; the app must load the stylesheet')
+    parser.add_argument('--css', help='stylesheet for hoisted styles (default: <output>.styles.css)')
+    parser.add_argument('--min-repeats', type=int, default=MIN_REPEATS,
+                        help='hoist a style into a class once it appears this many times')
+    parser.add_argument('--preserve-class', nargs='*', default=list(PRESERVE_CLASSES),
+                        help='classes styled white-space: pre-wrap, whose whitespace is kept')
+    args = parser.parse_args()
+
+    with open(args.input, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    minifier = HtmlMinifier(args.preserve_class, args.min_repeats, args.hoist_styles)
+    data, report = minify_questions(data, minifier)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    print(f"💾 Saved to: {args.output}")
+
+    stylesheet = minifier.stylesheet()
+    if stylesheet:
+        css_path = Path(args.css) if args.css else sidecar_path(args.output, 'styles').with_suffix('.css')
+        css_path.write_text(stylesheet, encoding='utf-8')
+        print(f"🎨 {len(minifier.hoisted)} hoisted styles → {css_path}")
+
+    print_report(report, minifier)
+
+if __name__ == '__main__':
+    main()
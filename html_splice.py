@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Minimal-diff writer for BeautifulSoup edits of a source HTML file
+Scripts mark a tag before changing it (or inserting next to it). On write
+only the source span of each marked tag is replaced with the new
+serialization of what now sits between its original neighbours; every
+other byte of the file is left exactly as it was, instead of re-indenting
+the whole document with soup.prettify().
+
+    doc = SpliceWriter.open('excluded_physics_questions.html')
+    for card in doc.soup.find_all('div', class_='question-card'):
+        doc.mark(card)
+        card.append(new_section)
+    doc.write()
+"""
+
+from html.parser import HTMLParser
+
+from bs4 import BeautifulSoup
+from bs4.builder import HTMLTreeBuilder
+
+class SourceSpans(HTMLParser):
+    """(line, column) of every start tag -> (start, end) offsets of its element
+
+    Mirrors how BeautifulSoup's html.parser builder nests tags: void
+    elements close immediately, an end tag closes the nearest open tag of
+    that name (and everything opened inside it), and stray end tags are
+    ignored.
+    """
+
+    def __init__(self, source):
+        super().__init__(convert_charrefs=False)
+        self.source = source
+        self.line_starts = [0]
+        position = source.find('\n')
+        while position != -1:
+            self.line_starts.append(position + 1)
+            position = source.find('\n', position + 1)
+        self.spans = {}
+        self.stack = []
+        self.feed(source)
+        self.close()
+        for key, start, _ in self.stack:
+            self.spans[key] = (start, len(source))
+
+    def source_offset(self):
+        line, column = self.getpos()
+        return self.line_starts[line - 1] + column
+
+    def handle_starttag(self, tag, attrs):
+        key = self.getpos()
+        start = self.source_offset()
+        if tag in HTMLTreeBuilder.DEFAULT_EMPTY_ELEMENT_TAGS:
+            self.spans[key] = (start, start + len(self.get_starttag_text()))
+        else:
+            self.stack.append((key, start, tag))
+
+    def handle_startendtag(self, tag, attrs):
+        start = self.source_offset()
+        self.spans[self.getpos()] = (start, start + len(self.get_starttag_text()))
+
+    def handle_endtag(self, tag):
+        if not any(name == tag for _, _, name in self.stack):
+            return
+        start = self.source_offset()
+        end = self.source.find('>', start) + 1
+        while self.stack:
+            key, open_start, name = self.stack.pop()
+            if name == tag:
+                self.spans[key] = (open_start, end)
+                break
+            # Left open: it ends where its ancestor's end tag starts
+            self.spans[key] = (open_start, start)
+
+class SpliceWriter:
+    """A parsed document that writes back only its marked subtrees"""
+
+    def __init__(self, source, path=None):
+        self.source = source
+        self.path = path
+        self.soup = BeautifulSoup(source, 'html.parser')
+        self.spans = None
+        self.marks = {}
+        self.spliceable = True
+
+    @classmethod
+    def open(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(f.read(), path)
+
+    def span(self, tag):
+        """(start, end) source offsets of a tag that came from the parse"""
+        if self.spans is None:
+            self.spans = SourceSpans(self.source).spans
+        return self.spans.get((tag.sourceline, tag.sourcepos))
+
+    def mark(self, tag):
+        """Record ``tag``'s place before it, its contents or its direct siblings change"""
+        if id(tag) in self.marks:
+            return
+        span = self.span(tag)
+        if span is None or str(BeautifulSoup(self.source[span[0]:span[1]], 'html.parser')) != str(tag):
+            # Can't locate it in the source exactly: fall back to a full write
+            self.spliceable = False
+            return
+        self.marks[id(tag)] = (span, tag.parent, tag.previous_sibling, tag.next_sibling)
+
+    def _replacement(self, parent, previous, following):
+        """Serialization of what now sits between a marked tag's original neighbours"""
+        for neighbour in (previous, following):
+            if neighbour is not None and neighbour.parent is not parent:
+                return None
+        node = previous.next_sibling if previous is not None else (parent.contents[0] if parent.contents else None)
+        pieces = []
+        while node is not None and node is not following:
+            pieces.append(str(node))
+            node = node.next_sibling
+        if following is not None and node is not following:
+            return None
+        return ''.join(pieces)
+
+    def render(self):
+        """The document with every marked span replaced, or None if it can't be spliced"""
+        if not self.spliceable:
+            return None
+        pieces = []
+        position = 0
+        for span, parent, previous, following in sorted(self.marks.values(), key=lambda m: (m[0][0], -m[0][1])):
+            start, end = span
+            if start < position:
+                # Inside an earlier mark, whose serialization already has it
+                continue
+            replacement = self._replacement(parent, previous, following)
+            if replacement is None:
+                return None
+            pieces.append(self.source[position:start])
+            pieces.append(replacement)
+            position = end
+        pieces.append(self.source[position:])
+        return ''.join(pieces)
+
+    def write(self, path=None):
+        """Write the document, splicing only the marked spans when possible
+
+        Returns True if it was spliced, False if the whole document had to be
+        serialized.
+        """
+        content = self.render()
+        spliced = content is not None
+        if not spliced:
+            print("⚠️  Could not splice the edits into the source; writing the whole document")
+            content = str(self.soup)
+        with open(path or self.path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return spliced
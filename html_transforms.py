@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Parse-once transform pipeline for problematic_physics_questions.html
+Registered transforms run in order over one BeautifulSoup tree, the
+verification checks run on the same in-memory tree, and the document is
+serialized and written once, so the whole cleanup chain costs one parse
+and one write instead of a parse, write and re-read per script.
+
+    python3 html_transforms.py                      # full cleanup chain
+    python3 html_transforms.py detailed-figures remove-placeholder-svgs
+    python3 html_transforms.py --dry-run
+"""
+
+import argparse
+import importlib
+
+from bs4 import BeautifulSoup
+
+DEFAULT_HTML = 'problematic_physics_questions.html'
+PLACEHOLDER_TEXT = 'Figure for Question'
+FIGURE_ADDED_TEXT = '✅ Figure Added:'
+ASCII_SPACES = ' \n\t\x0c\r'
+PRESERVE_WHITESPACE_TAGS = {'pre', 'textarea'}
+FIGURE_MODULES = [
+    'generate_figures_q1_10',
+    'generate_figures_q11_20',
+    'generate_figures_q21_30',
+    'generate_figures_q31_40',
+    'generate_figures_q41_50',
+    'generate_figures_q51_60'
+]
+
+class TransformPipeline:
+    """Ordered transforms and checks over one parse of an HTML file
+
+    A transform takes the soup, mutates it in place and returns how many
+    changes it made. A check takes the soup and returns (passed, message).
+    """
+
+    def __init__(self, path=DEFAULT_HTML):
+        self.path = path
+        self.transforms = []
+        self.checks = []
+
+    def register(self, name, transform):
+        """Append a transform to the chain"""
+        self.transforms.append((name, transform))
+        return self
+
+    def check(self, name, check):
+        """Add a verification check run after all transforms"""
+        self.checks.append((name, check))
+        return self
+
+    def run(self, write=True):
+        """Parse once, transform, verify, and write once if anything changed
+
+        Returns {'changes': {name: count}, 'checks': [(name, passed, message)], 'written': bool}.
+        """
+        with open(self.path, 'r', encoding='utf-8') as f:
+            soup = BeautifulSoup(f.read(), 'html.parser')
+
+        changes = {}
+        for i, (name, transform) in enumerate(self.transforms):
+            if i:
+                # Each transform sees the tree a re-parse of the previous output would give
+                normalize_strings(soup)
+            changes[name] = transform(soup)
+
+        checks = [(name, *check(soup)) for name, check in self.checks]
+
+        written = write and any(changes.values())
+        if written:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                f.write(str(soup))
+
+        return {'changes': changes, 'checks': checks, 'written': written}
+
+def normalize_strings(soup):
+    """Merge adjacent strings and collapse whitespace-only ones as html.parser does
+
+    Transforms that insert by child index depend on it: run on their own
+    they always see freshly parsed text nodes.
+    """
+    soup.smooth()
+    for string in soup.find_all(string=True):
+        if not string or string in ('\n', ' ') or string.strip(ASCII_SPACES):
+            continue
+        if any(parent.name in PRESERVE_WHITESPACE_TAGS for parent in string.parents):
+            continue
+        string.replace_with(type(string)('\n' if '\n' in string else ' '))
+
+def question_cards(soup):
+    return soup.find_all('div', class_='question-card')
+
+def text_count(soup, needle):
+    """Occurrences of ``needle`` in the document's text nodes"""
+    return sum(s.count(needle) for s in soup.find_all(string=True))
+
+def is_placeholder(svg):
+    return PLACEHOLDER_TEXT in svg.get_text()
+
+# Transforms
+
+def detailed_figures(generators):
+    """Transform putting ``generators[n]()`` first in question n's text, replacing its first SVG"""
+    def transform(soup):
+        questions = question_cards(soup)
+        count = 0
+        for i in sorted(generators):
+            if i > len(questions):
+                continue
+            q_text_div = questions[i - 1].find('div', class_='question-text')
+            if not q_text_div:
+                continue
+
+            # Remove old placeholder if exists
+            old_svg = q_text_div.find('svg')
+            if old_svg:
+                old_svg.decompose()
+
+            q_text_div.insert(0, BeautifulSoup(generators[i](), 'html.parser'))
+            count += 1
+            print(f"✓ Added detailed SVG for Question {i}")
+        return count
+    return transform
+
+def all_detailed_figures(soup):
+    """The detailed figures of every generate_figures_q*.py module"""
+    generators = {}
+    for module in FIGURE_MODULES:
+        generators.update(importlib.import_module(module).SVG_GENERATORS)
+    return detailed_figures(generators)(soup)
+
+def reposition_svgs(soup):
+    """Move a question's first (detailed) SVG to where its placeholder SVG sits"""
+    repositioned = 0
+    for i, q in enumerate(question_cards(soup), 1):
+        q_text_div = q.find('div', class_='question-text')
+        if not q_text_div:
+            continue
+
+        svgs = list(q_text_div.find_all('svg'))
+        if len(svgs) < 2 or not is_placeholder(svgs[1]):
+            continue
+
+        new_svg, old_placeholder_svg = svgs[0], svgs[1]
+        placeholder_parent = old_placeholder_svg.parent
+        placeholder_index = list(placeholder_parent.children).index(old_placeholder_svg)
+
+        new_svg.extract()
+        old_placeholder_svg.extract()
+
+        # Insert at the index the placeholder had, in the children left after extraction
+        children = list(placeholder_parent.children)
+        if placeholder_index < len(children):
+            children[placeholder_index].insert_before(new_svg)
+        else:
+            placeholder_parent.append(new_svg)
+
+        repositioned += 1
+        print(f"✓ Repositioned SVG for Question {i}")
+    return repositioned
+
+def remove_placeholder_svgs(soup):
+    """Drop the generated 'Figure for Question N' placeholder SVGs from question text"""
+    removed = 0
+    for i, q in enumerate(question_cards(soup), 1):
+        q_text_div = q.find('div', class_='question-text')
+        if not q_text_div:
+            continue
+        for svg in q_text_div.find_all('svg'):
+            svg_text = svg.get_text()
+            if PLACEHOLDER_TEXT in svg_text and 'Diagram based on textual description' in svg_text:
+                svg.decompose()
+                removed += 1
+                print(f"✓ Removed placeholder SVG from Question {i}")
+    return removed
+
+def remove_figure_containers(soup):
+    """Drop figure-container divs holding a placeholder SVG"""
+    removed = 0
+    for container in soup.find_all('div', class_='figure-container'):
+        svg = container.find('svg')
+        if svg and is_placeholder(svg):
+            container.decompose()
+            removed += 1
+    print(f"✓ Removed {removed} figure-container divs with placeholders")
+    return removed
+
+def remove_figure_added_messages(soup):
+    """Drop the '✅ Figure Added' notes generate_all_figures.py left in place of the warnings"""
+    removed = 0
+    for section in soup.find_all('div', class_='solution-section'):
+        text = section.get_text()
+        if FIGURE_ADDED_TEXT in text and 'diagram generated and embedded above' in text:
+            section.decompose()
+            removed += 1
+    print(f"✓ Removed {removed} 'Figure Added' message divs")
+    return removed
+
+def reposition_detailed_svgs(soup):
+    """Move a question's detailed SVG from the top of its text to just before the options"""
+    repositioned = 0
+    for i, q in enumerate(question_cards(soup), 1):
+        q_text_div = q.find('div', class_='question-text')
+        if not q_text_div:
+            continue
+
+        svg = q_text_div.find('svg')
+        if not svg or is_placeholder(svg) or not q_text_div.find('h4'):
+            continue
+
+        svg.extract()
+        options_div = q_text_div.parent.find('div', class_='options-section')
+        if options_div:
+            options_div.insert_before(svg)
+            print(f"✓ Repositioned SVG for Question {i}")
+        else:
+            q_text_div.append(svg)
+            print(f"✓ Repositioned SVG for Question {i} (no options found)")
+        repositioned += 1
+    return repositioned
+
+TRANSFORMS = {
+    'detailed-figures': all_detailed_figures,
+    'reposition-svgs': reposition_svgs,
+    'remove-placeholder-svgs': remove_placeholder_svgs,
+    'remove-figure-containers': remove_figure_containers,
+    'remove-figure-added-messages': remove_figure_added_messages,
+    'reposition-detailed-svgs': reposition_detailed_svgs
+}
+
+CLEANUP_CHAIN = [
+    'reposition-svgs',
+    'remove-placeholder-svgs',
+    'remove-figure-containers',
+    'remove-figure-added-messages',
+    'reposition-detailed-svgs'
+]
+
+# Checks
+
+def no_placeholders(soup):
+    remaining = text_count(soup, PLACEHOLDER_TEXT)
+    return remaining == 0, f"Remaining '{PLACEHOLDER_TEXT}' instances: {remaining}"
+
+def no_figure_added_messages(soup):
+    remaining = text_count(soup, FIGURE_ADDED_TEXT)
+    return remaining == 0, f"Remaining 'Figure Added' messages: {remaining}"
+
+def figure_containers(soup):
+    remaining = len(soup.find_all('div', class_='figure-container'))
+    return True, f"Remaining figure-container divs: {remaining}"
+
+CHECKS = {
+    'no-placeholders': no_placeholders,
+    'no-figure-added-messages': no_figure_added_messages,
+    'figure-containers': figure_containers
+}
+
+def build_pipeline(steps=CLEANUP_CHAIN, path=DEFAULT_HTML, checks=tuple(CHECKS)):
+    """Pipeline running the named transforms in order, then the named checks"""
+    pipeline = TransformPipeline(path)
+    for step in steps:
+        pipeline.register(step, TRANSFORMS[step])
+    for name in checks:
+        pipeline.check(name, CHECKS[name])
+    return pipeline
+
+def print_checks(result):
+    print("\nVerification:")
+    for name, passed, message in result['checks']:
+        print(f"{'✅' if passed else '⚠️'} {message}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Run cleanup transforms over the problematic physics HTML in one pass')
+    parser.add_argument('steps', nargs='*', help=f"transforms to run, in order: {', '.join(TRANSFORMS)} (default: the cleanup chain)")
+    parser.add_argument('--html', default=DEFAULT_HTML, help='HTML file to transform in place')
+    parser.add_argument('--dry-run', action='store_true', help='transform and verify without writing')
+    args = parser.parse_args()
+
+    unknown = [step for step in args.steps if step not in TRANSFORMS]
+    if unknown:
+        parser.error(f"unknown transform: {', '.join(unknown)}")
+
+    steps = args.steps or CLEANUP_CHAIN
+    result = build_pipeline(steps, args.html).run(write=not args.dry_run)
+
+    print()
+    for name, count in result['changes'].items():
+        print(f"  • {name}: {count} changes")
+    print_checks(result)
+
+    if result['written']:
+        print(f"\n✅ Saved to {args.html}")
+    elif args.dry_run:
+        print("\n🔍 Dry run - nothing written")
+    else:
+        print("\n✅ Nothing to change - file left as is")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Cross-dataset join index keyed by question id
+One build pass over the question corpora, excluded lists, LaTeX issue
+lists, insertion/update reports and analysis files records where every
+question appears: dataset, byte offset and length of the JSON object, and
+its path in the document. Resolving a question's dossier is then one seek
+and one json.loads per dataset it appears in, instead of parsing every file.
+
+The canonical id is a record's external_id (nested one level down for
+wrappers like {question: {...}, issues: {...}}), else its id unless that
+is a database UUID.
+
+    python3 join_index.py build
+    python3 join_index.py show Electromagnetism_121
+"""
+
+import argparse
+import json
+import re
+from glob import glob
+from pathlib import Path
+
+FORMAT_VERSION = 1
+DEFAULT_INDEX = 'join_index.json'
+DEFAULT_DATASETS = [
+    'physics_questions_with_solutions.json',
+    'complete_math_questions.json',
+    'mcq_questions_with_solutions.json',
+    'excluded_questions*.json',
+    'latex_issues_*.json',
+    'latex_update*_report.json',
+    'insertion_report*.json',
+    '*_insertion_report.json',
+    '*_analysis.json',
+    '*_analysis.jsonl'
+]
+
+UUID = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
+STRUCTURE = re.compile(rb'["{}\[\]]')
+STRING = re.compile(rb'"(?:[^"\\]|\\.)*"', re.DOTALL)
+
+def canonical_id(record):
+    """The question id a JSON object stands for, or None"""
+    if isinstance(record.get('external_id'), str):
+        return record['external_id']
+    for value in record.values():
+        if isinstance(value, dict) and isinstance(value.get('external_id'), str):
+            return value['external_id']
+    record_id = record.get('id')
+    if isinstance(record_id, str) and record_id and not UUID.match(record_id):
+        return record_id
+    return None
+
+def container_spans(data):
+    """(start, end) byte spans of every JSON object/array, in order of their opening bracket
+
+    UTF-8 continuation bytes never equal an ASCII delimiter, so scanning
+    the raw bytes is safe.
+    """
+    spans = []
+    stack = []
+    pos = 0
+    while True:
+        match = STRUCTURE.search(data, pos)
+        if not match:
+            break
+        char = match.group(0)
+        if char == b'"':
+            pos = STRING.match(data, match.start()).end()
+            continue
+        if char in b'{[':
+            stack.append(len(spans))
+            spans.append([match.start(), None])
+        else:
+            spans[stack.pop()][1] = match.end()
+        pos = match.end()
+    return spans
+
+def _walk(value, path, spans, counter, found, enclosing_id=None):
+    """Pre-order walk matching decoded containers to their spans"""
+    if not isinstance(value, (dict, list)):
+        return
+    span = spans[counter[0]]
+    counter[0] += 1
+
+    if isinstance(value, dict):
+        record_id = canonical_id(value)
+        # The question inside a {question, issues} wrapper is part of the wrapper's record
+        if record_id is not None and record_id != enclosing_id:
+            found.append((record_id, span[0], span[1] - span[0], path))
+            enclosing_id = record_id
+        for key, child in value.items():
+            _walk(child, f'{path}.{key}' if path else key, spans, counter, found, enclosing_id)
+    else:
+        for i, child in enumerate(value):
+            _walk(child, f'{path}[{i}]', spans, counter, found, enclosing_id)
+
+def index_dataset(path):
+    """[(id, offset, length, path)] of every question object in a JSON or JSON Lines file"""
+    data = Path(path).read_bytes()
+    found = []
+    if str(path).endswith('.jsonl'):
+        offset = 0
+        for n, line in enumerate(data.split(b'\n')):
+            if line.strip():
+                record_id = canonical_id(json.loads(line))
+                if record_id is not None:
+                    found.append((record_id, offset, len(line), f'[{n}]'))
+            offset += len(line) + 1
+        return found
+
+    document = json.loads(data)
+    counter = [0]
+    _walk(document, '', container_spans(data), counter, found)
+    return found
+
+def expand_datasets(patterns):
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob(pattern)) if any(c in pattern for c in '*?[') else [pattern]
+        paths.extend(path for path in matches if Path(path).is_file() and path not in paths)
+    # A .json converted by analysis_index holds the same records as its .jsonl
+    return [path for path in paths if Path(path).name != DEFAULT_INDEX
+            and not (path.endswith('.json') and Path(path).with_suffix('.jsonl').is_file())]
+
+def build_join_index(patterns=DEFAULT_DATASETS, output=DEFAULT_INDEX):
+    """Index every dataset matching ``patterns`` and write the join index"""
+    datasets = []
+    ids = {}
+    for dataset_number, path in enumerate(expand_datasets(patterns)):
+        stat = Path(path).stat()
+        found = index_dataset(path)
+        datasets.append({'file': path, 'bytes': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'records': len(found)})
+        for record_id, offset, length, record_path in found:
+            ids.setdefault(record_id, []).append([dataset_number, offset, length, record_path])
+
+    index = {'version': FORMAT_VERSION, 'datasets': datasets, 'ids': ids}
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+    return index
+
+class JoinIndex:
+    """Resolve a question id to its records in every dataset"""
+
+    def __init__(self, data):
+        if data.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported join index version: {data.get('version')}")
+        self.datasets = data['datasets']
+        self.ids = data['ids']
+
+    @classmethod
+    def load(cls, path=DEFAULT_INDEX):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def __contains__(self, question_id):
+        return question_id in self.ids
+
+    def pointers(self, question_id):
+        """[(file, offset, length, path)] without reading any dataset"""
+        return [(self.datasets[n]['file'], offset, length, path)
+                for n, offset, length, path in self.ids.get(question_id, [])]
+
+    def resolve(self, question_id):
+        """[{file, path, record}] of every dataset record of a question"""
+        dossier = []
+        handles = {}
+        try:
+            for n, offset, length, path in self.ids.get(question_id, []):
+                dataset = self.datasets[n]
+                if n not in handles:
+                    stat = Path(dataset['file']).stat()
+                    if stat.st_size != dataset['bytes'] or stat.st_mtime_ns != dataset['mtime_ns']:
+                        raise ValueError(f"{dataset['file']} changed since the join index was built; rebuild it")
+                    handles[n] = open(dataset['file'], 'rb')
+                handles[n].seek(offset)
+                record = json.loads(handles[n].read(length))
+                dossier.append({'file': dataset['file'], 'path': path, 'record': record})
+        finally:
+            for f in handles.values():
+                f.close()
+        return dossier
+
+def shorten(value, limit):
+    """Copy of a record with long strings cut to ``limit`` characters"""
+    if isinstance(value, str):
+        return value if len(value) <= limit else value[:limit] + '…'
+    if isinstance(value, dict):
+        return {k: shorten(v, limit) for k, v in value.items()}
+    if isinstance(value, list):
+        return [shorten(v, limit) for v in value]
+    return value
+
+def main():
+    parser = argparse.ArgumentParser(description='Cross-dataset join index keyed by question id')
+    parser.add_argument('--index', default=DEFAULT_INDEX, help='join index file')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help='index the datasets')
+    build.add_argument('patterns', nargs='*', help='dataset files or globs (default: the known datasets)')
+
+    show = commands.add_parser('show', help="print a question's dossier")
+    show.add_argument('question_id')
+    show.add_argument('--full', action='store_true', help='print long strings in full')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        index = build_join_index(args.patterns or DEFAULT_DATASETS, args.index)
+        for dataset in index['datasets']:
+            print(f"  • {dataset['file']}: {dataset['records']} records")
+        print(f"✅ {len(index['ids'])} question ids across {len(index['datasets'])} datasets → {args.index}")
+        return
+
+    dossier = JoinIndex.load(args.index).resolve(args.question_id)
+    if not dossier:
+        print(f"❌ {args.question_id} not found in any dataset")
+        return
+    print(f"📁 {args.question_id}: {len(dossier)} records")
+    for entry in dossier:
+        record = entry['record'] if args.full else shorten(entry['record'], 120)
+        print(f"\n📄 {entry['file']} @ {entry['path']}")
+        print(json.dumps(record, ensure_ascii=False, indent=2))
+
+if __name__ == '__main__':
+    main()
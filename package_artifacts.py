@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Package generated data and reports for static hosting
+Each artifact is copied to a content-hashed name (<stem>.<sha256[:12]><ext>)
+with a precompressed <name>.gz sibling at maximum level, and manifest.json
+maps the logical name to the hashed files with their sizes and hashes.
+
+Hashed names never change content, so they can be served with
+"Cache-Control: public, max-age=31536000, immutable"; servers that look
+for a .gz sibling (nginx gzip_static, most CDNs) send the precompressed
+bytes instead of compressing on every request. manifest.json keeps its
+name across builds, so it must be revalidated instead (vercel.json).
+
+    python3 package_artifacts.py                         # the default artifacts below
+    python3 package_artifacts.py ../maths/output --out-dir public/artifacts
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+from pathlib import Path
+
+DEFAULT_ARTIFACTS = [
+    'public/data/questions.json',
+    'excluded_questions.json',
+    'excluded_questions_detailed.json',
+    'excluded_questions_report.html',
+    'excluded_mathematics_questions.html',
+    'excluded_physics_questions.html'
+]
+ARTIFACT_SUFFIXES = {'.json', '.jsonl', '.html', '.css', '.svg'}
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+def hashed_name(path, digest):
+    """``questions.json`` -> ``questions.<sha256[:12]>.json``
+
+    Files already named by their hash (lifted figures, topic bundles) keep
+    their name.
+    """
+    path = Path(path)
+    label = path.stem.rpartition('.')[2]
+    if len(label) >= 12 and digest.startswith(label):
+        return path.name
+    return f'{path.stem}.{digest[:12]}{path.suffix}'
+
+def logical_name(path, root=None):
+    """Manifest key of an artifact: relative to the working directory when inside it"""
+    path = Path(path)
+    if root is not None:
+        return (Path(Path(root).name) / path.relative_to(root)).as_posix()
+    try:
+        return path.resolve().relative_to(Path.cwd()).as_posix()
+    except ValueError:
+        return path.name
+
+def collect_artifacts(paths, out_dir):
+    """(path, logical name) of every artifact under ``paths``; directories are walked"""
+    out_dir = Path(out_dir).resolve()
+    artifacts = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            for file in sorted(path.rglob('*')):
+                if (file.is_file() and file.suffix in ARTIFACT_SUFFIXES
+                        and out_dir not in file.resolve().parents):
+                    artifacts.append((file, logical_name(file, path)))
+        elif path.is_file():
+            artifacts.append((path, logical_name(path)))
+        else:
+            print(f"⚠️  Skipping missing artifact: {path}")
+    return artifacts
+
+def write_if_missing(path, data):
+    """Write ``data`` atomically unless the content-addressed file already exists"""
+    if path.exists():
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return True
+
+def package_artifact(path, name, out_dir):
+    """Write the hashed copy and its .gz sibling; returns the manifest entry and whether anything was written"""
+    data = Path(path).read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    target = Path(name).parent / hashed_name(name, digest)
+
+    # mtime=0 keeps the compressed bytes identical across runs
+    compressed = gzip.compress(data, compresslevel=9, mtime=0)
+    gz_target = target.with_name(target.name + '.gz')
+
+    written = write_if_missing(Path(out_dir) / target, data)
+    entry = {
+        'file': target.as_posix(),
+        'content_type': mimetypes.guess_type(str(path))[0] or 'application/octet-stream',
+        'bytes': len(data),
+        'sha256': digest
+    }
+    if len(compressed) < len(data):
+        written = write_if_missing(Path(out_dir) / gz_target, compressed) or written
+        entry['gzip'] = {
+            'file': gz_target.as_posix(),
+            'bytes': len(compressed),
+            'sha256': hashlib.sha256(compressed).hexdigest()
+        }
+    return entry, written
+
+def manifest_files(manifest):
+    files = set()
+    for entry in manifest.get('artifacts', {}).values():
+        files.add(entry['file'])
+        if 'gzip' in entry:
+            files.add(entry['gzip']['file'])
+    return files
+
+def package_artifacts(paths, out_dir):
+    """Package every artifact under ``paths`` into ``out_dir`` and write manifest.json
+
+    Hashed files the previous manifest listed that are no longer
+    referenced are removed.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / 'manifest.json'
+
+    old_files = set()
+    if manifest_path.exists():
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            old_files = manifest_files(json.load(f))
+
+    artifacts = {}
+    written = 0
+    for path, name in collect_artifacts(paths, out_dir):
+        entry, changed = package_artifact(path, name, out_dir)
+        artifacts[name] = entry
+        written += changed
+
+    manifest = {
+        'cache_control': IMMUTABLE_CACHE_CONTROL,
+        'total_bytes': sum(entry['bytes'] for entry in artifacts.values()),
+        'total_gzip_bytes': sum(entry.get('gzip', entry)['bytes'] for entry in artifacts.values()),
+        'artifacts': artifacts
+    }
+
+    for file in old_files - manifest_files(manifest):
+        stale = out_dir / file
+        stale.unlink(missing_ok=True)
+        for parent in stale.parents:
+            if parent == out_dir or any(parent.iterdir()):
+                break
+            parent.rmdir()
+
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    print(f"📦 {len(artifacts)} artifacts in {out_dir} ({written} written, {len(artifacts) - written} unchanged)")
+    return manifest_path, manifest
+
+def main():
+    parser = argparse.ArgumentParser(description='Write content-hashed, precompressed copies of generated artifacts')
+    parser.add_argument('paths', nargs='*', help='artifact files or directories (default: questions.json and the excluded reports)')
+    parser.add_argument('--out-dir', default='public/artifacts', help='where to write the packaged files and manifest.json')
+    args = parser.parse_args()
+
+    manifest_path, manifest = package_artifacts(args.paths or DEFAULT_ARTIFACTS, args.out_dir)
+
+    print("\n📊 Artifacts:")
+    for name, entry in manifest['artifacts'].items():
+        gz = entry.get('gzip')
+        ratio = f", gzip {gz['bytes'] / 1024:.2f} KB ({gz['bytes'] / entry['bytes'] * 100:.1f}%)" if gz else ""
+        print(f"  • {name} → {entry['file']}: {entry['bytes'] / 1024:.2f} KB{ratio}")
+
+    total, total_gz = manifest['total_bytes'], manifest['total_gzip_bytes']
+    print(f"\n📦 Total: {total / 1024:.2f} KB, {total_gz / 1024:.2f} KB precompressed")
+    print(f"📋 Manifest: {manifest_path}")
+
+if __name__ == '__main__':
+    main()
@@ -3,7 +3,7 @@
 Batch Diagram Updater - Extract questions, generate diagrams, update HTML
 
 Simpler approach:
-1. Extract all questions with regex
+1. Extract all questions from the page's question index
 2. Generate diagrams using universal generator
 3. Update HTML SVG sections
 4. Process in batches with commits
@@ -15,6 +15,8 @@ from pathlib import Path
 from typing import List, Dict, Tuple
 from dataclasses import dataclass
 
+from question_index import QuestionIndex
+
 
 @dataclass
 class Question:
@@ -34,7 +36,7 @@ class BatchDiagramUpdater:
     def __init__(self, html_file: str):
         self.html_file = Path(html_file)
         self.questions: List[Question] = []
-        self.html_content = ""
+        self.index = None
 
     def extract_questions(self):
         """Extract all questions from HTML"""
@@ -43,53 +45,29 @@ class BatchDiagramUpdater:
         print("="  * 80)
         print()
 
-        with open(self.html_file, 'r', encoding='utf-8') as f:
-            self.html_content = f.read()
-
-        # Pattern for question containers
-        pattern = r'<div class="question-container">.*?</div>\s*</div>\s*</div>'
-
-        # Find all question containers
-        containers = re.finditer(pattern, self.html_content, re.DOTALL)
-
-        for container_match in containers:
-            container_text = container_match.group(0)
-
-            # Extract question number
-            num_match = re.search(r'<div class="question-number">Question (\d+)</div>', container_text)
-            if not num_match:
-                continue
-
-            question_num = int(num_match.group(1))
-
-            # Extract topic
-            topic_match = re.search(r'<span class="meta-badge topic">([^<]+)</span>', container_text)
-            topic = topic_match.group(1) if topic_match else "Unknown"
-
-            # Extract difficulty
-            diff_match = re.search(r'<span class="meta-badge difficulty ([^"]+)">', container_text)
-            difficulty = diff_match.group(1).upper() if diff_match else "MEDIUM"
+        # Question containers are located once and cached next to the page
+        self.index = QuestionIndex(self.html_file)
 
+        for spans in self.index:
             # Extract question text (between question-text div)
-            text_match = re.search(r'<div class="question-text">(.*?)</div>', container_text, re.DOTALL)
-            if not text_match:
+            question_text_html = self.index.text_html(spans)
+            if question_text_html is None:
                 continue
 
-            question_text_html = text_match.group(1)
-
             # Remove HTML tags to get clean text
             clean_text = re.sub(r'<[^>]+>', ' ', question_text_html)
             clean_text = re.sub(r'\s+', ' ', clean_text).strip()
 
-            # Check if has SVG
-            has_svg = '<svg' in container_text
+            svg_start_pos, svg_end_pos = spans.svg or (-1, -1)
 
             question = Question(
-                number=question_num,
-                topic=topic,
-                difficulty=difficulty,
+                number=spans.number,
+                topic=spans.topic or "Unknown",
+                difficulty=spans.difficulty_class.upper() if spans.difficulty_class else "MEDIUM",
                 text=clean_text,
-                has_svg=has_svg
+                has_svg=spans.svg is not None,
+                svg_start_pos=svg_start_pos,
+                svg_end_pos=svg_end_pos
             )
 
             self.questions.append(question)
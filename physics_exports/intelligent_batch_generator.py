@@ -16,7 +16,9 @@ import json
 from typing import List, Dict, Any, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
-from html.parser import HTMLParser
+from html import unescape
+
+from question_index import QuestionIndex
 
 
 # ============================================================================
@@ -176,107 +178,31 @@ class IntelligentLearningSystem:
 
 
 # ============================================================================
-# HTML PARSER
+# QUESTION PARSING
 # ============================================================================
 
-class PhysicsQuestionParser(HTMLParser):
-    """Parse physics questions from HTML"""
-
-    def __init__(self):
-        super().__init__()
-        self.questions = []
-        self.current_question = None
-        self.in_question = False
-        self.in_question_text = False
-        self.in_topic = False
-        self.in_difficulty = False
-        self.in_svg = False
-        self.current_text = []
-        self.svg_content = []
-
-    def handle_starttag(self, tag, attrs):
-        attrs_dict = dict(attrs)
-
-        # Detect question container
-        if tag == 'div' and attrs_dict.get('class') == 'question-container':
-            self.in_question = True
-            self.current_question = {
-                'number': None,
-                'topic': None,
-                'difficulty': None,
-                'text': None,
-                'svg_present': False,
-                'svg_content': None
-            }
-
-        # Question number
-        if self.in_question and tag == 'div' and attrs_dict.get('class') == 'question-number':
-            self.current_text = []
-
-        # Question text
-        if self.in_question and tag == 'div' and attrs_dict.get('class') == 'question-text':
-            self.in_question_text = True
-            self.current_text = []
-
-        # Topic badge
-        if self.in_question and tag == 'span' and 'topic' in attrs_dict.get('class', ''):
-            self.in_topic = True
-            self.current_text = []
-
-        # Difficulty badge
-        if self.in_question and tag == 'span' and 'difficulty' in attrs_dict.get('class', ''):
-            self.in_difficulty = True
-            self.current_text = []
-
-        # SVG detection
-        if self.in_question and tag == 'svg':
-            self.in_svg = True
-            self.svg_content = [f'<{tag}']
-            for attr, value in attrs:
-                self.svg_content.append(f' {attr}="{value}"')
-            self.svg_content.append('>')
-            self.current_question['svg_present'] = True
-
-    def handle_endtag(self, tag):
-        if self.in_svg and tag == 'svg':
-            self.svg_content.append('</svg>')
-            self.current_question['svg_content'] = ''.join(self.svg_content)
-            self.in_svg = False
-            self.svg_content = []
-
-        if self.in_svg:
-            self.svg_content.append(f'</{tag}>')
-
-        if tag == 'div' and self.in_question and not self.in_svg:
-            if self.in_question_text:
-                self.current_question['text'] = ''.join(self.current_text).strip()
-                self.in_question_text = False
-
-        if tag == 'span':
-            if self.in_topic:
-                self.current_question['topic'] = ''.join(self.current_text).strip()
-                self.in_topic = False
-            elif self.in_difficulty:
-                self.current_question['difficulty'] = ''.join(self.current_text).strip()
-                self.in_difficulty = False
-
-        # End of question container
-        if tag == 'div' and self.in_question and not self.in_question_text and not self.in_svg:
-            if self.current_question and self.current_question.get('text'):
-                self.questions.append(self.current_question)
-                self.current_question = None
-            self.in_question = False
-
-    def handle_data(self, data):
-        if self.in_svg:
-            self.svg_content.append(data)
-        elif self.in_question_text or self.in_topic or self.in_difficulty:
-            self.current_text.append(data)
-        elif self.in_question and 'Question' in data:
-            # Extract question number
-            match = re.search(r'Question\s+(\d+)', data)
-            if match and self.current_question:
-                self.current_question['number'] = int(match.group(1))
+def parse_questions(index: QuestionIndex) -> List[Dict]:
+    """Question dicts of an indexed physics HTML page"""
+    questions = []
+    for spans in index:
+        question_html = index.text_html(spans)
+        if question_html is None:
+            continue
+
+        text = unescape(re.sub(r'<[^>]+>', ' ', question_html))
+        text = re.sub(r'\s+', ' ', text).strip()
+        if not text:
+            continue
+
+        questions.append({
+            'number': spans.number,
+            'topic': spans.topic,
+            'difficulty': spans.difficulty,
+            'text': text,
+            'svg_present': spans.svg is not None,
+            'svg_content': index.read(spans.svg)
+        })
+    return questions
 
 
 # ============================================================================
@@ -299,13 +225,8 @@ class BatchDiagramGenerator:
         print("=" * 80)
         print()
 
-        with open(self.html_file, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-
-        parser = PhysicsQuestionParser()
-        parser.feed(html_content)
-
-        self.questions = parser.questions
+        with QuestionIndex(self.html_file) as index:
+            self.questions = parse_questions(index)
 
         print(f"✅ Found {len(self.questions)} questions")
         print()
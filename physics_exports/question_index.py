@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Question-container offset index for the physics question HTML pages
+
+Scans a page once over an mmap and records, for every question, the byte
+range of its container, question-text div, question-figure div and first
+<svg>, plus its metadata badges. The index is kept next to the page as
+<stem>.qindex.json and rebuilt only when the page's SHA-256 changes, so
+tools jump straight to a question's bytes instead of regex-scanning the
+whole page on every run.
+
+Usage:
+    index = QuestionIndex(html_file)
+    spans = index.get(12)
+    svg = index.read(spans.svg)
+
+    python3 question_index.py physics_questions_0*_of_05.html
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+FORMAT_VERSION = 1
+
+CONTAINER_START = re.compile(rb'<div class="question-container">')
+CONTAINER_END = re.compile(rb'</div>\s*</div>\s*</div>')
+NUMBER_PATTERN = re.compile(rb'<div class="question-number">Question (\d+)</div>')
+TOPIC_PATTERN = re.compile(rb'<span class="meta-badge topic">([^<]+)</span>')
+DIFFICULTY_CLASS_PATTERN = re.compile(rb'<span class="meta-badge difficulty ([^"]+)">')
+DIFFICULTY_PATTERN = re.compile(rb'<span class="meta-badge difficulty ([^"]+)">([^<]+)</span>')
+TYPE_PATTERN = re.compile(rb'<span class="meta-badge">([^<]+)</span>')
+TEXT_PATTERN = re.compile(rb'<div class="question-text">.*?</div>', re.DOTALL)
+FIGURE_PATTERN = re.compile(rb'<div class="question-figure">.*?<svg.*?</svg>.*?</div>', re.DOTALL)
+SVG_PATTERN = re.compile(rb'<svg.*?</svg>', re.DOTALL)
+
+TEXT_OPEN = b'<div class="question-text">'
+DIV_CLOSE = b'</div>'
+
+Span = Tuple[int, int]
+
+
+@dataclass
+class QuestionSpans:
+    """Byte ranges and badges of one question container"""
+    number: int
+    container: Span
+    text: Optional[Span] = None
+    figure: Optional[Span] = None
+    svg: Optional[Span] = None
+    topic: Optional[str] = None
+    difficulty: Optional[str] = None
+    difficulty_class: Optional[str] = None
+    question_type: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'QuestionSpans':
+        spans = dict(data)
+        for name in ('container', 'text', 'figure', 'svg'):
+            if spans[name] is not None:
+                spans[name] = tuple(spans[name])
+        return cls(**spans)
+
+
+def index_path_for(html_file: Path) -> Path:
+    return Path(html_file).with_suffix('.qindex.json')
+
+
+def _span(match) -> Optional[Span]:
+    return match.span() if match else None
+
+
+def _group(match, group: int = 1) -> Optional[str]:
+    return match.group(group).decode('utf-8') if match else None
+
+
+def scan_questions(data) -> List[QuestionSpans]:
+    """Index every question container of a page's bytes (or mmap)"""
+    questions = []
+    starts = [match.start() for match in CONTAINER_START.finditer(data)]
+    for i, start in enumerate(starts):
+        # A container whose closing divs are malformed stops where the next one starts
+        limit = starts[i + 1] if i + 1 < len(starts) else len(data)
+        container_end = CONTAINER_END.search(data, start, limit)
+        end = container_end.end() if container_end else limit
+
+        number = NUMBER_PATTERN.search(data, start, end)
+        if not number:
+            continue
+
+        difficulty = DIFFICULTY_PATTERN.search(data, start, end)
+        questions.append(QuestionSpans(
+            number=int(number.group(1)),
+            container=(start, end),
+            text=_span(TEXT_PATTERN.search(data, start, end)),
+            figure=_span(FIGURE_PATTERN.search(data, start, end)),
+            svg=_span(SVG_PATTERN.search(data, start, end)),
+            topic=_group(TOPIC_PATTERN.search(data, start, end)),
+            difficulty=_group(difficulty, 2),
+            difficulty_class=_group(DIFFICULTY_CLASS_PATTERN.search(data, start, end)),
+            question_type=_group(TYPE_PATTERN.search(data, start, end))
+        ))
+    return questions
+
+
+class QuestionIndex:
+    """Memory-mapped page plus its cached question-container index"""
+
+    def __init__(self, html_file: Path):
+        self.html_file = Path(html_file)
+        self.f = None
+        self.data = b''
+        self._open()
+
+    def _open(self):
+        self.f = open(self.html_file, 'rb')
+        size = self.html_file.stat().st_size
+        # mmap can't map an empty file
+        self.data = mmap.mmap(self.f.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self.sha256 = hashlib.sha256(self.data).hexdigest()
+
+        cached = self._read_cached()
+        self.rebuilt = cached is None
+        if cached is None:
+            self.questions = scan_questions(self.data)
+            self._save()
+        else:
+            self.questions = [QuestionSpans.from_dict(q) for q in cached['questions']]
+
+        self.by_number: Dict[int, QuestionSpans] = {}
+        for question in self.questions:
+            self.by_number.setdefault(question.number, question)
+
+    def _read_cached(self) -> Optional[Dict]:
+        try:
+            with open(index_path_for(self.html_file), 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cached.get('version') != FORMAT_VERSION or cached.get('sha256') != self.sha256:
+            return None
+        return cached
+
+    def _save(self):
+        index = {
+            'version': FORMAT_VERSION,
+            'html': self.html_file.name,
+            'sha256': self.sha256,
+            'bytes': len(self.data),
+            'questions': [asdict(q) for q in self.questions]
+        }
+        with open(index_path_for(self.html_file), 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+
+    def refresh(self):
+        """Re-map the page after it was rewritten, rebuilding the index if its hash changed"""
+        self.close()
+        self._open()
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.data = b''
+        if self.f:
+            self.f.close()
+            self.f = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def __iter__(self) -> Iterator[QuestionSpans]:
+        return iter(self.questions)
+
+    def __contains__(self, number: int) -> bool:
+        return number in self.by_number
+
+    def get(self, number: int) -> Optional[QuestionSpans]:
+        """First container of a question number"""
+        return self.by_number.get(number)
+
+    def read(self, span: Optional[Span]) -> Optional[str]:
+        """Decoded markup of a span; spans start and end on tags, so it's always valid UTF-8"""
+        if span is None:
+            return None
+        return self.data[span[0]:span[1]].decode('utf-8')
+
+    def text_html(self, question: QuestionSpans) -> Optional[str]:
+        """Inner markup of the question-text div"""
+        if question.text is None:
+            return None
+        start, end = question.text
+        return self.read((start + len(TEXT_OPEN), end - len(DIV_CLOSE)))
+
+    def content(self) -> str:
+        """The whole page"""
+        return self.data[:].decode('utf-8')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the question-container offset index of physics HTML pages')
+    parser.add_argument('html_files', nargs='+', type=Path)
+    args = parser.parse_args()
+
+    for html_file in args.html_files:
+        with QuestionIndex(html_file) as index:
+            with_figure = sum(1 for q in index if q.figure)
+            status = 'rebuilt' if index.rebuilt else 'up to date'
+            print(f"📇 {html_file}: {len(index)} questions, {with_figure} with figures ({status})")
+            print(f"   → {index_path_for(html_file)}")
+
+
+if __name__ == '__main__':
+    main()
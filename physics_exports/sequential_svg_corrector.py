@@ -22,6 +22,9 @@ from typing import List, Dict, Optional
 import subprocess
 import sys
 
+from question_index import QuestionIndex
+from svg_patch_engine import SVGPatchQueue, extract_svg
+
 
 @dataclass
 class Question:
@@ -32,7 +35,7 @@ class Question:
     question_type: str
     text: str
     text_preview: str
-    html_start_pos: int
+    html_start_pos: int  # byte offsets of the question container
     html_end_pos: int
 
 
@@ -41,56 +44,32 @@ class QuestionParser:
 
     def __init__(self, html_file: Path):
         self.html_file = html_file
-        with open(html_file, 'r', encoding='utf-8') as f:
-            self.html_content = f.read()
+        self.index = QuestionIndex(html_file)
 
     def parse_all_questions(self) -> List[Question]:
-        """Extract all questions from HTML"""
+        """Extract all questions from the page's question index"""
         questions = []
 
-        # Pattern to match question containers
-        pattern = r'<div class="question-container">(.*?)</div>\s*</div>\s*</div>'
-
-        for match in re.finditer(pattern, self.html_content, re.DOTALL):
-            container = match.group(1)
-
-            # Extract question number
-            q_num_match = re.search(r'<div class="question-number">Question (\d+)</div>', container)
-            if not q_num_match:
-                continue
-            q_num = int(q_num_match.group(1))
-
-            # Extract metadata
-            topic_match = re.search(r'<span class="meta-badge topic">([^<]+)</span>', container)
-            topic = topic_match.group(1) if topic_match else "Unknown"
-
-            difficulty_match = re.search(r'<span class="meta-badge difficulty ([^"]+)">([^<]+)</span>', container)
-            difficulty = difficulty_match.group(2) if difficulty_match else "MEDIUM"
-
-            type_match = re.search(r'<span class="meta-badge">([^<]+)</span>', container)
-            question_type = type_match.group(1) if type_match else "Multiple Choice"
-
+        for spans in self.index:
             # Extract question text
-            text_match = re.search(r'<div class="question-text">(.*?)</div>', container, re.DOTALL)
-            if not text_match:
+            question_html = self.index.text_html(spans)
+            if question_html is None:
                 continue
 
-            question_html = text_match.group(1)
-
             # Clean HTML to get plain text
             text_clean = re.sub(r'<[^>]+>', ' ', question_html)
             text_clean = re.sub(r'\s+', ' ', text_clean).strip()
 
             # Create question object
             question = Question(
-                number=q_num,
-                topic=topic,
-                difficulty=difficulty,
-                question_type=question_type,
+                number=spans.number,
+                topic=spans.topic or "Unknown",
+                difficulty=spans.difficulty or "MEDIUM",
+                question_type=spans.question_type or "Multiple Choice",
                 text=text_clean,
                 text_preview=text_clean[:150] + "..." if len(text_clean) > 150 else text_clean,
-                html_start_pos=match.start(),
-                html_end_pos=match.end()
+                html_start_pos=spans.container[0],
+                html_end_pos=spans.container[1]
             )
 
             questions.append(question)
@@ -199,6 +178,7 @@ class SequentialSVGProcessor:
         self.html_file = html_file
         self.parser = QuestionParser(html_file)
         self.verifier = SVGVerifier()
+        self.patches: Optional[SVGPatchQueue] = None
 
     def generate_svg_for_question(self, question: Question, output_svg: Path) -> bool:
         """
@@ -227,56 +207,39 @@ class SequentialSVGProcessor:
 
     def update_html_with_svg(self, question_num: int, svg_file: Path) -> bool:
         """
-        Update HTML with the new SVG for the given question number
-        Returns True if successful
+        Queue the new SVG for the given question number
+        The queued patches are written to the HTML in one pass by
+        flush_html_updates()
+        Returns True if the question's figure was found
         """
 
-        print(f"  📝 Updating HTML for Q{question_num}...")
+        print(f"  📝 Queueing HTML update for Q{question_num}...")
 
-        # Read current HTML
-        with open(self.html_file, 'r', encoding='utf-8') as f:
-            html_content = f.read()
+        if self.patches is None:
+            self.patches = SVGPatchQueue(self.html_file, self.parser.index)
 
         # Read new SVG
         with open(svg_file, 'r') as f:
-            new_svg = f.read()
+            new_svg_content = extract_svg(f.read())
 
-        # Extract just SVG content
-        svg_match = re.search(r'<svg.*?</svg>', new_svg, re.DOTALL)
-        if not svg_match:
+        if new_svg_content is None:
             print(f"  ❌ Could not extract SVG content")
             return False
 
-        new_svg_content = svg_match.group(0)
-
-        # Find question section in HTML
-        question_pattern = rf'(<div class="question-container">.*?<div class="question-number">Question {question_num}</div>.*?)(<div class="question-figure">.*?<svg.*?</svg>.*?</div>)(.*?</div>\s*</div>\s*</div>)'
-
-        match = re.search(question_pattern, html_content, re.DOTALL)
-
-        if match:
-            before_svg = match.group(1)
-            old_svg_section = match.group(2)
-            after_svg = match.group(3)
-
-            # Create new SVG section
-            new_svg_section = f'<div class="question-figure">\n          {new_svg_content}\n        </div>'
-
-            # Replace
-            old_full = match.group(0)
-            new_full = before_svg + new_svg_section + after_svg
-
-            html_content = html_content.replace(old_full, new_full, 1)
-
-            # Save HTML
-            with open(self.html_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-
-            return True
-        else:
+        if self.patches.replace_figure(question_num, new_svg_content) is None:
             print(f"  ❌ Could not find Q{question_num} in HTML")
             return False
 
+        return True
+
+    def flush_html_updates(self) -> int:
+        """Apply all queued SVG updates and write the HTML once"""
+        if self.patches is None or not len(self.patches):
+            return 0
+        applied = self.patches.write()
+        print(f"💾 Wrote {applied} SVG updates to {self.html_file}")
+        return applied
+
     def process_question(self, question: Question) -> Dict[str, any]:
         """
         Process a single question: generate SVG, verify, update HTML
@@ -326,7 +289,7 @@ class SequentialSVGProcessor:
             success = self.update_html_with_svg(question.number, svg_file)
 
             if success:
-                print(f"  ✅ HTML updated")
+                print(f"  ✅ HTML update queued")
                 return {
                     'question_num': question.number,
                     'success': True,
@@ -370,6 +333,7 @@ class SequentialSVGProcessor:
         # Parse all questions
         print("📖 Parsing questions from HTML...")
         questions = self.parser.parse_all_questions()
+        self.patches = SVGPatchQueue(self.html_file, self.parser.index)
         print(f"✅ Found {len(questions)} questions")
         print()
 
@@ -379,16 +343,20 @@ class SequentialSVGProcessor:
             print(f"🎯 Processing first {max_questions} questions")
             print()
 
-        # Process each question
+        # Process each question; HTML updates are written once at the end,
+        # or when the run is interrupted
         results = []
 
-        for i, question in enumerate(questions, 1):
-            result = self.process_question(question)
-            results.append(result)
-
-            # Brief pause between questions
-            if i < len(questions):
-                time.sleep(0.5)
+        try:
+            for i, question in enumerate(questions, 1):
+                result = self.process_question(question)
+                results.append(result)
+
+                # Brief pause between questions
+                if i < len(questions):
+                    time.sleep(0.5)
+        finally:
+            self.flush_html_updates()
 
         # Summary
         print(f"\n{'='*80}")
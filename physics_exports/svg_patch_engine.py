@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Batched SVG patch engine for the physics question HTML pages
+
+Collects every SVG replacement of a run and applies them in a single pass
+over the HTML, using the figure and question-text offsets of the page's
+QuestionIndex, then writes the file once.
+
+Usage:
+    queue = SVGPatchQueue.from_file(html_file)
+    queue.replace_figure(12, svg_markup)
+    queue.write()
+"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from question_index import QuestionIndex
+
+
+SVG_PATTERN = re.compile(r'<svg.*?</svg>', re.DOTALL)
+
+
+def extract_svg(svg_text: str) -> Optional[str]:
+    """Return just the <svg>...</svg> element of an SVG file's text"""
+    match = SVG_PATTERN.search(svg_text)
+    return match.group(0) if match else None
+
+
+def figure_section(svg_content: str) -> str:
+    """Markup of a question-figure block holding ``svg_content``"""
+    return f'<div class="question-figure">\n          {svg_content}\n        </div>'
+
+
+@dataclass
+class SVGPatch:
+    """One pending replacement of the page bytes [start:end]"""
+    question_num: int
+    start: int
+    end: int
+    replacement: str
+    inserted: bool
+
+
+class SVGPatchQueue:
+    """Queue SVG replacements for one HTML file and apply them in one write"""
+
+    def __init__(self, html_file: Path, index: QuestionIndex):
+        self.html_file = Path(html_file)
+        self.index = index
+        self.patches: Dict[int, SVGPatch] = {}
+
+    @classmethod
+    def from_file(cls, html_file: Path) -> 'SVGPatchQueue':
+        return cls(html_file, QuestionIndex(html_file))
+
+    @property
+    def html_content(self) -> str:
+        return self.index.content()
+
+    def replace_figure(self, question_num: int, svg_content: str, insert_missing: bool = False) -> Optional[str]:
+        """
+        Queue ``svg_content`` as the figure of a question
+        Returns 'updated', 'inserted' (after the question text, when the
+        question has no figure and ``insert_missing``), or None if the
+        question or its figure can't be found. A later patch for the same
+        question replaces an earlier one.
+        """
+
+        question = self.index.get(question_num)
+        if question is None:
+            return None
+
+        if question.figure:
+            start, end = question.figure
+            self.patches[question_num] = SVGPatch(
+                question_num, start, end, figure_section(svg_content), inserted=False)
+            return 'updated'
+
+        if not insert_missing or question.text is None:
+            return None
+
+        text_end = question.text[1]
+        self.patches[question_num] = SVGPatch(
+            question_num, text_end, text_end,
+            f'\n\n        {figure_section(svg_content)}\n', inserted=True)
+        return 'inserted'
+
+    def __len__(self) -> int:
+        return len(self.patches)
+
+    def apply(self) -> bytes:
+        """Page bytes with every queued patch applied, built in one pass"""
+        pieces = []
+        position = 0
+        for patch in sorted(self.patches.values(), key=lambda p: p.start):
+            if patch.start < position:
+                raise ValueError(f"Overlapping SVG patches at Q{patch.question_num}")
+            pieces.append(self.index.data[position:patch.start])
+            pieces.append(patch.replacement.encode('utf-8'))
+            position = patch.end
+        pieces.append(self.index.data[position:])
+        return b''.join(pieces)
+
+    def write(self, output_file: Optional[Path] = None) -> int:
+        """Apply the queued patches and write the HTML once; returns how many were applied"""
+        if not self.patches:
+            return 0
+
+        output_file = Path(output_file or self.html_file)
+        content = self.apply()
+        in_place = output_file.resolve() == self.html_file.resolve()
+        if in_place:
+            # Unmap before truncating the file underneath it
+            self.index.close()
+        with open(output_file, 'wb') as f:
+            f.write(content)
+
+        applied = len(self.patches)
+        self.patches.clear()
+        if in_place:
+            # Offsets moved: later patches must be found in the new content
+            self.index.refresh()
+        return applied
@@ -13,6 +13,8 @@ import re
 from pathlib import Path
 from typing import Dict
 
+from svg_patch_engine import SVGPatchQueue
+
 
 def read_svg_file(svg_path: Path) -> str:
     """Read and return SVG content"""
@@ -37,12 +39,10 @@ def update_html_with_diagrams(html_file: Path, max_questions: int = 50):
     print("=" * 80)
     print()
 
-    # Read HTML file
+    # Read HTML file; replacements are queued and applied in one pass
     print(f"Reading HTML file: {html_file}")
-    with open(html_file, 'r', encoding='utf-8') as f:
-        html_content = f.read()
-
-    original_content = html_content
+    patches = SVGPatchQueue.from_file(html_file)
+    original_content = patches.html_content
 
     # Track updates
     updated_count = 0
@@ -61,56 +61,19 @@ def update_html_with_diagrams(html_file: Path, max_questions: int = 50):
         new_svg = read_svg_file(svg_file)
         new_svg = extract_svg_content(new_svg)
 
-        # Find the question section in HTML
-        # Pattern: <div class="question-container"> ... Question N ... </div>
-
-        # First, find the question container for this question number
-        question_pattern = rf'(<div class="question-container">.*?<div class="question-number">Question {q_num}</div>.*?)(<div class="question-figure">.*?<svg.*?</svg>.*?</div>)(.*?</div>\s*</div>\s*</div>)'
-
-        match = re.search(question_pattern, html_content, re.DOTALL)
-
-        if match:
-            # Extract parts
-            before_svg = match.group(1)
-            old_svg_section = match.group(2)
-            after_svg = match.group(3)
-
-            # Create new SVG section
-            new_svg_section = f'<div class="question-figure">\n          {new_svg}\n        </div>'
-
-            # Replace in HTML
-            old_full = match.group(0)
-            new_full = before_svg + new_svg_section + after_svg
-
-            html_content = html_content.replace(old_full, new_full, 1)
+        # Replace the figure in the question's container, or insert one
+        # after the question text if it has none
+        status = patches.replace_figure(q_num, new_svg, insert_missing=True)
 
+        if status == 'updated':
             print(f"  Q{q_num}: ✅ Updated")
             updated_count += 1
-
+        elif status == 'inserted':
+            print(f"  Q{q_num}: ✅ Inserted (was missing)")
+            updated_count += 1
         else:
-            # Try alternate pattern - some questions might not have existing SVG
-            question_pattern_no_svg = rf'(<div class="question-container">.*?<div class="question-number">Question {q_num}</div>.*?<div class="question-text">.*?</div>)(.*?)(</div>)'
-
-            match2 = re.search(question_pattern_no_svg, html_content, re.DOTALL)
-
-            if match2:
-                before = match2.group(1)
-                middle = match2.group(2)
-                after = match2.group(3)
-
-                # Insert SVG section after question-text
-                new_svg_section = f'\n\n        <div class="question-figure">\n          {new_svg}\n        </div>\n'
-
-                old_full = match2.group(0)
-                new_full = before + new_svg_section + middle + after
-
-                html_content = html_content.replace(old_full, new_full, 1)
-
-                print(f"  Q{q_num}: ✅ Inserted (was missing)")
-                updated_count += 1
-            else:
-                print(f"  Q{q_num}: ❌ Could not find question in HTML")
-                failed_count += 1
+            print(f"  Q{q_num}: ❌ Could not find question in HTML")
+            failed_count += 1
 
     print()
     print("=" * 80)
@@ -131,8 +94,7 @@ def update_html_with_diagrams(html_file: Path, max_questions: int = 50):
 
         # Save updated HTML
         print(f"Saving updated HTML: {html_file}")
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        patches.write()
 
         print()
         print("✅ HTML file updated successfully!")
@@ -6,20 +6,20 @@ Verify each diagram matches its question and identify issues
 import re
 from pathlib import Path
 
+from question_index import QuestionIndex
+
 # Read HTML
 html_file = Path('/Users/Pramod/projects/iit-exams/jee-test-nextjs/physics_exports/physics_questions_01_of_05.html')
-with open(html_file) as f:
-    html = f.read()
+index = QuestionIndex(html_file)
 
 # Extract all questions
-pattern = r'<div class="question-number">Question (\d+)</div>.*?<span class="meta-badge topic">([^<]+)</span>.*?<div class="question-text">(.*?)</div>'
-matches = re.finditer(pattern, html, re.DOTALL)
-
 questions = {}
-for match in matches:
-    q_num = int(match.group(1))
-    topic = match.group(2)
-    q_html = match.group(3)
+for spans in index:
+    q_html = index.text_html(spans)
+    if spans.topic is None or q_html is None:
+        continue
+    q_num = spans.number
+    topic = spans.topic
 
     # Clean HTML
     q_text = re.sub(r'<[^>]+>', ' ', q_html)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Question boundary segmenter for scraped dumps
+All registered boundary patterns are compiled into one alternation, every
+question start in a section is found in a single scan, and fragments are
+sliced out by offset. New dump formats only need to register a pattern.
+"""
+
+import re
+from bisect import bisect_left
+from html import unescape
+
+def fragment_text(fragment):
+    """Plain text of an HTML fragment, without building a tree"""
+    return unescape(re.sub(r'<[^>]+>', '', fragment)).strip()
+
+class QuestionSegmenter:
+    """Split section HTML into question fragments
+
+    Patterns are tried in registration order: the first one whose
+    boundaries yield a question longer than ``min_text_length`` chars wins.
+    A fragment runs from its boundary to the next boundary of any pattern,
+    so a stray header of another format still ends the question. When two
+    patterns match at the same offset the earlier-registered one is kept.
+    """
+
+    def __init__(self, min_text_length=30):
+        self.min_text_length = min_text_length
+        self.patterns = []
+        self.regex = None
+
+    def register(self, name, pattern):
+        """Register a boundary pattern (case-insensitive regex) under ``name``"""
+        self.patterns.append((name, pattern))
+        self.regex = None
+        return self
+
+    def _compile(self):
+        # Each alternative sits in a lookahead so overlapping starts of
+        # different patterns (e.g. <p><strong>1.</strong> and the
+        # <strong>1.</strong> inside it) are all found
+        alternatives = '|'.join(f'(?P<_seg{i}>{pattern})' for i, (_, pattern) in enumerate(self.patterns))
+        self.regex = re.compile(f'(?=(?:{alternatives}))', re.IGNORECASE)
+
+    def boundaries(self, html):
+        """Every question start as (start, end, pattern index), in document order"""
+        if self.regex is None:
+            self._compile()
+
+        found = []
+        for match in self.regex.finditer(html):
+            for i in range(len(self.patterns)):
+                group = f'_seg{i}'
+                if match.group(group) is not None:
+                    found.append((match.start(group), match.end(group), i))
+                    break
+        return found
+
+    def segment(self, html):
+        """Return (pattern name, fragments) for the first pattern that finds questions
+
+        Fragments are dicts with 'html' and 'text'. Returns (None, []) when
+        no pattern finds a question.
+        """
+        bounds = self.boundaries(html)
+        starts = [start for start, _, _ in bounds]
+
+        for i, (name, _) in enumerate(self.patterns):
+            fragments = []
+
+            for start, end, index in bounds:
+                if index != i:
+                    continue
+
+                nxt = bisect_left(starts, end)
+                cut = starts[nxt] if nxt < len(starts) else len(html)
+                fragment = html[start:cut]
+                text = fragment_text(fragment)
+
+                # Skip if too short (probably not a real question)
+                if len(text) > self.min_text_length:
+                    fragments.append({
+                        'html': fragment,
+                        'text': text
+                    })
+
+            if fragments:
+                return name, fragments
+
+        return None, []
+
+def default_segmenter():
+    """Segmenter with the boundary formats seen in the combined maths dumps"""
+    return (QuestionSegmenter()
+            .register('strong-number', r'<strong>(?:Question\s+\d+|Q\.\s*\d+|\d+\.)</strong>')
+            .register('p-strong-number', r'<p><strong>\d+\.</strong>')
+            .register('h3-question', r'<h3>Question\s+\d+</h3>')
+            .register('div-strong-number', r'<div[^>]*>\s*<strong>\d+\.</strong>'))
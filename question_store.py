@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Local SQLite store for the question corpora
+Loads the question JSON files into one database with indexes on subject,
+chapter, topic and difficulty, a tags table and an FTS5 index over the
+question and solution text, so scripts can filter and search with a query
+instead of loading and scanning every file.
+
+Records are stored verbatim, so find/search return the same dicts the JSON
+files hold. A file is only reloaded when its content hash changes.
+
+    python3 question_store.py load
+    python3 question_store.py search "centripetal accel*" --subject Physics
+    python3 question_store.py find --topic Matrices --difficulty HARD
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import time
+from html import unescape
+from pathlib import Path
+
+from question_writers import file_sha256, iter_jsonl
+
+DEFAULT_DB = 'questions.db'
+# path -> subject for records that don't carry one
+DEFAULT_SOURCES = {
+    'mcq_questions_with_solutions.json': 'Mathematics',
+    'complete_math_questions.json': None,
+    'physics_questions_with_solutions.json': None,
+    'excluded_questions_detailed.json': None
+}
+FILTER_COLUMNS = ('subject', 'chapter', 'topic', 'subtopic', 'type', 'difficulty')
+# camelCase spellings used by some exports
+FIELD_ALIASES = {
+    'correctAnswer': 'correct_answer',
+    'questionHtml': 'question_html',
+    'solutionHtml': 'solution_html',
+    'solutionText': 'solution_text'
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    source TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    loaded TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS questions (
+    rowid INTEGER PRIMARY KEY,
+    source TEXT NOT NULL REFERENCES sources(source),
+    id TEXT NOT NULL,
+    subject TEXT,
+    chapter TEXT,
+    topic TEXT,
+    subtopic TEXT,
+    type TEXT,
+    difficulty TEXT,
+    question TEXT,
+    solution TEXT,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS questions_subject ON questions (subject, difficulty);
+CREATE INDEX IF NOT EXISTS questions_chapter ON questions (chapter);
+CREATE INDEX IF NOT EXISTS questions_topic ON questions (topic, difficulty);
+CREATE INDEX IF NOT EXISTS questions_difficulty ON questions (difficulty);
+CREATE INDEX IF NOT EXISTS questions_id ON questions (id);
+CREATE INDEX IF NOT EXISTS questions_source ON questions (source);
+CREATE TABLE IF NOT EXISTS tags (
+    tag TEXT NOT NULL,
+    question INTEGER NOT NULL REFERENCES questions(rowid) ON DELETE CASCADE,
+    PRIMARY KEY (tag, question)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS tags_question ON tags (question);
+CREATE VIRTUAL TABLE IF NOT EXISTS questions_fts USING fts5 (
+    question, solution,
+    content='questions', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+);
+"""
+
+TAG = re.compile(r'<[^>]+>')
+WORD = re.compile(r'\w+\*?')
+
+def strip_html(html):
+    """Plain text of an HTML fragment, whitespace collapsed"""
+    return ' '.join(unescape(TAG.sub(' ', html or '')).split())
+
+def iter_source_records(path):
+    """Records of a question file: a list, {group: [records]} or JSON Lines"""
+    path = Path(path)
+    if path.name.endswith(('.jsonl', '.jsonl.gz')):
+        yield from iter_jsonl(path)
+        return
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        yield from data
+        return
+    # {topic: [...]} or {'summary': {...}, 'mathematics': [...], ...}
+    for value in data.values():
+        if isinstance(value, list):
+            yield from value
+
+def question_row(record, default_subject=None):
+    """Indexed columns of one record"""
+    fields = {FIELD_ALIASES.get(key, key): value for key, value in record.items()}
+    question = fields.get('question') or fields.get('question_text') or strip_html(fields.get('question_html'))
+    solution = (fields.get('solution_text') or strip_html(fields.get('solution_html'))
+                or (fields.get('solution') if isinstance(fields.get('solution'), str) else ''))
+    row = {column: fields.get(column) for column in FILTER_COLUMNS}
+    row['subject'] = row['subject'] or default_subject
+    row['question'] = question or ''
+    row['solution'] = solution or ''
+    return row
+
+def fts_query(text):
+    """FTS5 MATCH expression for plain words; a trailing * matches by prefix"""
+    terms = []
+    for word in WORD.findall(text):
+        prefix = word.endswith('*')
+        word = word.rstrip('*')
+        if word:
+            terms.append(f'"{word}"*' if prefix else f'"{word}"')
+    return ' '.join(terms)
+
+class QuestionStore:
+    """Query API over the SQLite question store"""
+
+    def __init__(self, path=DEFAULT_DB):
+        self.path = Path(path)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        self.conn.execute('PRAGMA journal_mode = WAL')
+        self.conn.execute('PRAGMA synchronous = NORMAL')
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def _delete_source(self, source):
+        # External-content FTS rows must be deleted with their old values
+        self.conn.execute("""
+            INSERT INTO questions_fts (questions_fts, rowid, question, solution)
+            SELECT 'delete', rowid, question, solution FROM questions WHERE source = ?
+        """, (source,))
+        self.conn.execute('DELETE FROM questions WHERE source = ?', (source,))
+
+    def load_file(self, path, default_subject=None, force=False):
+        """Load one question file; returns the record count, or None if it was unchanged"""
+        path = Path(path)
+        source = path.name.split('.')[0]
+        digest = file_sha256(path)
+        known = self.conn.execute('SELECT sha256 FROM sources WHERE source = ?', (source,)).fetchone()
+        if known and known[0] == digest and not force:
+            return None
+
+        with self.conn:
+            self._delete_source(source)
+            self.conn.execute('INSERT OR REPLACE INTO sources VALUES (?, ?, ?, 0, ?)',
+                              (source, str(path), digest, time.strftime('%Y-%m-%dT%H:%M:%S')))
+            count = 0
+            for n, record in enumerate(iter_source_records(path)):
+                record_id = str(record.get('id') or f'{source}:{n}')
+                row = question_row(record, default_subject)
+                cursor = self.conn.execute(
+                    'INSERT INTO questions (source, id, subject, chapter, topic, subtopic, type, '
+                    'difficulty, question, solution, record) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (source, record_id, *(row[c] for c in FILTER_COLUMNS), row['question'], row['solution'],
+                     json.dumps(record, ensure_ascii=False)))
+                rowid = cursor.lastrowid
+                self.conn.execute('INSERT INTO questions_fts (rowid, question, solution) VALUES (?, ?, ?)',
+                                  (rowid, row['question'], row['solution']))
+                tags = record.get('tags') or []
+                self.conn.executemany('INSERT OR IGNORE INTO tags VALUES (?, ?)',
+                                      [(tag, rowid) for tag in tags if isinstance(tag, str)])
+                count += 1
+            self.conn.execute('UPDATE sources SET count = ? WHERE source = ?', (count, source))
+        return count
+
+    def load(self, sources=DEFAULT_SOURCES, force=False):
+        """Load question files (paths, or {path: default subject}), skipping missing and unchanged ones"""
+        if not isinstance(sources, dict):
+            sources = {path: DEFAULT_SOURCES.get(Path(path).name) for path in sources}
+        loaded = {}
+        for path, subject in sources.items():
+            if Path(path).exists():
+                loaded[path] = self.load_file(path, subject, force)
+        return loaded
+
+    def _where(self, filters, tags=None, source=None, alias='q'):
+        clauses = []
+        params = []
+        for column, value in filters.items():
+            if column not in FILTER_COLUMNS:
+                raise ValueError(f"Unknown filter: {column}")
+            if value is not None:
+                clauses.append(f'{alias}.{column} = ?')
+                params.append(value)
+        if source is not None:
+            clauses.append(f'{alias}.source = ?')
+            params.append(source)
+        for tag in tags or []:
+            clauses.append(f'{alias}.rowid IN (SELECT question FROM tags WHERE tag = ?)')
+            params.append(tag)
+        return (' AND '.join(clauses) or '1'), params
+
+    def find(self, tags=None, source=None, limit=None, **filters):
+        """Records matching column filters (subject=..., topic=...) and all ``tags``, in load order"""
+        where, params = self._where(filters, tags, source)
+        sql = f'SELECT q.record FROM questions q WHERE {where} ORDER BY q.rowid'
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        for (record,) in self.conn.execute(sql, params):
+            yield json.loads(record)
+
+    def count(self, tags=None, source=None, **filters):
+        where, params = self._where(filters, tags, source)
+        return self.conn.execute(f'SELECT COUNT(*) FROM questions q WHERE {where}', params).fetchone()[0]
+
+    def get(self, question_id, source=None):
+        """The record with this id, or None"""
+        sql = 'SELECT record FROM questions WHERE id = ?'
+        params = [question_id]
+        if source is not None:
+            sql += ' AND source = ?'
+            params.append(source)
+        row = self.conn.execute(sql + ' ORDER BY rowid LIMIT 1', params).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def search(self, text, limit=20, tags=None, source=None, **filters):
+        """Records whose question or solution text matches all words of ``text``, best first"""
+        match = fts_query(text)
+        if not match:
+            return
+        where, params = self._where(filters, tags, source)
+        sql = (f'SELECT q.record FROM questions_fts JOIN questions q ON q.rowid = questions_fts.rowid '
+               f'WHERE questions_fts MATCH ? AND {where} ORDER BY bm25(questions_fts) LIMIT ?')
+        for (record,) in self.conn.execute(sql, [match, *params, limit]):
+            yield json.loads(record)
+
+    def facets(self, column, tags=None, source=None, **filters):
+        """[(value, count)] of one column, most common first"""
+        if column not in FILTER_COLUMNS and column != 'source':
+            raise ValueError(f"Unknown facet: {column}")
+        where, params = self._where(filters, tags, source)
+        return self.conn.execute(f'SELECT q.{column}, COUNT(*) FROM questions q WHERE {where} '
+                                 f'GROUP BY q.{column} ORDER BY COUNT(*) DESC', params).fetchall()
+
+    def iter_questions(self, sources=None):
+        """(id, question text) of every record, source by source in the given order"""
+        if sources is None:
+            sources = [row[0] for row in self.conn.execute('SELECT source FROM sources ORDER BY rowid')]
+        for source in sources:
+            yield from self.conn.execute('SELECT id, question FROM questions WHERE source = ? ORDER BY rowid',
+                                         (source,))
+
+def main():
+    parser = argparse.ArgumentParser(description='Local SQLite question store')
+    parser.add_argument('--db', default=DEFAULT_DB, help='database file')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    load = commands.add_parser('load', help='load question JSON files (default: the known corpora)')
+    load.add_argument('paths', nargs='*')
+    load.add_argument('--force', action='store_true', help='reload files even if unchanged')
+
+    for name in ('find', 'search'):
+        command = commands.add_parser(name)
+        if name == 'search':
+            command.add_argument('text', help='words to match; a trailing * matches by prefix')
+        for column in FILTER_COLUMNS:
+            command.add_argument(f'--{column}')
+        command.add_argument('--tag', action='append', dest='tags')
+        command.add_argument('--source')
+        command.add_argument('--limit', type=int, default=20)
+
+    commands.add_parser('stats', help='counts by source, subject and difficulty')
+    args = parser.parse_args()
+
+    with QuestionStore(args.db) as store:
+        if args.command == 'load':
+            for path, count in store.load(args.paths or DEFAULT_SOURCES, args.force).items():
+                print(f"  • {path}: " + ("unchanged" if count is None else f"{count} questions loaded"))
+            print(f"✅ {store.count()} questions in {args.db}")
+            return
+
+        if args.command == 'stats':
+            for column in ('source', 'subject', 'difficulty'):
+                print(f"\n📊 Questions by {column}:")
+                for value, count in store.facets(column):
+                    print(f"  • {value}: {count}")
+            return
+
+        filters = {column: getattr(args, column) for column in FILTER_COLUMNS}
+        start = time.perf_counter()
+        if args.command == 'search':
+            records = list(store.search(args.text, args.limit, args.tags, args.source, **filters))
+        else:
+            records = list(store.find(args.tags, args.source, args.limit, **filters))
+        elapsed = (time.perf_counter() - start) * 1000
+
+        print(f"🔎 {len(records)} questions ({elapsed:.1f} ms)")
+        for record in records:
+            question = record.get('question') or record.get('question_text') or strip_html(record.get('question_html'))
+            print(f"  • {record.get('id')}: {' '.join(question.split())[:90]}")
+
+if __name__ == '__main__':
+    main()
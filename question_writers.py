@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Streaming writers and readers for extracted question corpora
+Questions are written one at a time as they are extracted, so the whole
+corpus never has to be held in memory:
+
+- .json        a JSON array, byte-identical to json.dump(..., indent=2)
+- .jsonl       JSON Lines, one question per line
+- .jsonl.gz    gzip-compressed JSON Lines
+- shards       one JSONL file per chapter plus a manifest.json listing
+               shard names, counts, sizes and hashes
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import re
+from pathlib import Path
+
+def file_sha256(path):
+    """SHA-256 of a file, read in chunks"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def open_text(path, mode='r', compress=False):
+    """Open a UTF-8 text file for 'r' or 'w', through gzip when ``compress``
+
+    Gzip output is written with mtime=0 so identical records always give
+    identical bytes (and hashes).
+    """
+    if not compress:
+        return open(path, mode, encoding='utf-8')
+    return io.TextIOWrapper(gzip.GzipFile(path, mode + 'b', compresslevel=9, mtime=0), encoding='utf-8')
+
+class JsonArrayWriter:
+    """Stream a JSON array formatted exactly like json.dump(indent=2)"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.f = open_text(self.path, 'w')
+        self.count = 0
+
+    def write(self, record):
+        body = json.dumps(record, indent=2, ensure_ascii=False).replace('\n', '\n  ')
+        self.f.write(('[\n  ' if self.count == 0 else ',\n  ') + body)
+        self.count += 1
+
+    def close(self):
+        self.f.write('\n]' if self.count else '[]')
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class JsonlWriter:
+    """Stream records as JSON Lines, gzipped when the path ends in .gz"""
+
+    def __init__(self, path, compress=None):
+        self.path = Path(path)
+        self.compress = self.path.suffix == '.gz' if compress is None else compress
+        self.f = open_text(self.path, 'w', self.compress)
+        self.count = 0
+
+    def write(self, record):
+        self.f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.count += 1
+
+    def close(self):
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def shard_slug(name):
+    """File-safe shard name"""
+    return re.sub(r'\W+', '_', name or '').strip('_').lower() or 'unknown'
+
+class ShardedJsonlWriter:
+    """Write one JSONL shard per value of ``key`` plus a manifest.json
+
+    Shards are opened lazily as new key values appear; the manifest is
+    written on close with each shard's file name, record count, size and
+    SHA-256 of the file as stored.
+    """
+
+    def __init__(self, output_dir, key='chapter', compress=False):
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.key = key
+        self.compress = compress
+        self.shards = {}
+        self.count = 0
+
+    def _shard(self, value):
+        shard = self.shards.get(value)
+        if shard is None:
+            slug = shard_slug(value)
+            taken = {s.path.name for s in self.shards.values()}
+            suffix = '.jsonl.gz' if self.compress else '.jsonl'
+            name, n = f'{slug}{suffix}', 1
+            while name in taken:
+                n += 1
+                name = f'{slug}_{n}{suffix}'
+            shard = self.shards[value] = JsonlWriter(self.output_dir / name, self.compress)
+        return shard
+
+    def write(self, record):
+        self._shard(record.get(self.key)).write(record)
+        self.count += 1
+
+    def close(self):
+        entries = []
+        for value, shard in sorted(self.shards.items(), key=lambda item: str(item[0])):
+            shard.close()
+            entries.append({
+                self.key: value,
+                'file': shard.path.name,
+                'count': shard.count,
+                'bytes': shard.path.stat().st_size,
+                'sha256': file_sha256(shard.path)
+            })
+
+        self.manifest_path = self.output_dir / 'manifest.json'
+        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+            json.dump({'key': self.key, 'total': self.count, 'shards': entries}, f, indent=2, ensure_ascii=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def open_question_writer(output_path, shard_dir=None, compress=False):
+    """Pick a writer: chapter shards, JSON Lines (.jsonl/.jsonl.gz) or a JSON array"""
+    if shard_dir:
+        return ShardedJsonlWriter(shard_dir, 'chapter', compress)
+    name = str(output_path)
+    if name.endswith('.jsonl') or name.endswith('.jsonl.gz'):
+        return JsonlWriter(output_path)
+    return JsonArrayWriter(output_path)
+
+def sidecar_path(output_path, kind, shard_dir=None):
+    """Path of a derived file (index, tables, ...) written next to an extractor's output
+
+    ``<output stem>.<kind>.json`` beside the output, or ``<kind>.json`` in
+    the shard directory.
+    """
+    if shard_dir:
+        return Path(shard_dir) / f'{kind}.json'
+    output_path = Path(output_path)
+    name = output_path.name
+    for suffix in ('.jsonl.gz', '.jsonl', '.json'):
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+            break
+    return output_path.with_name(f'{name}.{kind}.json')
+
+def iter_jsonl(path):
+    """Stream records from a .jsonl or .jsonl.gz file"""
+    with open_text(path, 'r', str(path).endswith('.gz')) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def iter_shards(manifest_path, values=None):
+    """Stream records from the shards in a manifest, optionally only some key values"""
+    manifest_path = Path(manifest_path)
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    for shard in manifest['shards']:
+        if values is None or shard[manifest['key']] in values:
+            yield from iter_jsonl(manifest_path.parent / shard['file'])
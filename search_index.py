@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Prebuilt inverted search index for question corpora
+Built next to the extracted data so search is an index lookup instead of a
+scan over every question's text.
+
+Format (one JSON file):
+- ids       question ids, in document order
+- blocks    the sorted term dictionary, front-coded in blocks of
+            BLOCK_SIZE: the first term in full, then [shared prefix
+            length, suffix] pairs
+- postings  per term, base64 of the varint-encoded gaps between the
+            sorted document numbers
+
+Terms are lower-cased words of the question text and metadata, plus
+field-qualified terms such as ``tag:kinematics`` or ``difficulty:hard``.
+
+    python3 search_index.py physics_questions_with_solutions.index.json "energy tag:work* -friction"
+"""
+
+import base64
+import json
+import re
+import sys
+from bisect import bisect_left, bisect_right
+from html import unescape
+from pathlib import Path
+
+from question_writers import sidecar_path
+
+BLOCK_SIZE = 16
+FORMAT_VERSION = 1
+
+TEXT_FIELDS = ('question', 'question_text')
+# record field -> query qualifier
+QUALIFIED_FIELDS = {
+    'tags': 'tag',
+    'topic': 'topic',
+    'subtopic': 'subtopic',
+    'chapter': 'chapter',
+    'difficulty': 'difficulty'
+}
+
+WORD = re.compile(r'\w+')
+TAG = re.compile(r'<[^>]+>')
+
+def tokenize(text):
+    """Lower-cased words of text, HTML tags and entities removed"""
+    if not text:
+        return []
+    return WORD.findall(unescape(TAG.sub(' ', text)).lower())
+
+def record_terms(record):
+    """Every index term of one question record"""
+    terms = set()
+    for field in TEXT_FIELDS:
+        terms.update(tokenize(record.get(field)))
+
+    for field, qualifier in QUALIFIED_FIELDS.items():
+        value = record.get(field)
+        values = value if isinstance(value, list) else [value]
+        for v in values:
+            if isinstance(v, str):
+                words = tokenize(v)
+                terms.update(words)
+                terms.update(f'{qualifier}:{word}' for word in words)
+
+    return terms
+
+def encode_postings(docs):
+    """Varint-encode the gaps of a sorted doc-number list, as base64 text"""
+    out = bytearray()
+    previous = -1
+    for doc in docs:
+        gap = doc - previous - 1
+        previous = doc
+        while gap >= 0x80:
+            out.append((gap & 0x7f) | 0x80)
+            gap >>= 7
+        out.append(gap)
+    return base64.b64encode(bytes(out)).decode('ascii')
+
+def decode_postings(encoded):
+    """Inverse of encode_postings"""
+    docs = []
+    previous = -1
+    gap = shift = 0
+    for byte in base64.b64decode(encoded):
+        gap |= (byte & 0x7f) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        previous += gap + 1
+        docs.append(previous)
+        gap = shift = 0
+    return docs
+
+def front_code(terms, block_size=BLOCK_SIZE):
+    """Split sorted terms into blocks of a full head term plus [shared, suffix] pairs"""
+    blocks = []
+    for start in range(0, len(terms), block_size):
+        block = [terms[start]]
+        previous = terms[start]
+        for term in terms[start + 1:start + block_size]:
+            shared = 0
+            limit = min(len(previous), len(term))
+            while shared < limit and previous[shared] == term[shared]:
+                shared += 1
+            block.append([shared, term[shared:]])
+            previous = term
+        blocks.append(block)
+    return blocks
+
+def decode_block(block):
+    terms = [block[0]]
+    for shared, suffix in block[1:]:
+        terms.append(terms[-1][:shared] + suffix)
+    return terms
+
+class SearchIndexBuilder:
+    """Accumulate question records, then write the index"""
+
+    def __init__(self):
+        self.ids = []
+        self.postings = {}
+
+    def add(self, record):
+        doc = len(self.ids)
+        self.ids.append(record.get('id'))
+        for term in record_terms(record):
+            self.postings.setdefault(term, []).append(doc)
+
+    def add_all(self, records):
+        for record in records:
+            self.add(record)
+        return self
+
+    def to_dict(self):
+        terms = sorted(self.postings)
+        return {
+            'version': FORMAT_VERSION,
+            'block_size': BLOCK_SIZE,
+            'ids': self.ids,
+            'blocks': front_code(terms),
+            'postings': [encode_postings(self.postings[term]) for term in terms]
+        }
+
+    def write(self, path):
+        """Write the index as compact JSON and return its size in bytes"""
+        data = json.dumps(self.to_dict(), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        Path(path).write_bytes(data)
+        return len(data)
+
+def index_path_for(output_path, shard_dir=None):
+    """Where an extractor writes the index for its output: next to it"""
+    return sidecar_path(output_path, 'index', shard_dir)
+
+def write_index(records, path):
+    """Build and write an index over records, printing a one-line summary"""
+    builder = SearchIndexBuilder().add_all(records)
+    size = builder.write(path)
+    print(f"🔎 Search index: {len(builder.postings)} terms over {len(builder.ids)} questions, "
+          f"{size / 1024:.2f} KB → {path}")
+    return builder
+
+class SearchIndex:
+    """Query API over a prebuilt index
+
+    Only the block head terms are decoded on load; a lookup binary-searches
+    the heads and decodes one block.
+    """
+
+    def __init__(self, data):
+        if data.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported search index version: {data.get('version')}")
+        self.ids = data['ids']
+        self.block_size = data['block_size']
+        self.blocks = data['blocks']
+        self.heads = [block[0] for block in self.blocks]
+        self.encoded = data['postings']
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _postings(self, term_number):
+        return decode_postings(self.encoded[term_number])
+
+    def lookup(self, term):
+        """Doc numbers containing an exact term"""
+        b = bisect_right(self.heads, term) - 1
+        if b < 0:
+            return []
+        for offset, candidate in enumerate(decode_block(self.blocks[b])):
+            if candidate == term:
+                return self._postings(b * self.block_size + offset)
+        return []
+
+    def prefix(self, prefix):
+        """Doc numbers containing any term starting with ``prefix``"""
+        docs = set()
+        b = max(bisect_left(self.heads, prefix) - 1, 0)
+        while b < len(self.blocks):
+            terms = decode_block(self.blocks[b])
+            if terms[0] > prefix and not terms[0].startswith(prefix):
+                break
+            for offset, term in enumerate(terms):
+                if term.startswith(prefix):
+                    docs.update(self._postings(b * self.block_size + offset))
+            b += 1
+        return sorted(docs)
+
+    def terms(self, prefix=''):
+        """Dictionary terms starting with ``prefix``, in order"""
+        b = max(bisect_left(self.heads, prefix) - 1, 0)
+        found = []
+        while b < len(self.blocks):
+            terms = decode_block(self.blocks[b])
+            if terms[0] > prefix and not terms[0].startswith(prefix):
+                break
+            found.extend(term for term in terms if term.startswith(prefix))
+            b += 1
+        return found
+
+    def _term_docs(self, word):
+        """Docs for one query word, tokenized like the indexed text
+
+        A word that tokenizes to several terms (``f(x)``, ``tag:work-energy``)
+        needs all of them; a trailing ``*`` applies to the last one.
+        """
+        is_prefix = word.endswith('*')
+        qualifier, _, value = word.rpartition(':')
+        if qualifier not in QUALIFIED_FIELDS.values():
+            qualifier, value = '', word
+
+        pieces = tokenize(value)
+        if not pieces:
+            # A bare ``tag:*`` matches every doc with that field
+            return set(self.prefix(f'{qualifier}:')) if is_prefix and qualifier else set()
+
+        docs = None
+        for i, piece in enumerate(pieces):
+            term = f'{qualifier}:{piece}' if qualifier else piece
+            found = set(self.prefix(term) if is_prefix and i == len(pieces) - 1 else self.lookup(term))
+            docs = found if docs is None else docs & found
+        return docs
+
+    def search_docs(self, query):
+        """Doc numbers matching a boolean query
+
+        Words are ANDed, ``OR`` separates alternatives, a leading ``-``
+        negates a word, a trailing ``*`` matches by prefix, and
+        ``tag:``/``topic:``/``subtopic:``/``chapter:``/``difficulty:``
+        restrict a word to that field.
+        """
+        matched = set()
+        for group in re.split(r'\s+OR\s+', query.strip()):
+            include = []
+            exclude = set()
+            for word in group.lower().split():
+                negate = word.startswith('-')
+                docs = self._term_docs(word.lstrip('-'))
+                if negate:
+                    exclude |= docs
+                else:
+                    include.append(docs)
+
+            if include:
+                include.sort(key=len)
+                docs = include[0].intersection(*include[1:])
+            elif exclude:
+                docs = set(range(len(self.ids)))
+            else:
+                continue
+            matched |= docs - exclude
+        return sorted(matched)
+
+    def search(self, query):
+        """Question ids matching a boolean query, in document order"""
+        return [self.ids[doc] for doc in self.search_docs(query)]
+
+def main():
+    if len(sys.argv) < 3:
+        print(f"Usage: {sys.argv[0]} INDEX.json QUERY")
+        return
+
+    index = SearchIndex.load(sys.argv[1])
+    results = index.search(' '.join(sys.argv[2:]))
+    print(f"🔎 {len(results)} of {len(index)} questions match")
+    for question_id in results[:50]:
+        print(f"  • {question_id}")
+    if len(results) > 50:
+        print(f"  ... and {len(results) - 50} more")
+
+if __name__ == '__main__':
+    main()
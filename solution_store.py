@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Solution store and bulk injector for the excluded/problematic question pages
+Answers and solution HTML live in solutions.jsonl, one record per line,
+grouped by page and indexed by question id through analysis_index's
+offset sidecar, instead of as dict literals inside each add_*/fix_*
+script. One inject pass parses a page once, rewrites only the cards whose
+solution changed (via SpliceWriter) and records what it applied in
+<page stem>.applied.json, so a run with nothing new to apply never parses
+the HTML at all.
+
+    python3 solution_store.py import add_solutions_21_30.py --page excluded_mathematics_questions.html
+    python3 solution_store.py import fix_mathematics_solutions.py --page excluded_mathematics_questions.html --mode replace
+    python3 solution_store.py inject excluded_mathematics_questions.html
+    python3 solution_store.py show Algebra_130
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+from pathlib import Path
+
+from analysis_index import AnalysisIndex, offsets_path_for, write_jsonl
+
+FORMAT_VERSION = 2
+DEFAULT_STORE = 'solutions.jsonl'
+KEY = 'id'
+MODES = ('add', 'replace')
+
+ANSWER_STYLE = 'background: #d4edda; padding: 20px; margin: 20px 0; border-radius: 10px; border-left: 5px solid #28a745;'
+ANSWER_TEXT_STYLE = 'color: #155724; font-size: 1.2em;'
+SOLUTION_STYLE = 'background: #fff3cd; padding: 25px; margin: 20px 0; border-radius: 10px; border-left: 5px solid #ffc107;'
+SOLUTION_TITLE_STYLE = 'color: #856404; font-size: 1.2em; font-weight: bold; margin-bottom: 15px;'
+ANSWER_MARKER = 'd4edda'
+SOLUTION_MARKER = 'fff3cd'
+
+def solution_digest(record):
+    """Short hash of what a record puts on the page"""
+    content = f"{record['answer']}\0{record['solution']}".encode('utf-8')
+    return hashlib.sha256(content).hexdigest()[:16]
+
+def card_identity(card):
+    """(question number, question id) of a question-card, either possibly None
+
+    Handles both the excluded pages (question-number/question-id divs) and
+    problematic_physics_questions.html (ID meta-tag and 'Question N:' heading).
+    """
+    number = None
+    number_div = card.find('div', class_='question-number')
+    if number_div and '#' in number_div.get_text():
+        number = int(number_div.get_text().split('#')[1])
+    else:
+        heading = card.find('h4')
+        text = heading.get_text().strip().rstrip(':') if heading else ''
+        if text.startswith('Question ') and text[9:].strip().isdigit():
+            number = int(text[9:])
+
+    question_id = None
+    for tag in card.find_all(['div', 'span'], class_=['question-id', 'meta-tag']):
+        text = tag.get_text().strip()
+        if text.startswith('ID:'):
+            question_id = text[3:].strip()
+            break
+    return number, question_id
+
+def extract_solutions(script):
+    """{question number: {'answer', 'solution'}} from a script's module-level dict literals
+
+    Read with ast, so the script (and its dependencies) is never imported.
+    """
+    with open(script, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=str(script))
+    solutions = {}
+    for node in tree.body:
+        if not isinstance(node, ast.Assign) or not isinstance(node.value, ast.Dict):
+            continue
+        try:
+            value = ast.literal_eval(node.value)
+        except ValueError:
+            continue
+        if value and all(isinstance(k, int) and isinstance(v, dict) and {'answer', 'solution'} <= v.keys()
+                         for k, v in value.items()):
+            solutions.update(value)
+    return solutions
+
+def page_identities(html_file):
+    """{question number: question id} of every card on a page"""
+    from bs4 import BeautifulSoup
+
+    with open(html_file, 'r', encoding='utf-8') as f:
+        soup = BeautifulSoup(f.read(), 'html.parser')
+    identities = {}
+    for card in soup.find_all('div', class_='question-card'):
+        number, question_id = card_identity(card)
+        if number is not None and question_id:
+            identities.setdefault(number, question_id)
+    return identities
+
+class SolutionStore:
+    """Solution records grouped by page, later records superseding earlier ones"""
+
+    def __init__(self, path=DEFAULT_STORE):
+        self.path = Path(path)
+        self.index = AnalysisIndex(self.path) if offsets_path_for(self.path).exists() else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self.index:
+            self.index.close()
+            self.index = None
+
+    def pages(self):
+        return [group[0] for group, _, _ in self.index.groups] if self.index else []
+
+    def records(self, page):
+        """Every record of a page in import order"""
+        return list(self.index.iter_group(Path(page).name)) if self.index else []
+
+    def solutions(self, page, source=None):
+        """{question id: record} of a page, optionally only from one source script"""
+        effective = {}
+        for record in self.records(page):
+            if source is None or record['source'] == source:
+                effective[record[KEY]] = record
+        return effective
+
+    def get(self, question_id):
+        """[(page, record)] of every record of a question"""
+        if not self.index:
+            return []
+        return [(group[0], record) for group, record in self.index.get_all(question_id)]
+
+    def save(self, records_by_page):
+        """Rewrite the store with ``{page: [records]}``"""
+        # Unmap before truncating the file underneath it
+        self.close()
+        groups = [((page,), records) for page, records in records_by_page.items()]
+        write_jsonl(groups, self.path, KEY)
+        self.index = AnalysisIndex(self.path)
+
+def import_solutions(script, page, mode='add', store_path=DEFAULT_STORE):
+    """Add a script's solutions to the store under the page's question ids
+
+    Re-importing a script replaces its earlier records. Returns
+    (imported count, question numbers not found on the page).
+    """
+    solutions = extract_solutions(script)
+    identities = page_identities(page)
+    source = Path(script).stem
+    page_name = Path(page).name
+
+    imported = []
+    missing = []
+    for number, solution in sorted(solutions.items()):
+        if number not in identities:
+            missing.append(number)
+            continue
+        imported.append({
+            KEY: identities[number],
+            'page': page_name,
+            'number': number,
+            'source': source,
+            'mode': mode,
+            'answer': solution['answer'],
+            'solution': solution['solution']
+        })
+
+    with SolutionStore(store_path) as store:
+        records_by_page = {name: store.records(name) for name in store.pages()}
+        kept = [r for r in records_by_page.get(page_name, []) if r['source'] != source]
+        records_by_page[page_name] = kept + imported
+        store.save(records_by_page)
+    return len(imported), missing
+
+def applied_path_for(html_file):
+    return Path(html_file).with_suffix('.applied.json')
+
+def load_applied(html_file, sha256):
+    """{question id: digest of the solution on its card} if the page is unchanged since
+
+    None marks a card whose solution didn't come from the store.
+    """
+    try:
+        with open(applied_path_for(html_file), 'r', encoding='utf-8') as f:
+            applied = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if applied.get('version') != FORMAT_VERSION or applied.get('sha256') != sha256:
+        return {}
+    return applied['applied']
+
+def save_applied(html_file, sha256, applied):
+    data = {'version': FORMAT_VERSION, 'html': Path(html_file).name, 'sha256': sha256, 'applied': applied}
+    with open(applied_path_for(html_file), 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+def is_settled(record, applied):
+    """True if injecting ``record`` would leave its card as it is
+
+    An 'add' record is settled once its card has any solution; a
+    'replace' record only once its own content is on the card.
+    """
+    if record['mode'] == 'add':
+        return record[KEY] in applied
+    return applied.get(record[KEY]) == solution_digest(record)
+
+def solution_sections(soup, record):
+    """The green answer div and yellow solution div of a record"""
+    from bs4 import BeautifulSoup
+
+    answer_div = soup.new_tag('div')
+    answer_div['style'] = ANSWER_STYLE
+    answer_strong = soup.new_tag('strong')
+    answer_strong.string = f"✅ Correct Answer: {record['answer']}"
+    answer_strong['style'] = ANSWER_TEXT_STYLE
+    answer_div.append(answer_strong)
+
+    solution_div = soup.new_tag('div')
+    solution_div['style'] = SOLUTION_STYLE
+    title_div = soup.new_tag('div')
+    title_div['style'] = SOLUTION_TITLE_STYLE
+    title_div.string = '📖 Detailed Solution:'
+    solution_div.append(title_div)
+    for element in list(BeautifulSoup(record['solution'], 'html.parser')):
+        solution_div.append(element)
+    return answer_div, solution_div
+
+def inject_solutions(html_file, store_path=DEFAULT_STORE, source=None, write=True):
+    """Apply the store's solutions for a page in one parse and one write
+
+    'add' records skip cards that already have a solution; 'replace'
+    records swap out the card's old answer and solution. Cards the applied
+    set shows are already settled (see is_settled) are left alone.
+    Returns {'applied', 'skipped', 'unchanged', 'missing', 'written'}.
+    """
+    html_file = Path(html_file)
+    source_bytes = html_file.read_bytes()
+    sha256 = hashlib.sha256(source_bytes).hexdigest()
+
+    with SolutionStore(store_path) as store:
+        solutions = store.solutions(html_file.name, source)
+
+    applied = load_applied(html_file, sha256)
+    pending = {qid: record for qid, record in solutions.items() if not is_settled(record, applied)}
+    result = {'applied': [], 'skipped': [], 'unchanged': len(solutions) - len(pending), 'missing': [], 'written': False}
+    if not pending:
+        return result
+
+    # Only pages with work to do pay for the HTML parse
+    from html_splice import SpliceWriter
+
+    doc = SpliceWriter(source_bytes.decode('utf-8'), html_file)
+    soup = doc.soup
+    found = set()
+    for card in soup.find_all('div', class_='question-card'):
+        number, question_id = card_identity(card)
+        record = pending.get(question_id)
+        if record is None or question_id in found:
+            continue
+        found.add(question_id)
+
+        old_solution = card.find('div', style=lambda x: x and SOLUTION_MARKER in x)
+        if old_solution and record['mode'] == 'add':
+            # The card keeps its existing solution, whose digest is known only if the store wrote it
+            result['skipped'].append(record)
+            applied.setdefault(question_id, None)
+            continue
+
+        # Only this card's source span is rewritten
+        doc.mark(card)
+        if old_solution:
+            old_solution.decompose()
+        old_answer = card.find('div', style=lambda x: x and ANSWER_MARKER in x)
+        if old_answer:
+            old_answer.decompose()
+        warning_box = card.find('div', class_='warning-box')
+        if warning_box:
+            warning_box.decompose()
+
+        for section in solution_sections(soup, record):
+            card.append(section)
+        result['applied'].append(record)
+        applied[question_id] = solution_digest(record)
+
+    result['missing'] = [record for qid, record in pending.items() if qid not in found]
+    if not write:
+        return result
+
+    if result['applied']:
+        doc.write()
+        result['written'] = True
+        sha256 = hashlib.sha256(html_file.read_bytes()).hexdigest()
+    save_applied(html_file, sha256, applied)
+    return result
+
+def print_injection(html_file, result):
+    for record in result['skipped']:
+        print(f"⚠️  Question {record['number']} ({record['id']}) already has a solution, skipping...")
+    for record in result['applied']:
+        print(f"✅ Added solution for Question {record['number']} ({record['id']}) from {record['source']}")
+    for record in result['missing']:
+        print(f"❌ {record['id']} (Question {record['number']}) not found in {html_file}")
+    print(f"📄 {html_file}: {len(result['applied'])} applied, {len(result['skipped'])} skipped, "
+          f"{result['unchanged']} already applied")
+
+def main():
+    parser = argparse.ArgumentParser(description='Solution store and bulk injector for the question pages')
+    parser.add_argument('--store', default=DEFAULT_STORE, help='solution store (JSON Lines)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    import_ = commands.add_parser('import', help="add a script's solution dicts to the store")
+    import_.add_argument('scripts', nargs='+')
+    import_.add_argument('--page', required=True, help='HTML page the solutions belong to')
+    import_.add_argument('--mode', choices=MODES, default='add',
+                         help='add: skip cards that already have a solution; replace: overwrite it')
+
+    inject = commands.add_parser('inject', help="apply the store's solutions to pages in place")
+    inject.add_argument('pages', nargs='*', help='HTML pages (default: every page in the store)')
+    inject.add_argument('--source', help='only the solutions imported from this script')
+    inject.add_argument('--dry-run', action='store_true', help='report what would change without writing')
+
+    show = commands.add_parser('show', help='print the stored solutions of a question')
+    show.add_argument('question_id')
+    args = parser.parse_args()
+
+    if args.command == 'import':
+        for script in args.scripts:
+            count, missing = import_solutions(script, args.page, args.mode, args.store)
+            print(f"✅ {count} solutions from {script} → {args.store}")
+            if missing:
+                print(f"⚠️  Not on {args.page}: questions {', '.join(map(str, missing))}")
+        return
+
+    if args.command == 'inject':
+        pages = args.pages
+        if not pages:
+            with SolutionStore(args.store) as store:
+                pages = store.pages()
+        for page in pages:
+            result = inject_solutions(page, args.store, args.source, write=not args.dry_run)
+            print_injection(page, result)
+        if args.dry_run:
+            print("\n🔍 Dry run - nothing written")
+        return
+
+    with SolutionStore(args.store) as store:
+        found = store.get(args.question_id)
+    if not found:
+        print(f"❌ {args.question_id} not in {args.store}")
+        return
+    for page, record in found:
+        print(f"\n📄 {page} • Question {record['number']} • {record['source']} ({record['mode']})")
+        print(f"✅ Correct Answer: {record['answer']}")
+        print(record['solution'])
+
+if __name__ == '__main__':
+    main()
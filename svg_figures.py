@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Lift inline SVG figures out of question HTML into content-addressed files
+Each inline <svg> becomes figures/<sha256[:16]>.svg and is replaced by a
+lazy-loading <img>, so figures are cached on their own, shared between
+questions that use the same diagram, and only fetched when shown.
+
+An SVG stays inline when it is not a well-formed standalone XML document
+or refers to ids (url(#..), href="#..") defined outside itself.
+
+    python3 svg_figures.py physics_questions_with_solutions.json out.json --figures-dir public/data/figures
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import xml.etree.ElementTree as ET
+from html import escape, unescape
+from pathlib import Path
+
+FIGURE_FIELDS = ('question_html', 'solution_html')
+SVG_NAMESPACE = 'http://www.w3.org/2000/svg'
+
+SVG_TAG = re.compile(r'<(/?)svg\b[^>]*>', re.IGNORECASE)
+ENTITY = re.compile(r'&(#\d+|#[xX][0-9a-fA-F]+|[A-Za-z][A-Za-z0-9]*);|&')
+XML_ENTITIES = {'lt', 'gt', 'amp', 'quot', 'apos'}
+ID_ATTR = re.compile(r'\bid\s*=\s*["\']([^"\']+)["\']')
+ID_REF = re.compile(r'url\(\s*#([^)\s]+)\s*\)|href\s*=\s*["\']#([^"\']+)["\']')
+ROOT_ATTR = re.compile(r'\s([\w:-]+)\s*=\s*("[^"]*"|\'[^\']*\')')
+
+def find_svg_spans(html):
+    """(start, end) of every outermost <svg>...</svg> element"""
+    spans = []
+    depth = 0
+    start = None
+    for match in SVG_TAG.finditer(html):
+        closing = match.group(1) == '/'
+        if not closing:
+            if match.group(0).endswith('/>'):
+                if depth == 0:
+                    spans.append((match.start(), match.end()))
+                continue
+            if depth == 0:
+                start = match.start()
+            depth += 1
+        elif depth:
+            depth -= 1
+            if depth == 0:
+                spans.append((start, match.end()))
+    return spans
+
+def _xml_entity(match):
+    name = match.group(1)
+    if name is None:
+        return '&amp;'
+    if name.startswith('#') or name in XML_ENTITIES:
+        return match.group(0)
+    # HTML-only named entity: XML needs the character itself
+    text = unescape(match.group(0))
+    return escape(text, quote=False) if text != match.group(0) else '&amp;' + match.group(0)[1:]
+
+def standalone_svg(markup):
+    """The SVG as a standalone document, or None if it can't stand alone"""
+    ids = set(ID_ATTR.findall(markup))
+    refs = {a or b for a, b in ID_REF.findall(markup)}
+    if refs - ids:
+        return None
+
+    document = ENTITY.sub(_xml_entity, markup.strip())
+    root_end = document.index('>')
+    if 'xmlns=' not in document[:root_end]:
+        document = f'<svg xmlns="{SVG_NAMESPACE}"' + document[4:]
+
+    try:
+        ET.fromstring(document)
+    except ET.ParseError:
+        return None
+    return document + '\n'
+
+def default_figure_url(figures_dir):
+    """URL prefix for a figures directory, served from public/ when it lives there"""
+    parts = Path(figures_dir).parts
+    if parts and parts[0] == 'public':
+        return '/' + '/'.join(parts[1:]) + '/'
+    return Path(figures_dir).as_posix() + '/'
+
+class FigureStore:
+    """Write lifted SVGs to ``figures_dir`` once per distinct content"""
+
+    def __init__(self, figures_dir, url_prefix=None):
+        self.figures_dir = Path(figures_dir)
+        self.figures_dir.mkdir(parents=True, exist_ok=True)
+        self.url_prefix = url_prefix if url_prefix is not None else default_figure_url(figures_dir)
+        self.files = {}
+        self.lifted = 0
+        self.kept_inline = 0
+        self.inline_bytes = 0
+
+    def _store(self, document):
+        data = document.encode('utf-8')
+        name = hashlib.sha256(data).hexdigest()[:16] + '.svg'
+        if name not in self.files:
+            path = self.figures_dir / name
+            if not path.exists():
+                path.write_bytes(data)
+            self.files[name] = len(data)
+        return name
+
+    def _reference(self, markup, name):
+        """Lazy <img> carrying the SVG's size, class and style so layout doesn't shift"""
+        root = markup[:markup.index('>')]
+        attrs = {key.lower(): value for key, value in ROOT_ATTR.findall(root)}
+        extra = ''.join(f' {key}={attrs[key]}' for key in ('width', 'height', 'class', 'style') if key in attrs)
+        return f'<img src="{self.url_prefix}{name}" alt="Figure" loading="lazy" decoding="async"{extra}>'
+
+    def lift_html(self, html):
+        """Replace every liftable inline SVG in ``html`` with a file reference"""
+        if not html or '<svg' not in html.lower():
+            return html
+
+        out = []
+        last = 0
+        for start, end in find_svg_spans(html):
+            markup = html[start:end]
+            document = standalone_svg(markup)
+            if document is None:
+                self.kept_inline += 1
+                continue
+            out.append(html[last:start])
+            out.append(self._reference(markup, self._store(document)))
+            last = end
+            self.lifted += 1
+            self.inline_bytes += len(markup.encode('utf-8'))
+        out.append(html[last:])
+        return ''.join(out)
+
+    def lift_record(self, record, fields=FIGURE_FIELDS):
+        """Copy of ``record`` with the SVGs of its HTML fields lifted"""
+        if not any(isinstance(record.get(field), str) and '<svg' in record[field].lower() for field in fields):
+            return record
+        record = dict(record)
+        for field in fields:
+            if isinstance(record.get(field), str):
+                record[field] = self.lift_html(record[field])
+        return record
+
+    def summary(self):
+        stored = sum(self.files.values())
+        return (f"🖼️  Lifted {self.lifted} inline SVGs into {len(self.files)} figure files "
+                f"({self.inline_bytes / 1024:.2f} KB inline → {stored / 1024:.2f} KB on disk), "
+                f"{self.kept_inline} kept inline → {self.figures_dir}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Lift inline SVGs out of a questions JSON file')
+    parser.add_argument('input', help='questions JSON: a list, or {topic: [questions]}')
+    parser.add_argument('output', help='where to write the JSON with figure references')
+    parser.add_argument('--figures-dir', default='public/data/figures', help='where to write the .svg files')
+    parser.add_argument('--figures-url', help='URL prefix of the figures (default: derived from --figures-dir)')
+    args = parser.parse_args()
+
+    with open(args.input, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    store = FigureStore(args.figures_dir, args.figures_url)
+    if isinstance(data, dict):
+        data = {topic: [store.lift_record(q) for q in questions] for topic, questions in data.items()}
+    else:
+        data = [store.lift_record(q) for q in data]
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+    print(store.summary())
+    print(f"💾 Saved to: {args.output}")
+
+if __name__ == '__main__':
+    main()